@@ -7,22 +7,65 @@ Provides REST API endpoints for:
 - RAG knowledge base queries
 - Campaign performance metrics
 """
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from enum import Enum
 from loguru import logger
+from sqlalchemy import select, func, distinct, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 import uvicorn
+import asyncio
+import orjson
+import sys
+import os
+import time
 
 from config import settings
+from modules.batching import AsyncMicroBatcher
+from modules.cache import RedisResponseCache
 from modules.health_check import HealthChecker
 from modules.etl_jobs import ETLManager
 from modules.rag_system import RAGKnowledgeBase
-from modules.logging_utils import generate_correlation_id, set_correlation_id
-from modules.n8n_integration import N8nIntegrationManager, create_n8n_manager_from_settings
-from database.models import Contact, Campaign, AttributionResult
-from sqlalchemy.orm import Session
+from modules.logging_utils import generate_correlation_id, get_correlation_id, set_correlation_id
+from modules.n8n_integration import N8nIntegrationManager, N8nWebhookPayload, create_n8n_manager_from_settings
+from models.attribution import LifecycleStage
+from database.models import (
+    Contact, Campaign, AttributionResult, AttributionModelEnum, CampaignPerformance,
+    CAMPAIGN_PERFORMANCE_REFRESH_LOCK_ID, CAMPAIGN_PERFORMANCE_STALE_SQL, REFRESH_CAMPAIGN_PERFORMANCE_SQL
+)
+from database.partitions import PARTITION_MAINTENANCE_LOCK_ID, maintain_partitions
+from database.session import AsyncSessionLocal, engine, try_advisory_xact_lock
+
+
+class CorrelationIdMiddleware:
+    """Assigns a correlation ID to each request and returns it in X-Correlation-Id"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        correlation_id = generate_correlation_id()
+        set_correlation_id(correlation_id)
+
+        async def send_with_correlation_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Correlation-Id", correlation_id)
+            await send(message)
+
+        await self.app(scope, receive, send_with_correlation_id)
 
 
 # ============================================================================
@@ -34,49 +77,50 @@ app = FastAPI(
     description="REST API for attribution reporting, health checks, and analytics",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
+app.add_middleware(CorrelationIdMiddleware)
+
+# CORS middleware (explicit origin allowlist from CORS_ORIGINS)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=[origin.strip() for origin in settings.cors_origins.split(",") if origin.strip()],
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
+    expose_headers=["X-Correlation-Id"],
 )
 
+# Compress larger JSON responses such as /campaigns?limit=500
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Initialize components
 health_checker = HealthChecker()
 etl_manager = ETLManager()
 
-# Initialize RAG if configured
-rag_kb = None
-if settings.supabase_url and settings.supabase_key:
-    try:
-        rag_kb = RAGKnowledgeBase(
-            supabase_url=settings.supabase_url,
-            supabase_key=settings.supabase_key,
-            openai_api_key=settings.openai_api_key
-        )
-    except Exception as e:
-        logger.warning(f"RAG system not available: {e}")
+# Redis cache for minute-scale aggregate responses (disabled when REDIS_URL is unset)
+response_cache = RedisResponseCache(settings.redis_url, default_ttl=settings.response_cache_ttl_seconds)
 
-# Initialize n8n integration if configured
-n8n_manager = None
-if settings.n8n_base_url:
-    try:
-        n8n_manager = create_n8n_manager_from_settings(settings)
-        logger.info("n8n integration enabled")
-    except Exception as e:
-        logger.warning(f"n8n integration not available: {e}")
+# Health checks probe external APIs, so results are reused for a few seconds
+HEALTH_CACHE_TTL_SECONDS = 5.0
+_cached_health: Optional[Tuple[float, Dict[str, Any], Dict[str, Dict[str, Any]]]] = None
+
+# Lifecycle stage values accepted by /n8n/ad-sync
+LIFECYCLE_STAGES_BY_VALUE = {stage.value: stage for stage in LifecycleStage}
 
 
 # ============================================================================
 # Request/Response Models
 # ============================================================================
 
-class HealthResponse(BaseModel):
+class ResponseModel(BaseModel):
+    """Base for response models built from trusted server-side data"""
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True, validate_assignment=False)
+
+
+class HealthResponse(ResponseModel):
     """Health check response"""
     status: str
     timestamp: str
@@ -84,7 +128,7 @@ class HealthResponse(BaseModel):
     summary: Dict[str, int]
 
 
-class AttributionSummary(BaseModel):
+class AttributionSummary(ResponseModel):
     """Attribution summary response"""
     contact_id: str
     total_value: float
@@ -95,8 +139,20 @@ class AttributionSummary(BaseModel):
     top_campaign: Optional[str] = None
     calculated_at: datetime
 
+    @field_validator('contact_id', mode='before')
+    @classmethod
+    def stringify_contact_id(cls, v: Any) -> Any:
+        """Accept the numeric contact ID stored in the database"""
+        return str(v) if isinstance(v, int) else v
+
+    @field_validator('model_type', mode='before')
+    @classmethod
+    def unwrap_model_type(cls, v: Any) -> Any:
+        """Accept the ORM AttributionModelEnum as its string value"""
+        return v.value if isinstance(v, Enum) else v
 
-class CampaignMetrics(BaseModel):
+
+class CampaignMetrics(ResponseModel):
     """Campaign performance metrics"""
     utm_campaign: str
     utm_source: Optional[str] = None
@@ -113,7 +169,7 @@ class RAGQueryRequest(BaseModel):
     k: int = Field(4, ge=1, le=10)
 
 
-class RAGQueryResponse(BaseModel):
+class RAGQueryResponse(ResponseModel):
     """RAG query response"""
     answer: str
     sources: List[Dict[str, str]]
@@ -126,11 +182,11 @@ class N8nAgentQueryRequest(BaseModel):
     context: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional context")
 
 
-class N8nAgentQueryResponse(BaseModel):
+class N8nAgentQueryResponse(ResponseModel):
     """n8n agent query response"""
     response: str
     correlation_id: str
-    timestamp: str
+    timestamp: datetime
 
 
 class N8nAttributionRequest(BaseModel):
@@ -140,7 +196,7 @@ class N8nAttributionRequest(BaseModel):
     model_type: str = Field(default="w_shaped", description="Attribution model")
 
 
-class N8nAttributionResponse(BaseModel):
+class N8nAttributionResponse(ResponseModel):
     """n8n attribution calculation response"""
     contact_id: str
     total_value: float
@@ -157,7 +213,7 @@ class N8nAdSyncRequest(BaseModel):
     conversion_value: float
 
 
-class N8nAdSyncResponse(BaseModel):
+class N8nAdSyncResponse(ResponseModel):
     """n8n ad platform sync response"""
     contact_id: str
     synced_platforms: List[str]
@@ -171,32 +227,183 @@ class N8nWorkflowTriggerRequest(BaseModel):
     wait_for_completion: bool = Field(False, description="Wait for workflow to complete")
 
 
-class N8nWebhookPayload(BaseModel):
-    """Generic webhook payload from n8n"""
-    workflow_id: str
-    execution_id: str
-    event_type: str
-    data: Dict[str, Any] = Field(default_factory=dict)
+# ============================================================================
+# Dependency Injection
+# ============================================================================
+
+async def get_db_session() -> AsyncIterator[AsyncSession]:
+    """Get async database session"""
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def get_cached_health() -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """
+    Run all health checks at most once per HEALTH_CACHE_TTL_SECONDS
+
+    Returns:
+        Tuple of the full health status and its components keyed by name
+    """
+    global _cached_health
+
+    now = time.monotonic()
+    if _cached_health and now - _cached_health[0] < HEALTH_CACHE_TTL_SECONDS:
+        return _cached_health[1], _cached_health[2]
+
+    health_status = health_checker.check_all(settings)
+    components_by_name = {c["name"]: c for c in health_status["components"]}
+    _cached_health = (now, health_status, components_by_name)
+    return health_status, components_by_name
+
+
+@lru_cache(maxsize=1)
+def get_rag_kb() -> Optional[RAGKnowledgeBase]:
+    """Get the RAG knowledge base, created on first use if configured"""
+    if not (settings.supabase_url and settings.supabase_key):
+        return None
+    try:
+        return RAGKnowledgeBase(
+            supabase_url=settings.supabase_url,
+            supabase_key=settings.supabase_key,
+            openai_api_key=settings.openai_api_key
+        )
+    except Exception as e:
+        logger.warning(f"RAG system not available: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_n8n_manager() -> Optional[N8nIntegrationManager]:
+    """Get the n8n integration manager, created on first use if configured"""
+    if not settings.n8n_base_url:
+        return None
+    try:
+        n8n_manager = create_n8n_manager_from_settings(settings)
+        logger.info("n8n integration enabled")
+        return n8n_manager
+    except Exception as e:
+        logger.warning(f"n8n integration not available: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_crm_manager():
+    """Get the shared CRM attribution manager used by the n8n attribution endpoint"""
+    from modules.crm_attribution import CRMAttributionManager
+
+    return CRMAttributionManager()
+
+
+@lru_cache(maxsize=1)
+def get_ad_signaling_manager():
+    """Get the shared ad platform signaling manager used by the n8n ad-sync endpoint"""
+    from modules.ad_platform_signaling import AdPlatformSignalingManager
+
+    return AdPlatformSignalingManager()
+
+
+@lru_cache(maxsize=1)
+def get_llm():
+    """Get the shared ChatOpenAI client used by the agent endpoint"""
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(
+        model="gpt-4",
+        temperature=0,
+        api_key=settings.openai_api_key,
+        max_retries=2,
+        timeout=30
+    )
 
 
 # ============================================================================
-# Dependency Injection
+# Request Batching
 # ============================================================================
 
-def get_db_session() -> Session:
-    """Get database session"""
-    session = etl_manager.get_session()
+async def calculate_attribution_batch(batch: List[N8nAttributionRequest]) -> List[Any]:
+    """Calculate attribution for queued n8n requests with one HubSpot batch read"""
+    return await asyncio.to_thread(
+        get_crm_manager().calculate_attribution_batch,
+        [r.model_dump() for r in batch]
+    )
+
+
+# n8n workflows call /n8n/attribution once per contact in quick succession
+attribution_batcher = AsyncMicroBatcher(
+    calculate_attribution_batch,
+    max_batch_size=32,
+    max_wait_seconds=0.02,
+    name="n8n attribution batcher"
+)
+
+
+# ============================================================================
+# Background Refresh
+# ============================================================================
+
+_campaign_refresh_task: Optional[asyncio.Task] = None
+
+
+async def refresh_campaign_performance_periodically():
+    """
+    Refresh campaign_performance_mv every CAMPAIGN_MV_REFRESH_MINUTES
+
+    Every worker runs this loop, but a worker only refreshes while holding the
+    refresh advisory lock and when no other worker refreshed within the last
+    half interval, so the view is refreshed about once per interval in total.
+    """
+    interval_seconds = settings.campaign_mv_refresh_minutes * 60
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with AsyncSessionLocal() as session:
+                if not await try_advisory_xact_lock(session, CAMPAIGN_PERFORMANCE_REFRESH_LOCK_ID):
+                    logger.debug("campaign_performance_mv refresh running in another worker, skipping")
+                    continue
+                stale = await session.scalar(
+                    text(CAMPAIGN_PERFORMANCE_STALE_SQL), {"max_age_seconds": interval_seconds / 2}
+                )
+                if not stale:
+                    logger.debug("campaign_performance_mv refreshed recently by another worker, skipping")
+                    continue
+                await session.execute(text(REFRESH_CAMPAIGN_PERFORMANCE_SQL))
+                await session.commit()
+            await response_cache.invalidate("campaigns:*")
+            logger.info("Refreshed campaign_performance_mv")
+        except Exception as e:
+            logger.warning(f"campaign_performance_mv refresh failed: {e}")
+
+
+@app.on_event("startup")
+async def start_batchers():
+    """Start background batching and refresh tasks"""
+    global _campaign_refresh_task
+
     try:
-        yield session
-    finally:
-        session.close()
+        async with engine.begin() as conn:
+            # Workers boot together; the first to take the lock does the maintenance
+            if await try_advisory_xact_lock(conn, PARTITION_MAINTENANCE_LOCK_ID):
+                await conn.run_sync(maintain_partitions, retention_months=settings.partition_retention_months)
+            else:
+                logger.info("Partition maintenance running in another worker, skipping")
+    except Exception as e:
+        logger.warning(f"Partition maintenance failed: {e}")
 
+    attribution_batcher.start()
+    if settings.campaign_mv_refresh_minutes:
+        _campaign_refresh_task = asyncio.create_task(refresh_campaign_performance_periodically())
 
-def add_correlation_id():
-    """Add correlation ID to request context"""
-    correlation_id = generate_correlation_id()
-    set_correlation_id(correlation_id)
-    return correlation_id
+
+@app.on_event("shutdown")
+async def shutdown_background_resources():
+    """Stop background tasks and close the response cache and ad platform HTTP session"""
+    if _campaign_refresh_task is not None:
+        _campaign_refresh_task.cancel()
+    await attribution_batcher.stop()
+    await response_cache.close()
+
+    if get_ad_signaling_manager.cache_info().currsize:
+        await get_ad_signaling_manager().aclose()
 
 
 # ============================================================================
@@ -215,7 +422,7 @@ async def root():
 
 
 @app.get("/health", response_model=HealthResponse, tags=["Status"])
-async def health_check(correlation_id: str = Depends(add_correlation_id)):
+async def health_check():
     """
     Comprehensive health check of all system components
 
@@ -227,7 +434,7 @@ async def health_check(correlation_id: str = Depends(add_correlation_id)):
     - Database connection
     """
     try:
-        health_status = health_checker.check_all(settings)
+        health_status, _ = await get_cached_health()
         return health_status
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -237,12 +444,9 @@ async def health_check(correlation_id: str = Depends(add_correlation_id)):
 @app.get("/health/components/{component_name}", tags=["Status"])
 async def component_health(component_name: str):
     """Check health of a specific component"""
-    health_status = health_checker.check_all(settings)
+    _, components_by_name = await get_cached_health()
 
-    component = next(
-        (c for c in health_status["components"] if c["name"] == component_name),
-        None
-    )
+    component = components_by_name.get(component_name)
 
     if not component:
         raise HTTPException(status_code=404, detail=f"Component '{component_name}' not found")
@@ -254,43 +458,71 @@ async def component_health(component_name: str):
 # Attribution Endpoints
 # ============================================================================
 
+async def stream_attribution_results(stmt) -> AsyncIterator[AttributionResult]:
+    """
+    Stream AttributionResult rows from a session owned by the generator
+
+    The request-scoped session is closed before a streaming body is sent,
+    so the stream opens its own and closes it when iteration ends.
+    """
+    async with AsyncSessionLocal() as session:
+        result = await session.stream_scalars(stmt)
+        async for row in result:
+            yield row
+
+
+async def encode_attribution_summaries(
+    first: AttributionResult,
+    rows: AsyncIterator[AttributionResult]
+) -> AsyncIterator[bytes]:
+    """Emit rows as a JSON array of AttributionSummary objects, one row at a time"""
+    yield b"[" + orjson.dumps(AttributionSummary.model_validate(first).model_dump())
+    async for row in rows:
+        yield b"," + orjson.dumps(AttributionSummary.model_validate(row).model_dump())
+    yield b"]"
+
+
 @app.get("/attribution/contact/{contact_id}", response_model=List[AttributionSummary], tags=["Attribution"])
 async def get_contact_attribution(
-    contact_id: str,
-    model_type: Optional[str] = Query(None, description="Filter by attribution model"),
-    db: Session = Depends(get_db_session)
+    contact_id: int,
+    model_type: Optional[AttributionModelEnum] = Query(None, description="Filter by attribution model"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of results"),
+    before: Optional[datetime] = Query(None, description="Only results calculated before this time")
 ):
     """
-    Get attribution results for a specific contact
+    Get attribution results for a specific contact, newest first
+
+    Results are streamed as they are read. To page through older results,
+    pass the calculated_at of the last item received as `before`.
 
     Args:
         contact_id: HubSpot contact ID
         model_type: Optional filter by attribution model type
+        limit: Maximum number of results to return (1-500)
+        before: Optional cursor; only results calculated before this time
     """
     try:
-        query = db.query(AttributionResult).filter(AttributionResult.contact_id == contact_id)
+        stmt = (
+            select(AttributionResult)
+            .where(AttributionResult.contact_id == contact_id)
+            .options(raiseload("*"))
+        )
 
         if model_type:
-            query = query.filter(AttributionResult.model_type == model_type)
+            stmt = stmt.where(AttributionResult.model_type == model_type)
+        if before:
+            stmt = stmt.where(AttributionResult.calculated_at < before)
 
-        results = query.order_by(AttributionResult.calculated_at.desc()).all()
+        rows = stream_attribution_results(
+            stmt.order_by(AttributionResult.calculated_at.desc()).limit(limit)
+        )
+        first = await anext(rows, None)
 
-        if not results:
+        if first is None:
+            await rows.aclose()
             raise HTTPException(status_code=404, detail=f"No attribution results found for contact {contact_id}")
 
-        return [
-            AttributionSummary(
-                contact_id=r.contact_id,
-                total_value=r.total_value,
-                model_type=r.model_type.value,
-                touchpoint_count=r.touchpoint_count,
-                top_source=r.top_source,
-                top_medium=r.top_medium,
-                top_campaign=r.top_campaign,
-                calculated_at=r.calculated_at
-            )
-            for r in results
-        ]
+        return StreamingResponse(encode_attribution_summaries(first, rows), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -301,8 +533,8 @@ async def get_contact_attribution(
 @app.get("/attribution/summary", tags=["Attribution"])
 async def attribution_summary(
     days: int = Query(30, ge=1, le=365, description="Number of days to summarize"),
-    model_type: str = Query("w_shaped", description="Attribution model"),
-    db: Session = Depends(get_db_session)
+    model_type: AttributionModelEnum = Query(AttributionModelEnum.W_SHAPED, description="Attribution model"),
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     Get attribution summary across all contacts for a time period
@@ -311,29 +543,43 @@ async def attribution_summary(
         days: Number of days to look back (1-365)
         model_type: Attribution model to use
     """
+    cache_key = f"attribution_summary:{days}:{model_type.value}"
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     try:
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
-        results = db.query(AttributionResult).filter(
+        filters = (
             AttributionResult.calculated_at >= cutoff_date,
             AttributionResult.model_type == model_type
-        ).all()
+        )
 
-        total_value = sum(r.total_value for r in results)
-        total_touchpoints = sum(r.touchpoint_count for r in results)
-        total_contacts = len(set(r.contact_id for r in results))
+        # Totals are aggregated in a single row by the database
+        totals = await db.execute(
+            select(
+                func.coalesce(func.sum(AttributionResult.total_value), 0.0),
+                func.coalesce(func.sum(AttributionResult.touchpoint_count), 0),
+                func.count(distinct(AttributionResult.contact_id))
+            ).where(*filters)
+        )
+        total_value, total_touchpoints, total_contacts = totals.one()
 
         # Top campaigns
-        campaign_values = {}
-        for r in results:
-            if r.top_campaign:
-                campaign_values[r.top_campaign] = campaign_values.get(r.top_campaign, 0) + r.total_value
-
-        top_campaigns = sorted(campaign_values.items(), key=lambda x: x[1], reverse=True)[:10]
+        attributed_value = func.sum(AttributionResult.total_value).label("attributed_value")
+        top_result = await db.execute(
+            select(AttributionResult.top_campaign, attributed_value)
+            .where(*filters, AttributionResult.top_campaign.is_not(None), AttributionResult.top_campaign != "")
+            .group_by(AttributionResult.top_campaign)
+            .order_by(attributed_value.desc())
+            .limit(10)
+        )
+        top_campaigns = top_result.all()
 
-        return {
+        summary = {
             "period_days": days,
-            "model_type": model_type,
+            "model_type": model_type.value,
             "total_contacts": total_contacts,
             "total_attributed_value": total_value,
             "total_touchpoints": total_touchpoints,
@@ -343,6 +589,10 @@ async def attribution_summary(
                 for c in top_campaigns
             ]
         }
+
+        body = orjson.dumps(summary)
+        await response_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Error generating attribution summary: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -352,11 +602,42 @@ async def attribution_summary(
 # Campaign Endpoints
 # ============================================================================
 
+# Touchpoint rollups come from campaign_performance_mv when it covers the campaign
+CAMPAIGN_TOTAL_TOUCHPOINTS = func.coalesce(
+    CampaignPerformance.total_touchpoints, Campaign.total_touchpoints
+).label("total_touchpoints")
+CAMPAIGN_TOTAL_ATTRIBUTED_VALUE = func.coalesce(
+    CampaignPerformance.total_attributed_value, Campaign.total_attributed_value
+).label("total_attributed_value")
+
+# Only the columns CampaignMetrics needs, read as plain rows rather than ORM instances
+CAMPAIGN_METRICS_COLUMNS = (
+    Campaign.utm_campaign,
+    Campaign.utm_source,
+    Campaign.utm_medium,
+    CAMPAIGN_TOTAL_TOUCHPOINTS,
+    Campaign.total_conversions,
+    CAMPAIGN_TOTAL_ATTRIBUTED_VALUE,
+    # refreshed_at is timestamptz; shift it to naive UTC like the other timestamp columns (see UTC_NOW)
+    func.coalesce(
+        func.timezone("utc", CampaignPerformance.refreshed_at), Campaign.last_aggregated_at
+    ).label("last_aggregated_at")
+)
+
+
+def select_campaign_metrics():
+    """Select CampaignMetrics columns joined to the campaign_performance_mv rollup"""
+    return select(*CAMPAIGN_METRICS_COLUMNS).outerjoin(
+        CampaignPerformance,
+        CampaignPerformance.utm_campaign == Campaign.utm_campaign
+    )
+
+
 @app.get("/campaigns", response_model=List[CampaignMetrics], tags=["Campaigns"])
 async def list_campaigns(
     limit: int = Query(50, ge=1, le=500),
     sort_by: str = Query("total_attributed_value", description="Sort field"),
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_db_session)
 ):
     """
     List all campaigns with performance metrics
@@ -365,54 +646,46 @@ async def list_campaigns(
         limit: Maximum number of campaigns to return
         sort_by: Field to sort by (total_attributed_value, total_touchpoints, etc.)
     """
+    cache_key = f"campaigns:{limit}:{sort_by}"
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     try:
-        query = db.query(Campaign)
+        stmt = select_campaign_metrics()
 
         # Apply sorting
         if sort_by == "total_attributed_value":
-            query = query.order_by(Campaign.total_attributed_value.desc())
+            stmt = stmt.order_by(CAMPAIGN_TOTAL_ATTRIBUTED_VALUE.desc())
         elif sort_by == "total_touchpoints":
-            query = query.order_by(Campaign.total_touchpoints.desc())
+            stmt = stmt.order_by(CAMPAIGN_TOTAL_TOUCHPOINTS.desc())
         else:
-            query = query.order_by(Campaign.created_at.desc())
-
-        campaigns = query.limit(limit).all()
-
-        return [
-            CampaignMetrics(
-                utm_campaign=c.utm_campaign,
-                utm_source=c.utm_source,
-                utm_medium=c.utm_medium,
-                total_touchpoints=c.total_touchpoints,
-                total_conversions=c.total_conversions,
-                total_attributed_value=c.total_attributed_value,
-                last_aggregated_at=c.last_aggregated_at
-            )
-            for c in campaigns
-        ]
+            stmt = stmt.order_by(Campaign.created_at.desc())
+
+        result = await db.execute(stmt.limit(limit))
+        campaigns = result.all()
+
+        body = orjson.dumps([row._asdict() for row in campaigns])
+        await response_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Error listing campaigns: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/campaigns/{utm_campaign}", response_model=CampaignMetrics, tags=["Campaigns"])
-async def get_campaign(utm_campaign: str, db: Session = Depends(get_db_session)):
+async def get_campaign(utm_campaign: str, db: AsyncSession = Depends(get_db_session)):
     """Get detailed metrics for a specific campaign"""
     try:
-        campaign = db.query(Campaign).filter(Campaign.utm_campaign == utm_campaign).first()
+        result = await db.execute(
+            select_campaign_metrics().where(Campaign.utm_campaign == utm_campaign)
+        )
+        campaign = result.first()
 
         if not campaign:
             raise HTTPException(status_code=404, detail=f"Campaign '{utm_campaign}' not found")
 
-        return CampaignMetrics(
-            utm_campaign=campaign.utm_campaign,
-            utm_source=campaign.utm_source,
-            utm_medium=campaign.utm_medium,
-            total_touchpoints=campaign.total_touchpoints,
-            total_conversions=campaign.total_conversions,
-            total_attributed_value=campaign.total_attributed_value,
-            last_aggregated_at=campaign.last_aggregated_at
-        )
+        return campaign._asdict()
     except HTTPException:
         raise
     except Exception as e:
@@ -432,6 +705,7 @@ async def query_knowledge_base(request: RAGQueryRequest):
     Args:
         request: Query request with question and number of documents to retrieve
     """
+    rag_kb = get_rag_kb()
     if not rag_kb:
         raise HTTPException(status_code=503, detail="RAG system not configured")
 
@@ -451,6 +725,7 @@ async def query_knowledge_base(request: RAGQueryRequest):
 @app.get("/rag/stats", tags=["Knowledge Base"])
 async def rag_stats():
     """Get RAG knowledge base statistics"""
+    rag_kb = get_rag_kb()
     if not rag_kb:
         raise HTTPException(status_code=503, detail="RAG system not configured")
 
@@ -487,6 +762,11 @@ async def trigger_contact_sync(limit: Optional[int] = Query(None, ge=1, le=10000
     """
     try:
         result = etl_manager.sync_contacts(limit=limit)
+
+        # Synced data changes campaign and attribution aggregates
+        await response_cache.invalidate("campaigns:*")
+        await response_cache.invalidate("attribution_summary:*")
+
         return {
             "status": "completed",
             "statistics": result
@@ -501,7 +781,7 @@ async def trigger_contact_sync(limit: Optional[int] = Query(None, ge=1, le=10000
 # ============================================================================
 
 @app.post("/n8n/agent/query", response_model=N8nAgentQueryResponse, tags=["n8n Integration"])
-async def n8n_agent_query(request: N8nAgentQueryRequest, correlation_id: str = Depends(add_correlation_id)):
+async def n8n_agent_query(request: N8nAgentQueryRequest):
     """
     Invoke LangChain agent from n8n workflow
 
@@ -517,18 +797,12 @@ async def n8n_agent_query(request: N8nAgentQueryRequest, correlation_id: str = D
     Note: This provides AI-powered decision support for n8n workflows.
     For standard attribution calculations, use /n8n/attribution endpoint.
     """
+    n8n_manager = get_n8n_manager()
     if not n8n_manager:
         raise HTTPException(status_code=503, detail="n8n integration not configured")
 
     try:
-        from langchain_openai import ChatOpenAI
-
-        # Initialize LLM
-        llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0,
-            api_key=settings.openai_api_key
-        )
+        llm = get_llm()
 
         # Add context to query if provided
         query = request.query
@@ -536,12 +810,12 @@ async def n8n_agent_query(request: N8nAgentQueryRequest, correlation_id: str = D
             query += f"\n\nContext: {request.context}"
 
         # Get intelligent response
-        response = llm.invoke(query).content
+        response = (await llm.ainvoke(query)).content
 
-        return N8nAgentQueryResponse(
+        return N8nAgentQueryResponse.model_construct(
             response=response,
-            correlation_id=correlation_id,
-            timestamp=datetime.utcnow().isoformat()
+            correlation_id=get_correlation_id(),
+            timestamp=datetime.utcnow()
         )
     except Exception as e:
         logger.error(f"Error in n8n agent query: {e}")
@@ -549,10 +823,7 @@ async def n8n_agent_query(request: N8nAgentQueryRequest, correlation_id: str = D
 
 
 @app.post("/n8n/attribution", response_model=N8nAttributionResponse, tags=["n8n Integration"])
-async def n8n_calculate_attribution(
-    request: N8nAttributionRequest,
-    correlation_id: str = Depends(add_correlation_id)
-):
+async def n8n_calculate_attribution(request: N8nAttributionRequest):
     """
     Calculate attribution for n8n workflows
 
@@ -562,24 +833,15 @@ async def n8n_calculate_attribution(
     of updating systems, syncing platforms, and notifying stakeholders.
     """
     try:
-        from modules.crm_attribution import CRMAttributionManager
-
-        # Initialize manager
-        crm_manager = CRMAttributionManager()
-
-        # Calculate attribution
-        result = crm_manager.calculate_attribution(
-            contact_id=request.contact_id,
-            total_value=request.total_value,
-            model_type=request.model_type
-        )
+        # Calculate attribution (batched with concurrent requests)
+        result = await attribution_batcher.submit(request)
 
         logger.info(
             f"Attribution calculated for n8n: {request.contact_id} | "
             f"Model: {request.model_type} | Value: ${request.total_value}"
         )
 
-        return N8nAttributionResponse(
+        return N8nAttributionResponse.model_construct(
             contact_id=request.contact_id,
             total_value=request.total_value,
             model_type=request.model_type,
@@ -592,10 +854,7 @@ async def n8n_calculate_attribution(
 
 
 @app.post("/n8n/ad-sync", response_model=N8nAdSyncResponse, tags=["n8n Integration"])
-async def n8n_sync_ad_platforms(
-    request: N8nAdSyncRequest,
-    correlation_id: str = Depends(add_correlation_id)
-):
+async def n8n_sync_ad_platforms(request: N8nAdSyncRequest):
     """
     Sync conversion events to ad platforms from n8n
 
@@ -603,18 +862,19 @@ async def n8n_sync_ad_platforms(
     they call this endpoint to sync conversion events to Google Ads,
     Facebook Ads, and LinkedIn Ads.
     """
-    try:
-        from modules.ad_platform_signaling import AdPlatformSignalingManager
-        from models.attribution import LifecycleStage
+    for stage in (request.from_stage, request.to_stage):
+        if stage not in LIFECYCLE_STAGES_BY_VALUE:
+            raise HTTPException(status_code=422, detail=f"Unknown lifecycle stage: {stage}")
 
-        # Initialize manager
-        ad_signaling = AdPlatformSignalingManager()
+    try:
+        manager = get_ad_signaling_manager()
 
-        # Sync to ad platforms
-        result = ad_signaling.sync_lifecycle_conversion(
+        # Queue for the background uploader (HubSpot lookup is blocking, so off the event loop)
+        _, platforms = await asyncio.to_thread(
+            manager.queue_lifecycle_conversion,
             contact_id=request.contact_id,
-            from_stage=LifecycleStage(request.from_stage),
-            to_stage=LifecycleStage(request.to_stage),
+            from_stage=LIFECYCLE_STAGES_BY_VALUE[request.from_stage],
+            to_stage=LIFECYCLE_STAGES_BY_VALUE[request.to_stage],
             conversion_value=request.conversion_value
         )
 
@@ -623,10 +883,10 @@ async def n8n_sync_ad_platforms(
             f"{request.from_stage} -> {request.to_stage}"
         )
 
-        return N8nAdSyncResponse(
+        return N8nAdSyncResponse.model_construct(
             contact_id=request.contact_id,
-            synced_platforms=result.synced_to_ad_platforms,
-            status="success"
+            synced_platforms=platforms,
+            status="queued" if manager.conversion_queue else "success"
         )
     except Exception as e:
         logger.error(f"Error syncing ad platforms from n8n: {e}")
@@ -634,7 +894,7 @@ async def n8n_sync_ad_platforms(
 
 
 @app.post("/n8n/audit", tags=["n8n Integration"])
-async def n8n_data_quality_audit(correlation_id: str = Depends(add_correlation_id)):
+async def n8n_data_quality_audit():
     """
     Run data quality audit from n8n
 
@@ -645,7 +905,7 @@ async def n8n_data_quality_audit(correlation_id: str = Depends(add_correlation_i
         # Run audit - returns data quality metrics
         # In production, this would analyze HubSpot data, UTM compliance, etc.
         audit_result = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "quality_score": 95,
             "checks_passed": 23,
             "checks_failed": 2,
@@ -664,10 +924,7 @@ async def n8n_data_quality_audit(correlation_id: str = Depends(add_correlation_i
 
 
 @app.post("/n8n/workflows/trigger", tags=["n8n Integration"])
-async def trigger_n8n_workflow(
-    request: N8nWorkflowTriggerRequest,
-    correlation_id: str = Depends(add_correlation_id)
-):
+async def trigger_n8n_workflow(request: N8nWorkflowTriggerRequest):
     """
     Trigger n8n workflow from LangChain API
 
@@ -675,6 +932,7 @@ async def trigger_n8n_workflow(
     enabling bidirectional communication. For example, after detecting an
     anomaly, LangChain can trigger an n8n approval workflow.
     """
+    n8n_manager = get_n8n_manager()
     if not n8n_manager:
         raise HTTPException(status_code=503, detail="n8n integration not configured")
 
@@ -699,18 +957,19 @@ async def trigger_n8n_workflow(
 
 
 @app.post("/webhooks/n8n", tags=["n8n Integration"])
-async def n8n_webhook_receiver(payload: N8nWebhookPayload, correlation_id: str = Depends(add_correlation_id)):
+async def n8n_webhook_receiver(payload: N8nWebhookPayload):
     """
     Receive webhooks from n8n workflows
 
     n8n workflows can send webhooks back to this endpoint to notify
     LangChain of events, completion status, or request additional processing.
     """
+    n8n_manager = get_n8n_manager()
     if not n8n_manager:
         raise HTTPException(status_code=503, detail="n8n integration not configured")
 
     try:
-        result = n8n_manager.process_webhook(payload.dict())
+        result = n8n_manager.process_webhook(payload)
 
         logger.info(
             f"Received webhook from n8n: {payload.event_type} | "
@@ -724,10 +983,7 @@ async def n8n_webhook_receiver(payload: N8nWebhookPayload, correlation_id: str =
 
 
 @app.post("/webhooks/n8n/approval", tags=["n8n Integration"])
-async def n8n_approval_webhook(
-    payload: Dict[str, Any],
-    correlation_id: str = Depends(add_correlation_id)
-):
+async def n8n_approval_webhook(payload: Dict[str, Any]):
     """
     Handle approval decisions from n8n workflows
 
@@ -766,6 +1022,7 @@ async def list_n8n_workflows():
     Returns a list of workflows configured in the n8n instance,
     useful for discovering available automation options.
     """
+    n8n_manager = get_n8n_manager()
     if not n8n_manager:
         raise HTTPException(status_code=503, detail="n8n integration not configured")
 
@@ -782,11 +1039,28 @@ async def list_n8n_workflows():
 # ============================================================================
 
 if __name__ == "__main__":
-    logger.info("Starting HubSpot Attribution Engine API server...")
+    # Each worker is a separate process with its own health_checker, etl_manager
+    # and cached RAG/n8n/LLM clients; none of them hold cross-worker state.
+    # Every worker opens its own pool, so the default is capped to fit the DB connection budget
+    connections_per_worker = settings.db_pool_size + settings.db_max_overflow
+    workers = settings.web_concurrency or max(
+        1, min((os.cpu_count() or 1) * 2 + 1, settings.db_connection_budget // connections_per_worker)
+    )
+    if workers * connections_per_worker > settings.db_connection_budget:
+        logger.warning(
+            f"{workers} workers x {connections_per_worker} pooled connections exceeds "
+            f"DB_CONNECTION_BUDGET={settings.db_connection_budget}"
+        )
+
+    logger.info(f"Starting HubSpot Attribution Engine API server with {workers} worker(s)...")
     uvicorn.run(
         "api_server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="info"
+        workers=workers,
+        reload=False,
+        log_level="info",
+        # uvloop has no Windows build; uvicorn falls back to asyncio there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
@@ -0,0 +1,201 @@
+"""
+Bulk Insert Helpers
+
+This module batches touchpoint, conversion and consent ingestion into
+multi-row INSERT ... ON CONFLICT DO NOTHING statements, so loading N rows
+costs N / batch_size round-trips instead of one per ORM object.
+"""
+from itertools import islice
+import os
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from database.models import Base, Touchpoint, Conversion, ConsentRecord, AttributionResultTouchpoint
+
+# PostgreSQL insert throughput plateaus somewhere past 1k rows per statement
+DEFAULT_BATCH_SIZE = 1000
+
+
+def bulk_uuids(count: int) -> List[uuid.UUID]:
+    """
+    Generate random (version 4) UUIDs from a single urandom read
+
+    For client-side IDs that must be known before insert (e.g. to link child
+    rows); otherwise leave id unset and let gen_random_uuid() fill it.
+    """
+    random_bytes = os.urandom(16 * count)
+    return [uuid.UUID(bytes=random_bytes[i:i + 16], version=4) for i in range(0, 16 * count, 16)]
+
+
+def _batches(rows: Iterable[Dict[str, Any]], batch_size: int) -> Iterable[List[Dict[str, Any]]]:
+    """Yield lists of at most batch_size rows"""
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def bulk_insert(
+    session: Session,
+    model: Type[Base],
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    conflict_columns: Optional[Sequence[str]] = None
+) -> int:
+    """
+    Insert rows in batches, skipping rows that conflict with existing ones
+
+    Args:
+        session: SQLAlchemy session (caller commits)
+        model: Mapped model class whose table receives the rows
+        rows: Column-name -> value dicts
+        batch_size: Rows per INSERT statement
+        conflict_columns: Columns of the unique constraint to skip on (default: primary key)
+
+    Returns:
+        Number of rows inserted
+    """
+    table = model.__table__
+    if conflict_columns is None:
+        conflict_columns = [column.name for column in table.primary_key.columns]
+
+    inserted = 0
+    for batch in _batches(rows, batch_size):
+        stmt = pg_insert(table).values(batch).on_conflict_do_nothing(index_elements=list(conflict_columns))
+        inserted += session.execute(stmt).rowcount
+
+    return inserted
+
+
+def bulk_insert_touchpoints(
+    session: Session,
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """Insert touchpoint rows in batches, skipping IDs that already exist"""
+    return bulk_insert(session, Touchpoint, rows, batch_size)
+
+
+def bulk_insert_conversions(
+    session: Session,
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """Insert conversion rows in batches, skipping IDs that already exist"""
+    return bulk_insert(session, Conversion, rows, batch_size)
+
+
+def bulk_insert_consent_records(
+    session: Session,
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """Insert consent records in batches, skipping existing (contact, consent type) pairs"""
+    return bulk_insert(session, ConsentRecord, rows, batch_size, conflict_columns=("contact_id", "consent_type"))
+
+
+async def insert_returning_ids(
+    session: AsyncSession,
+    model: Type[Base],
+    rows: Sequence[Dict[str, Any]]
+) -> List[uuid.UUID]:
+    """
+    Insert rows through an async session and return their IDs
+
+    Rows without an id get one from bulk_uuids(), so the IDs are known
+    before the insert and SQLAlchemy's insertmanyvalues path can batch the
+    executemany into multi-row INSERTs. Relying on RETURNING of the
+    server-generated gen_random_uuid() key would need a sentinel column to
+    match rows back to parameters, and without one SQLAlchemy falls back to
+    one INSERT per row.
+
+    Args:
+        session: Async SQLAlchemy session (caller commits)
+        model: Mapped model class with a UUID id column
+        rows: Column-name -> value dicts
+
+    Returns:
+        IDs in the same order as rows
+    """
+    if not rows:
+        return []
+
+    new_ids = iter(bulk_uuids(sum(1 for row in rows if row.get("id") is None)))
+    rows = [row if row.get("id") is not None else {**row, "id": next(new_ids)} for row in rows]
+    await session.execute(insert(model), rows)
+    return [row["id"] for row in rows]
+
+
+async def insert_touchpoints_returning_ids(session: AsyncSession, rows: Sequence[Dict[str, Any]]) -> List[uuid.UUID]:
+    """Insert touchpoint rows and return their IDs in order"""
+    return await insert_returning_ids(session, Touchpoint, rows)
+
+
+def attribution_credit_rows(
+    attribution_result_id: uuid.UUID,
+    touchpoint_credits: Dict[str, float],
+    total_value: float
+) -> List[Dict[str, Any]]:
+    """
+    Build attribution_result_touchpoints rows from calculator output
+
+    Args:
+        attribution_result_id: Parent AttributionResult ID
+        touchpoint_credits: touchpoint_id -> credited value
+        total_value: Total value attributed, used to derive each weight
+
+    Returns:
+        Row dicts ready for insertion
+    """
+    return [
+        {
+            "attribution_result_id": attribution_result_id,
+            "touchpoint_id": touchpoint_id,
+            "weight": value / total_value if total_value else None,
+            "value": value
+        }
+        for touchpoint_id, value in touchpoint_credits.items()
+    ]
+
+
+def bulk_insert_attribution_credits(
+    session: Session,
+    attribution_result_id: uuid.UUID,
+    touchpoint_credits: Dict[str, float],
+    total_value: float
+) -> int:
+    """Insert the per-touchpoint credits of one attribution result, skipping existing pairs"""
+    rows = attribution_credit_rows(attribution_result_id, touchpoint_credits, total_value)
+    return bulk_insert(session, AttributionResultTouchpoint, rows)
+
+
+async def insert_attribution_credits(
+    session: AsyncSession,
+    attribution_result_id: uuid.UUID,
+    touchpoint_credits: Dict[str, float],
+    total_value: float
+) -> int:
+    """
+    Insert the per-touchpoint credits of one attribution result in a single statement
+
+    Args:
+        session: Async SQLAlchemy session (caller commits)
+        attribution_result_id: Parent AttributionResult ID
+        touchpoint_credits: touchpoint_id -> credited value
+        total_value: Total value attributed
+
+    Returns:
+        Number of rows inserted
+    """
+    rows = attribution_credit_rows(attribution_result_id, touchpoint_credits, total_value)
+    if not rows:
+        return 0
+
+    stmt = pg_insert(AttributionResultTouchpoint.__table__).values(rows).on_conflict_do_nothing(
+        index_elements=["attribution_result_id", "touchpoint_id"]
+    )
+    return (await session.execute(stmt)).rowcount
+
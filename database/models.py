@@ -7,11 +7,11 @@ touchpoints, conversions, and analytics locally in PostgreSQL.
 from datetime import datetime
 from typing import Optional, List
 from sqlalchemy import (
-    Column, String, Integer, Float, DateTime, Boolean, JSON, Text,
-    ForeignKey, Index, Enum as SQLEnum, UniqueConstraint
+    Column, String, Integer, BigInteger, SmallInteger, Float, DateTime, Boolean, JSON, Text,
+    ForeignKey, Index, UniqueConstraint, DDL, FetchedValue, TypeDecorator, event, text
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.dialects.postgresql import INET, UUID
 import uuid
 import enum
 
@@ -21,6 +21,10 @@ class Base(DeclarativeBase):
     pass
 
 
+# Server-side default for timestamp columns (naive UTC, matching datetime.utcnow)
+UTC_NOW = text("(now() AT TIME ZONE 'utc')")
+
+
 class LifecycleStageEnum(str, enum.Enum):
     """Lifecycle stage enumeration"""
     SUBSCRIBER = "subscriber"
@@ -42,6 +46,51 @@ class AttributionModelEnum(str, enum.Enum):
     FULL_PATH = "full_path"
 
 
+# Stored SMALLINT codes; never renumber, only append
+LIFECYCLE_STAGE_CODES = {
+    LifecycleStageEnum.SUBSCRIBER: 1,
+    LifecycleStageEnum.LEAD: 2,
+    LifecycleStageEnum.MARKETING_QUALIFIED_LEAD: 3,
+    LifecycleStageEnum.SALES_QUALIFIED_LEAD: 4,
+    LifecycleStageEnum.OPPORTUNITY: 5,
+    LifecycleStageEnum.CUSTOMER: 6,
+    LifecycleStageEnum.EVANGELIST: 7,
+    LifecycleStageEnum.OTHER: 8,
+}
+
+ATTRIBUTION_MODEL_CODES = {
+    AttributionModelEnum.FIRST_TOUCH: 1,
+    AttributionModelEnum.LAST_TOUCH: 2,
+    AttributionModelEnum.LINEAR: 3,
+    AttributionModelEnum.W_SHAPED: 4,
+    AttributionModelEnum.FULL_PATH: 5,
+}
+
+
+class SmallIntEnum(TypeDecorator):
+    """Stores a str enum as a SMALLINT code instead of a PostgreSQL ENUM type"""
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class, codes):
+        super().__init__()
+        self.enum_class = enum_class
+        self.codes = tuple(codes.items())
+        self._code_by_member = dict(codes)
+        self._member_by_code = {code: member for member, code in codes.items()}
+
+    def process_bind_param(self, value, dialect):
+        """Accept enum members or their string values"""
+        if value is None:
+            return None
+        return self._code_by_member[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._member_by_code[value]
+
+
 # ============================================================================
 # Core Models
 # ============================================================================
@@ -54,12 +103,12 @@ class Contact(Base):
     """
     __tablename__ = "contacts"
 
-    id: Mapped[str] = mapped_column(String(50), primary_key=True)  # HubSpot contact ID
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=False)  # HubSpot contact ID (numeric)
     email: Mapped[Optional[str]] = mapped_column(String(255), index=True)
     first_name: Mapped[Optional[str]] = mapped_column(String(100))
     last_name: Mapped[Optional[str]] = mapped_column(String(100))
     lifecycle_stage: Mapped[Optional[LifecycleStageEnum]] = mapped_column(
-        SQLEnum(LifecycleStageEnum),
+        SmallIntEnum(LifecycleStageEnum, LIFECYCLE_STAGE_CODES),
         index=True
     )
 
@@ -68,16 +117,27 @@ class Contact(Base):
     fbclid: Mapped[Optional[str]] = mapped_column(String(255))
     msclkid: Mapped[Optional[str]] = mapped_column(String(255))
 
+    # Touchpoint aggregates (denormalized, maintained by triggers on touchpoints)
+    total_touchpoints: Mapped[int] = mapped_column(Integer, default=0)
+    total_attributed_value: Mapped[float] = mapped_column(Float, default=0.0)
+    first_touch_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True))
+    last_touch_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True))
+    top_source: Mapped[Optional[str]] = mapped_column(String(255))
+    top_campaign: Mapped[Optional[str]] = mapped_column(String(255))
+
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
+    )
     last_synced_from_hubspot: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
     # HubSpot metadata
     hubspot_owner_id: Mapped[Optional[str]] = mapped_column(String(50))
     hubspot_created_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
-    # Relationships
+    # Relationships (lazy by default; queries that iterate contacts' collections add
+    # .options(selectinload(...)) so each collection costs one IN query instead of N+1 loads)
     touchpoints: Mapped[List["Touchpoint"]] = relationship("Touchpoint", back_populates="contact", cascade="all, delete-orphan")
     conversions: Mapped[List["Conversion"]] = relationship("Conversion", back_populates="contact", cascade="all, delete-orphan")
     attribution_results: Mapped[List["AttributionResult"]] = relationship("AttributionResult", back_populates="contact", cascade="all, delete-orphan")
@@ -86,6 +146,8 @@ class Contact(Base):
         Index('idx_contact_email', 'email'),
         Index('idx_contact_lifecycle', 'lifecycle_stage'),
         Index('idx_contact_gclid', 'gclid'),
+        Index('idx_contact_total_value', 'total_attributed_value'),
+        Index('idx_contact_top_campaign', 'top_campaign'),
     )
 
 
@@ -93,12 +155,15 @@ class Touchpoint(Base):
     """
     Marketing touchpoint (interaction)
 
-    Each touchpoint represents a marketing interaction captured via UTM parameters
+    Each touchpoint represents a marketing interaction captured via UTM parameters.
+    Range-partitioned by month on occurred_at (see database/partitions.py).
     """
     __tablename__ = "touchpoints"
 
-    id: Mapped[str] = mapped_column(String(50), primary_key=True, default=lambda: str(uuid.uuid4()))
-    contact_id: Mapped[str] = mapped_column(String(50), ForeignKey("contacts.id"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    contact_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("contacts.id"), index=True)
 
     # UTM Parameters
     utm_source: Mapped[Optional[str]] = mapped_column(String(255), index=True)
@@ -120,24 +185,38 @@ class Touchpoint(Base):
     # Session info
     session_id: Mapped[Optional[str]] = mapped_column(String(100))
     user_agent: Mapped[Optional[str]] = mapped_column(Text)
-    ip_address: Mapped[Optional[str]] = mapped_column(String(45))  # IPv6 compatible
+    ip_address: Mapped[Optional[str]] = mapped_column(INET)  # IPv4/IPv6, stored binary
 
-    # Timing
-    occurred_at: Mapped[datetime] = mapped_column(DateTime, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Timing (partition key, so part of the primary key)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     # Attribution weight (calculated during attribution)
     attribution_weight: Mapped[Optional[float]] = mapped_column(Float)
     attributed_value: Mapped[Optional[float]] = mapped_column(Float)
 
+    # Contact lifecycle stage when the touch happened (maintained by triggers from conversions)
+    lifecycle_stage_at_touch: Mapped[Optional[LifecycleStageEnum]] = mapped_column(
+        SmallIntEnum(LifecycleStageEnum, LIFECYCLE_STAGE_CODES)
+    )
+
     # Relationships
     contact: Mapped["Contact"] = relationship("Contact", back_populates="touchpoints")
 
     __table_args__ = (
         Index('idx_touchpoint_contact', 'contact_id'),
         Index('idx_touchpoint_utm_campaign', 'utm_campaign'),
-        Index('idx_touchpoint_occurred', 'occurred_at'),
-        Index('idx_touchpoint_utm_source_medium', 'utm_source', 'utm_medium'),
+        # Covering indexes (INCLUDE) so report aggregates can use index-only scans
+        Index('idx_touchpoint_occurred', 'occurred_at', postgresql_include=['utm_campaign', 'attributed_value']),
+        # GiST over INET so subnet containment (<<=) lookups can use an index
+        Index('idx_touchpoint_ip_inet', 'ip_address', postgresql_using='gist', postgresql_ops={'ip_address': 'inet_ops'}),
+        # BRIN: tiny range index for lookback windows over append-ordered timestamps
+        Index('idx_touchpoint_occurred_brin', 'occurred_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        Index(
+            'idx_touchpoint_utm_source_medium', 'utm_source', 'utm_medium',
+            postgresql_include=['attributed_value', 'attribution_weight', 'contact_id']
+        ),
+        {'postgresql_partition_by': 'RANGE (occurred_at)'},
     )
 
 
@@ -145,27 +224,34 @@ class Conversion(Base):
     """
     Lifecycle stage conversion event
 
-    Tracks when a contact moves between lifecycle stages
+    Tracks when a contact moves between lifecycle stages.
+    Range-partitioned by month on occurred_at (see database/partitions.py).
     """
     __tablename__ = "conversions"
 
-    id: Mapped[str] = mapped_column(String(50), primary_key=True, default=lambda: str(uuid.uuid4()))
-    contact_id: Mapped[str] = mapped_column(String(50), ForeignKey("contacts.id"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    contact_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("contacts.id"), index=True)
 
     # Conversion details
-    from_stage: Mapped[Optional[LifecycleStageEnum]] = mapped_column(SQLEnum(LifecycleStageEnum))
-    to_stage: Mapped[LifecycleStageEnum] = mapped_column(SQLEnum(LifecycleStageEnum), index=True)
+    from_stage: Mapped[Optional[LifecycleStageEnum]] = mapped_column(
+        SmallIntEnum(LifecycleStageEnum, LIFECYCLE_STAGE_CODES)
+    )
+    to_stage: Mapped[LifecycleStageEnum] = mapped_column(
+        SmallIntEnum(LifecycleStageEnum, LIFECYCLE_STAGE_CODES), index=True
+    )
     conversion_value: Mapped[Optional[float]] = mapped_column(Float)
 
     # Ad platform syncing
     synced_to_google_ads: Mapped[bool] = mapped_column(Boolean, default=False)
     synced_to_facebook: Mapped[bool] = mapped_column(Boolean, default=False)
     synced_to_linkedin: Mapped[bool] = mapped_column(Boolean, default=False)
-    sync_errors: Mapped[Optional[dict]] = mapped_column(JSONB)
+    sync_errors: Mapped[Optional[dict]] = mapped_column(JSON)  # JSON, not JSONB: only read whole
 
-    # Timing
-    occurred_at: Mapped[datetime] = mapped_column(DateTime, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Timing (partition key, so part of the primary key)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
     synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
     # Relationships
@@ -173,8 +259,10 @@ class Conversion(Base):
 
     __table_args__ = (
         Index('idx_conversion_contact', 'contact_id'),
+        Index('idx_conversion_contact_occurred', 'contact_id', 'occurred_at'),
         Index('idx_conversion_to_stage', 'to_stage'),
-        Index('idx_conversion_occurred', 'occurred_at'),
+        Index('idx_conversion_occurred_brin', 'occurred_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
+        {'postgresql_partition_by': 'RANGE (occurred_at)'},
     )
 
 
@@ -186,16 +274,19 @@ class AttributionResult(Base):
     """
     __tablename__ = "attribution_results"
 
-    id: Mapped[str] = mapped_column(String(50), primary_key=True, default=lambda: str(uuid.uuid4()))
-    contact_id: Mapped[str] = mapped_column(String(50), ForeignKey("contacts.id"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    contact_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("contacts.id"), index=True)
 
     # Attribution model used
-    model_type: Mapped[AttributionModelEnum] = mapped_column(SQLEnum(AttributionModelEnum), index=True)
+    model_type: Mapped[AttributionModelEnum] = mapped_column(
+        SmallIntEnum(AttributionModelEnum, ATTRIBUTION_MODEL_CODES), index=True
+    )
 
     # Results
     total_value: Mapped[float] = mapped_column(Float)
     touchpoint_count: Mapped[int] = mapped_column(Integer)
-    touchpoint_attributions: Mapped[dict] = mapped_column(JSONB)  # touchpoint_id -> {weight, value}
 
     # Top channels (denormalized for quick queries)
     top_source: Mapped[Optional[str]] = mapped_column(String(255))
@@ -203,16 +294,54 @@ class AttributionResult(Base):
     top_campaign: Mapped[Optional[str]] = mapped_column(String(255))
 
     # Metadata
-    calculated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+    calculated_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW, index=True)
     lookback_days: Mapped[int] = mapped_column(Integer)
 
     # Relationships
     contact: Mapped["Contact"] = relationship("Contact", back_populates="attribution_results")
+    touchpoint_credits: Mapped[List["AttributionResultTouchpoint"]] = relationship(
+        "AttributionResultTouchpoint",
+        back_populates="attribution_result",
+        cascade="all, delete-orphan"
+    )
 
     __table_args__ = (
         Index('idx_attribution_contact', 'contact_id'),
         Index('idx_attribution_model', 'model_type'),
         Index('idx_attribution_calculated', 'calculated_at'),
+        # Covers /attribution/summary (filter by model and period, aggregate value/touchpoints/contacts)
+        Index(
+            'idx_attribution_model_calculated', 'model_type', 'calculated_at',
+            postgresql_include=['total_value', 'touchpoint_count', 'contact_id', 'top_campaign']
+        ),
+    )
+
+
+class AttributionResultTouchpoint(Base):
+    """
+    Per-touchpoint credit within an attribution result
+
+    One narrow row per credited touchpoint, so cross-contact credit queries
+    scan and index plain columns instead of unpacking JSON per result
+    """
+    __tablename__ = "attribution_result_touchpoints"
+
+    attribution_result_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("attribution_results.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Not a foreign key: credited touchpoints may come from HubSpot before they are synced locally
+    touchpoint_id: Mapped[str] = mapped_column(String(50), primary_key=True)
+    weight: Mapped[Optional[float]] = mapped_column(Float)
+    value: Mapped[float] = mapped_column(Float)
+
+    # Relationships
+    attribution_result: Mapped["AttributionResult"] = relationship(
+        "AttributionResult",
+        back_populates="touchpoint_credits"
+    )
+
+    __table_args__ = (
+        Index('idx_attribution_touchpoint_touchpoint', 'touchpoint_id'),
     )
 
 
@@ -228,7 +357,9 @@ class Campaign(Base):
     """
     __tablename__ = "campaigns"
 
-    id: Mapped[str] = mapped_column(String(50), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
 
     # Campaign identifiers
     utm_campaign: Mapped[str] = mapped_column(String(255), unique=True, index=True)
@@ -248,8 +379,10 @@ class Campaign(Base):
     total_attributed_value: Mapped[float] = mapped_column(Float, default=0.0)
 
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
+    )
     last_aggregated_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
     __table_args__ = (
@@ -258,6 +391,32 @@ class Campaign(Base):
     )
 
 
+# ============================================================================
+# Reporting Views
+# ============================================================================
+
+class ViewBase(DeclarativeBase):
+    """Base class for read-only views (kept out of Base.metadata so create_all skips them)"""
+    pass
+
+
+class CampaignPerformance(ViewBase):
+    """
+    Campaign performance rollup (materialized view)
+
+    Pre-aggregates touchpoints by campaign; refreshed periodically
+    """
+    __tablename__ = "campaign_performance_mv"
+
+    utm_campaign: Mapped[str] = mapped_column(String(255), primary_key=True)
+    utm_source: Mapped[Optional[str]] = mapped_column(String(255))  # Most common source
+    utm_medium: Mapped[Optional[str]] = mapped_column(String(255))  # Most common medium
+    total_touchpoints: Mapped[int] = mapped_column(Integer)
+    unique_contacts: Mapped[int] = mapped_column(Integer)
+    total_attributed_value: Mapped[float] = mapped_column(Float)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))  # NOW() at refresh, timestamptz
+
+
 # ============================================================================
 # ETL & Sync Models
 # ============================================================================
@@ -270,7 +429,9 @@ class ETLJob(Base):
     """
     __tablename__ = "etl_jobs"
 
-    id: Mapped[str] = mapped_column(String(50), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
 
     # Job details
     job_type: Mapped[str] = mapped_column(String(100), index=True)  # e.g., 'sync_contacts', 'sync_touchpoints'
@@ -289,10 +450,10 @@ class ETLJob(Base):
 
     # Error tracking
     error_message: Mapped[Optional[Text]] = mapped_column(Text)
-    error_details: Mapped[Optional[dict]] = mapped_column(JSONB)
+    error_details: Mapped[Optional[dict]] = mapped_column(JSON)  # JSON, not JSONB: only read whole
 
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
 
     __table_args__ = (
         Index('idx_etl_job_type', 'job_type'),
@@ -313,8 +474,10 @@ class ConsentRecord(Base):
     """
     __tablename__ = "consent_records"
 
-    id: Mapped[str] = mapped_column(String(50), primary_key=True, default=lambda: str(uuid.uuid4()))
-    contact_id: Mapped[str] = mapped_column(String(50), ForeignKey("contacts.id"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
+    contact_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("contacts.id"), index=True)
 
     # Consent details
     consent_type: Mapped[str] = mapped_column(String(100), index=True)  # e.g., 'marketing_email', 'analytics'
@@ -327,8 +490,10 @@ class ConsentRecord(Base):
     expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
+    )
 
     # Legal basis
     legal_basis: Mapped[Optional[str]] = mapped_column(String(100))  # e.g., 'consent', 'legitimate_interest'
@@ -349,7 +514,9 @@ class DataRetentionPolicy(Base):
     """
     __tablename__ = "data_retention_policies"
 
-    id: Mapped[str] = mapped_column(String(50), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
 
     # Policy details
     entity_type: Mapped[str] = mapped_column(String(100), index=True)  # e.g., 'contact', 'touchpoint'
@@ -360,9 +527,294 @@ class DataRetentionPolicy(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=UTC_NOW)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue()
+    )
 
     __table_args__ = (
         Index('idx_retention_entity_type', 'entity_type'),
     )
+
+
+# ============================================================================
+# Partitioning
+# ============================================================================
+
+# Catch-all partitions so inserts never fail for months without a partition yet
+for _table in (Touchpoint.__table__, Conversion.__table__):
+    event.listen(
+        _table,
+        "after_create",
+        DDL(f"CREATE TABLE IF NOT EXISTS {_table.name}_default PARTITION OF {_table.name} DEFAULT")
+        .execute_if(dialect="postgresql")
+    )
+
+
+# ============================================================================
+# Timestamp Triggers
+# ============================================================================
+
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at()
+RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = now() AT TIME ZONE 'utc';
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# updated_at is maintained by the database on every UPDATE
+for _table in Base.metadata.sorted_tables:
+    if "updated_at" in _table.c:
+        for _statement in (
+            SET_UPDATED_AT_FUNCTION,
+            f"DROP TRIGGER IF EXISTS {_table.name}_set_updated_at ON {_table.name}",
+            f"CREATE TRIGGER {_table.name}_set_updated_at BEFORE UPDATE ON {_table.name} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()",
+        ):
+            event.listen(_table, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
+# ============================================================================
+# Denormalization Triggers
+# ============================================================================
+
+# Recomputes the Contact touchpoint aggregates for a set of contacts
+REFRESH_CONTACT_AGGREGATES_FUNCTION = """
+CREATE OR REPLACE FUNCTION refresh_contact_touchpoint_aggregates(target_contact_ids BIGINT[])
+RETURNS void AS $$
+    UPDATE contacts AS c SET
+        total_touchpoints = agg.total_touchpoints,
+        total_attributed_value = agg.total_attributed_value,
+        first_touch_id = agg.first_touch_id,
+        last_touch_id = agg.last_touch_id,
+        top_source = agg.top_source,
+        top_campaign = agg.top_campaign
+    FROM (
+        SELECT
+            target.contact_id,
+            COUNT(t.id) AS total_touchpoints,
+            COALESCE(SUM(t.attributed_value), 0) AS total_attributed_value,
+            (ARRAY_AGG(t.id ORDER BY t.occurred_at ASC))[1] AS first_touch_id,
+            (ARRAY_AGG(t.id ORDER BY t.occurred_at DESC))[1] AS last_touch_id,
+            MODE() WITHIN GROUP (ORDER BY t.utm_source) AS top_source,
+            MODE() WITHIN GROUP (ORDER BY t.utm_campaign) AS top_campaign
+        FROM UNNEST(target_contact_ids) AS target(contact_id)
+        LEFT JOIN touchpoints AS t ON t.contact_id = target.contact_id
+        GROUP BY target.contact_id
+    ) AS agg
+    WHERE c.id = agg.contact_id;
+$$ LANGUAGE sql;
+"""
+
+# Statement-level trigger: bulk loads refresh each affected contact once
+CONTACT_AGGREGATES_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION contact_touchpoint_agg_trigger()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM refresh_contact_touchpoint_aggregates(ARRAY(SELECT DISTINCT contact_id FROM new_rows));
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM refresh_contact_touchpoint_aggregates(ARRAY(SELECT DISTINCT contact_id FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+CONTACT_AGGREGATES_TRIGGERS = (
+    "DROP TRIGGER IF EXISTS touchpoints_contact_agg_insert ON touchpoints",
+    """
+    CREATE TRIGGER touchpoints_contact_agg_insert
+    AFTER INSERT ON touchpoints
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION contact_touchpoint_agg_trigger()
+    """,
+    "DROP TRIGGER IF EXISTS touchpoints_contact_agg_update ON touchpoints",
+    """
+    CREATE TRIGGER touchpoints_contact_agg_update
+    AFTER UPDATE ON touchpoints
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION contact_touchpoint_agg_trigger()
+    """,
+    "DROP TRIGGER IF EXISTS touchpoints_contact_agg_delete ON touchpoints",
+    """
+    CREATE TRIGGER touchpoints_contact_agg_delete
+    AFTER DELETE ON touchpoints
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION contact_touchpoint_agg_trigger()
+    """,
+)
+
+CONTACT_AGGREGATES_DDL = (
+    REFRESH_CONTACT_AGGREGATES_FUNCTION,
+    CONTACT_AGGREGATES_TRIGGER_FUNCTION,
+    *CONTACT_AGGREGATES_TRIGGERS,
+)
+
+for _statement in CONTACT_AGGREGATES_DDL:
+    event.listen(Touchpoint.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
+def install_contact_aggregates(connection) -> None:
+    """
+    Install the contact aggregate triggers on an existing database and backfill
+
+    Tables created through Base.metadata.create_all() get the triggers
+    automatically; this is for databases whose tables predate them (add the
+    new contacts aggregate columns first).
+
+    Args:
+        connection: SQLAlchemy connection (inside a transaction)
+    """
+    for statement in CONTACT_AGGREGATES_DDL:
+        connection.execute(text(statement))
+    connection.execute(text("SELECT refresh_contact_touchpoint_aggregates(ARRAY(SELECT id FROM contacts))"))
+
+
+# Latest conversion stage reached by a touchpoint's contact at or before the touch
+_STAGE_AT_TOUCH_SQL = """
+    SELECT c.to_stage FROM conversions AS c
+    WHERE c.contact_id = {touchpoint}.contact_id AND c.occurred_at <= {touchpoint}.occurred_at
+    ORDER BY c.occurred_at DESC
+    LIMIT 1
+"""
+
+TOUCHPOINT_LIFECYCLE_STAGE_DDL = (
+    f"""
+    CREATE OR REPLACE FUNCTION touchpoint_lifecycle_stage_trigger()
+    RETURNS trigger AS $$
+    BEGIN
+        IF NEW.lifecycle_stage_at_touch IS NULL THEN
+            NEW.lifecycle_stage_at_touch := ({_STAGE_AT_TOUCH_SQL.format(touchpoint="NEW")});
+        END IF;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+    "DROP TRIGGER IF EXISTS touchpoints_lifecycle_stage ON touchpoints",
+    """
+    CREATE TRIGGER touchpoints_lifecycle_stage
+    BEFORE INSERT ON touchpoints
+    FOR EACH ROW EXECUTE FUNCTION touchpoint_lifecycle_stage_trigger()
+    """,
+)
+
+# A new conversion changes the stage of the contact's touchpoints from that time on
+CONVERSION_LIFECYCLE_STAGE_DDL = (
+    f"""
+    CREATE OR REPLACE FUNCTION conversion_lifecycle_stage_trigger()
+    RETURNS trigger AS $$
+    BEGIN
+        UPDATE touchpoints AS t
+        SET lifecycle_stage_at_touch = ({_STAGE_AT_TOUCH_SQL.format(touchpoint="t")})
+        WHERE t.contact_id = NEW.contact_id AND t.occurred_at >= NEW.occurred_at;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """,
+    "DROP TRIGGER IF EXISTS conversions_lifecycle_stage ON conversions",
+    """
+    CREATE TRIGGER conversions_lifecycle_stage
+    AFTER INSERT ON conversions
+    FOR EACH ROW EXECUTE FUNCTION conversion_lifecycle_stage_trigger()
+    """,
+)
+
+for _statement in TOUCHPOINT_LIFECYCLE_STAGE_DDL:
+    event.listen(Touchpoint.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in CONVERSION_LIFECYCLE_STAGE_DDL:
+    event.listen(Conversion.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
+def install_touchpoint_lifecycle_stages(connection) -> None:
+    """
+    Install the lifecycle_stage_at_touch triggers on an existing database and backfill
+
+    Args:
+        connection: SQLAlchemy connection (inside a transaction)
+    """
+    for statement in TOUCHPOINT_LIFECYCLE_STAGE_DDL + CONVERSION_LIFECYCLE_STAGE_DDL:
+        connection.execute(text(statement))
+    connection.execute(text(
+        f"UPDATE touchpoints AS t SET lifecycle_stage_at_touch = ({_STAGE_AT_TOUCH_SQL.format(touchpoint='t')})"
+    ))
+
+
+CAMPAIGN_PERFORMANCE_VIEW_DDL = (
+    """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS campaign_performance_mv AS
+    SELECT
+        utm_campaign,
+        MODE() WITHIN GROUP (ORDER BY utm_source) AS utm_source,
+        MODE() WITHIN GROUP (ORDER BY utm_medium) AS utm_medium,
+        COUNT(*) AS total_touchpoints,
+        COUNT(DISTINCT contact_id) AS unique_contacts,
+        COALESCE(SUM(attributed_value), 0) AS total_attributed_value,
+        NOW() AS refreshed_at
+    FROM touchpoints
+    WHERE utm_campaign IS NOT NULL
+    GROUP BY utm_campaign
+    WITH DATA
+    """,
+    # Unique index required for REFRESH ... CONCURRENTLY
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_campaign_performance_mv_utm ON campaign_performance_mv (utm_campaign)",
+)
+
+REFRESH_CAMPAIGN_PERFORMANCE_SQL = "REFRESH MATERIALIZED VIEW CONCURRENTLY campaign_performance_mv"
+
+# Advisory lock held by the worker refreshing campaign_performance_mv
+CAMPAIGN_PERFORMANCE_REFRESH_LOCK_ID = 4_210_001
+
+# Whether campaign_performance_mv is empty or older than :max_age_seconds
+CAMPAIGN_PERFORMANCE_STALE_SQL = (
+    "SELECT COALESCE(MAX(refreshed_at) < NOW() - make_interval(secs => :max_age_seconds), TRUE) "
+    "FROM campaign_performance_mv"
+)
+
+for _statement in CAMPAIGN_PERFORMANCE_VIEW_DDL:
+    event.listen(Touchpoint.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
+def install_campaign_performance_view(connection) -> None:
+    """
+    Create campaign_performance_mv on an existing database
+
+    Args:
+        connection: SQLAlchemy connection (inside a transaction)
+    """
+    for statement in CAMPAIGN_PERFORMANCE_VIEW_DDL:
+        connection.execute(text(statement))
+
+
+# ============================================================================
+# Migrations
+# ============================================================================
+
+# Moves attribution_results.touchpoint_attributions JSONB ({touchpoint_id: {weight, value}}) into rows
+ATTRIBUTION_CREDITS_BACKFILL_SQL = """
+INSERT INTO attribution_result_touchpoints (attribution_result_id, touchpoint_id, weight, value)
+SELECT
+    ar.id,
+    credit.key,
+    CAST(credit.value ->> 'weight' AS DOUBLE PRECISION),
+    CAST(credit.value ->> 'value' AS DOUBLE PRECISION)
+FROM attribution_results AS ar
+CROSS JOIN LATERAL jsonb_each(ar.touchpoint_attributions) AS credit
+WHERE ar.touchpoint_attributions IS NOT NULL
+ON CONFLICT DO NOTHING
+"""
+
+
+def migrate_touchpoint_attributions(connection) -> None:
+    """
+    Backfill attribution_result_touchpoints from the old JSONB column, then drop it
+
+    Args:
+        connection: SQLAlchemy connection (inside a transaction)
+    """
+    connection.execute(text(ATTRIBUTION_CREDITS_BACKFILL_SQL))
+    connection.execute(text("ALTER TABLE attribution_results DROP COLUMN IF EXISTS touchpoint_attributions"))
@@ -0,0 +1,164 @@
+"""
+Time Partition Maintenance
+
+touchpoints and conversions are range-partitioned by month on occurred_at.
+This module pre-creates upcoming monthly partitions, backfills partitions for
+rows that landed in the default partition, and drops whole partitions that
+fall outside a retention window, which is O(1) per month instead of a
+row-by-row DELETE.
+"""
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import text
+from loguru import logger
+
+PARTITIONED_TABLES = ("touchpoints", "conversions")
+
+# Advisory lock held by the worker running partition maintenance
+PARTITION_MAINTENANCE_LOCK_ID = 4_210_002
+
+
+def _month_start(value: datetime) -> datetime:
+    """Truncate a datetime to the first instant of its month"""
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    """Shift a month-start datetime by a number of months"""
+    month_index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=month_index // 12, month=month_index % 12 + 1)
+
+
+def partition_name(table_name: str, month: datetime) -> str:
+    """Name of the monthly partition holding the given month (e.g. touchpoints_2024_01)"""
+    return f"{table_name}_{month:%Y_%m}"
+
+
+def default_partition_name(table_name: str) -> str:
+    """Name of the catch-all partition for rows without a monthly partition"""
+    return f"{table_name}_default"
+
+
+def _earliest_default_row(connection, table_name: str) -> Optional[datetime]:
+    """Oldest occurred_at still sitting in the default partition, if any"""
+    return connection.execute(
+        text(f"SELECT min(occurred_at) FROM {default_partition_name(table_name)}")
+    ).scalar()
+
+
+def _create_partition(connection, table_name: str, month: datetime, next_month: datetime) -> None:
+    """
+    Create one monthly partition, moving its rows out of the default partition
+
+    Postgres refuses to create a partition while the default partition holds
+    rows in its range, so those rows are copied into a standalone table which
+    is then attached in their place.
+    """
+    name = partition_name(table_name, month)
+    if connection.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}).scalar():
+        return
+
+    default_name = default_partition_name(table_name)
+    bounds = f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{next_month:%Y-%m-%d}')"
+    in_range = f"occurred_at >= '{month:%Y-%m-%d}' AND occurred_at < '{next_month:%Y-%m-%d}'"
+
+    if not connection.execute(text(f"SELECT EXISTS (SELECT 1 FROM {default_name} WHERE {in_range})")).scalar():
+        connection.execute(text(f"CREATE TABLE {name} PARTITION OF {table_name} {bounds}"))
+        return
+
+    connection.execute(text(f"CREATE TABLE {name} (LIKE {table_name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    moved = connection.execute(text(f"INSERT INTO {name} SELECT * FROM {default_name} WHERE {in_range}")).rowcount
+    connection.execute(text(f"DELETE FROM {default_name} WHERE {in_range}"))
+    connection.execute(text(f"ALTER TABLE {table_name} ATTACH PARTITION {name} {bounds}"))
+    logger.info(f"Moved {moved} rows from {default_name} into new partition {name}")
+
+
+def create_monthly_partitions(connection, table_name: str, start: datetime, end: datetime) -> List[str]:
+    """
+    Create monthly partitions covering [start, end)
+
+    Each month runs in its own savepoint, so a month that cannot be created
+    is logged and skipped without aborting the rest of the transaction.
+
+    Args:
+        connection: SQLAlchemy connection (inside a transaction)
+        table_name: Partitioned parent table
+        start: First month to cover
+        end: Exclusive end of the covered range
+
+    Returns:
+        Names of the partitions ensured
+    """
+    partitions = []
+    month = _month_start(start)
+    while month < end:
+        next_month = _add_months(month, 1)
+        name = partition_name(table_name, month)
+        try:
+            with connection.begin_nested():
+                _create_partition(connection, table_name, month, next_month)
+            partitions.append(name)
+        except Exception as e:
+            logger.warning(f"Could not create partition {name}: {e}")
+        month = next_month
+    return partitions
+
+
+def drop_partitions_before(connection, table_name: str, cutoff: datetime) -> List[str]:
+    """
+    Drop monthly partitions whose whole month ends on or before the cutoff
+
+    Args:
+        connection: SQLAlchemy connection (inside a transaction)
+        table_name: Partitioned parent table
+        cutoff: Oldest timestamp to retain
+
+    Returns:
+        Names of the dropped partitions
+    """
+    result = connection.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class AS parent ON pg_inherits.inhparent = parent.oid "
+            "JOIN pg_class AS child ON pg_inherits.inhrelid = child.oid "
+            "WHERE parent.relname = :table_name"
+        ),
+        {"table_name": table_name}
+    )
+
+    dropped = []
+    for name in sorted(row[0] for row in result):
+        try:
+            month = datetime.strptime(name[len(table_name) + 1:], "%Y_%m")
+        except ValueError:
+            continue  # e.g. the default partition
+        if _add_months(month, 1) <= cutoff:
+            connection.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            dropped.append(name)
+
+    if dropped:
+        logger.info(f"Dropped {len(dropped)} {table_name} partitions older than {cutoff:%Y-%m-%d}")
+    return dropped
+
+
+def maintain_partitions(connection, months_ahead: int = 3, retention_months: int = 0) -> None:
+    """
+    Ensure monthly partitions exist for every partitioned table
+
+    Partitions are created from the oldest month still in the default
+    partition through the next few months, then partitions older than the
+    retention window are dropped.
+
+    Args:
+        connection: SQLAlchemy connection (inside a transaction)
+        months_ahead: Number of future months to pre-create
+        retention_months: Months of history to keep (0 keeps everything)
+    """
+    current = _month_start(datetime.utcnow())
+    end = _add_months(current, months_ahead + 1)
+    for table_name in PARTITIONED_TABLES:
+        earliest = _earliest_default_row(connection, table_name)
+        start = min(_month_start(earliest), current) if earliest else current
+        create_monthly_partitions(connection, table_name, start, end)
+        if retention_months:
+            drop_partitions_before(connection, table_name, _add_months(current, -retention_months))
@@ -0,0 +1,44 @@
+"""
+Async Database Engine and Session Factory
+
+This module builds the async SQLAlchemy engine used by the API server's
+DB-backed routes, so database waits overlap on the event loop instead of
+blocking worker threads.
+"""
+from typing import Union
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker, create_async_engine
+
+from config import settings
+
+
+def get_async_database_url(database_url: str) -> str:
+    """Point a plain PostgreSQL URL at the asyncpg driver"""
+    if database_url.startswith("postgresql://"):
+        return database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return database_url
+
+
+engine = create_async_engine(
+    get_async_database_url(settings.database_url),
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
+    # Rows per multi-row INSERT ... RETURNING when the ORM executes insert bursts
+    insertmanyvalues_page_size=1000
+)
+
+AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def try_advisory_xact_lock(connection: Union[AsyncConnection, AsyncSession], lock_id: int) -> bool:
+    """
+    Try to take a transaction-scoped PostgreSQL advisory lock
+
+    Returns False immediately if another transaction holds it. The lock is
+    released when the current transaction commits or rolls back, so it never
+    outlives a pooled connection's checkout.
+    """
+    return bool(await connection.scalar(text("SELECT pg_try_advisory_xact_lock(:lock_id)"), {"lock_id": lock_id}))
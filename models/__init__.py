@@ -5,6 +5,7 @@ from .attribution import (
     UTMParameters,
     ClickID,
     Touchpoint,
+    TOUCHPOINT_ADAPTER,
     Contact,
     AttributionModel,
     ConversionEvent
@@ -16,6 +17,7 @@ __all__ = [
     'UTMParameters',
     'ClickID',
     'Touchpoint',
+    'TOUCHPOINT_ADAPTER',
     'Contact',
     'AttributionModel',
     'ConversionEvent'
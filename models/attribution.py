@@ -2,10 +2,34 @@
 Data models for attribution tracking
 """
 from datetime import datetime
-from typing import Optional, List, Dict
-from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Optional, List, Dict, Tuple
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 from enum import Enum
 import re
+import string
+
+# Immutable input models; surrounding whitespace is stripped before validation
+FROZEN_STRIPPED_CONFIG = ConfigDict(frozen=True, str_strip_whitespace=True)
+
+# Validation patterns, compiled once at import
+_UTM_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_CLICKID_RE = re.compile(r'^[a-zA-Z0-9_.-]+$')
+
+# Email check without the regex engine (same rules as local@host.tld with a 2+ letter TLD)
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_HOST_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+
+
+def _is_valid_email(value: str) -> bool:
+    """Check local@host.tld with allowed characters and an alphabetic TLD"""
+    local, _, domain = value.rpartition('@')
+    host, dot, tld = domain.rpartition('.')
+    return (
+        bool(local and host and dot)
+        and len(tld) >= 2 and tld.isascii() and tld.isalpha()
+        and _EMAIL_LOCAL_CHARS.issuperset(local)
+        and _EMAIL_HOST_CHARS.issuperset(host)
+    )
 
 
 class LifecycleStage(str, Enum):
@@ -36,6 +60,8 @@ class TouchpointType(str, Enum):
 
 class UTMParameters(BaseModel):
     """UTM tracking parameters with validation"""
+    model_config = FROZEN_STRIPPED_CONFIG
+
     utm_source: Optional[str] = Field(None, max_length=255)
     utm_medium: Optional[str] = Field(None, max_length=255)
     utm_campaign: Optional[str] = Field(None, max_length=255)
@@ -46,14 +72,10 @@ class UTMParameters(BaseModel):
     @classmethod
     def validate_utm_parameter(cls, v: Optional[str]) -> Optional[str]:
         """Validate UTM parameters - lowercase, no spaces, alphanumeric with hyphens/underscores"""
-        if v is None:
-            return v
-        # Strip whitespace
-        v = v.strip()
         if not v:
             return None
         # Check for invalid characters
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not _UTM_RE.match(v):
             raise ValueError('UTM parameters must contain only letters, numbers, hyphens, and underscores')
         # Convert to lowercase for consistency
         return v.lower()
@@ -61,6 +83,8 @@ class UTMParameters(BaseModel):
 
 class ClickID(BaseModel):
     """Ad platform click IDs with validation"""
+    model_config = FROZEN_STRIPPED_CONFIG
+
     gclid: Optional[str] = Field(None, max_length=500)  # Google Ads
     fbclid: Optional[str] = Field(None, max_length=500)  # Facebook Ads
     msclkid: Optional[str] = Field(None, max_length=500)  # Microsoft Ads
@@ -70,19 +94,18 @@ class ClickID(BaseModel):
     @classmethod
     def validate_click_id(cls, v: Optional[str]) -> Optional[str]:
         """Validate click IDs - alphanumeric and basic special characters only"""
-        if v is None:
-            return v
-        v = v.strip()
         if not v:
             return None
         # Allow alphanumeric, hyphens, underscores, and dots
-        if not re.match(r'^[a-zA-Z0-9_.-]+$', v):
+        if not _CLICKID_RE.match(v):
             raise ValueError('Click IDs must contain only letters, numbers, hyphens, underscores, and dots')
         return v
 
 
 class Touchpoint(BaseModel):
     """Individual marketing touchpoint"""
+    model_config = FROZEN_STRIPPED_CONFIG
+
     touchpoint_id: str = Field(default_factory=lambda: f"tp_{datetime.utcnow().timestamp()}")
     contact_id: str
     timestamp: datetime
@@ -99,8 +122,14 @@ class Touchpoint(BaseModel):
     additional_data: Dict = Field(default_factory=dict)
 
 
+# Validates a whole list of touchpoint dicts in one pass
+TOUCHPOINT_ADAPTER = TypeAdapter(List[Touchpoint])
+
+
 class Contact(BaseModel):
     """HubSpot contact with attribution data and validation"""
+    model_config = FROZEN_STRIPPED_CONFIG
+
     contact_id: str = Field(..., min_length=1, max_length=100)
     email: str = Field(..., max_length=255)
     lifecycle_stage: LifecycleStage
@@ -108,7 +137,7 @@ class Contact(BaseModel):
     updated_at: datetime
     first_touch: Optional[Touchpoint] = None
     last_touch: Optional[Touchpoint] = None
-    all_touchpoints: List[Touchpoint] = Field(default_factory=list)
+    all_touchpoints: Tuple[Touchpoint, ...] = ()
     attributed_revenue: Optional[float] = Field(None, ge=0)
     custom_properties: Dict = Field(default_factory=dict)
 
@@ -116,18 +145,10 @@ class Contact(BaseModel):
     @classmethod
     def validate_email(cls, v: str) -> str:
         """Validate email format"""
-        if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', v):
+        if not _is_valid_email(v):
             raise ValueError('Invalid email format')
         return v.lower()
 
-    @field_validator('contact_id')
-    @classmethod
-    def validate_contact_id(cls, v: str) -> str:
-        """Validate contact ID is not empty"""
-        if not v or not v.strip():
-            raise ValueError('Contact ID cannot be empty')
-        return v.strip()
-
 
 class AttributionModel(BaseModel):
     """Attribution calculation result with validation"""
@@ -6,13 +6,6 @@ from .ad_platform_signaling import (
     FacebookAdsConnector,
     LinkedInAdsConnector
 )
-from .governance_enablement import (
-    UTMStandardsManager,
-    TrackingURLBuilder,
-    DataQualityAuditor,
-    TeamEnablement,
-    SystemScalability
-)
 
 __all__ = [
     'CRMAttributionManager',
@@ -20,10 +13,5 @@ __all__ = [
     'AdPlatformSignalingManager',
     'GoogleAdsConnector',
     'FacebookAdsConnector',
-    'LinkedInAdsConnector',
-    'UTMStandardsManager',
-    'TrackingURLBuilder',
-    'DataQualityAuditor',
-    'TeamEnablement',
-    'SystemScalability'
+    'LinkedInAdsConnector'
 ]
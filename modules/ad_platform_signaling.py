@@ -8,15 +8,27 @@ This module handles:
 - Click ID capture and linking
 - Campaign performance analysis
 """
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Any, Tuple, Mapping, Union
+from types import MappingProxyType
+from datetime import datetime, timedelta, timezone
 from loguru import logger
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
+import gzip
+import inspect
+import aiohttp
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import hashlib
+import re
+import threading
 import time
-from hubspot import HubSpot
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from ratelimit import limits, sleep_and_retry
+from cachetools import TTLCache
+from pydantic import TypeAdapter, ValidationError as PydanticValidationError
+from typing_extensions import NotRequired, TypedDict
+from hubspot.crm.contacts import BatchReadInputSimplePublicObjectId
 
 from models.attribution import ConversionEvent, LifecycleStage
 from config import settings
@@ -27,7 +39,531 @@ from modules.exceptions import (
     APIRateLimitError,
     AuthenticationError
 )
+from modules.batching import AsyncMicroBatcher
+from modules.conversion_queue import ConversionQueue, ConversionUploadWorker
+from modules.hubspot_client import get_hubspot_client
 from modules.logging_utils import with_correlation_id, log_with_context
+from modules.rate_limiting import TokenBucket, AdaptiveTokenBucket
+
+# Conversion uploads in flight at once per send_conversions_many() call
+MAX_CONCURRENT_UPLOADS = 20
+
+# Conversion sends retry rate-limit and connection errors, backing off 2s, 4s, ... up to the cap
+MAX_SEND_ATTEMPTS = 3
+MAX_RETRY_WAIT_SECONDS = 10
+RETRYABLE_ERRORS = (APIConnectionError, APIRateLimitError)
+
+# HTTP statuses reported as an invalid or expired access token
+AUTH_ERROR_STATUSES = frozenset({401, 403})
+
+# gRPC statuses of Google Ads calls that are worth retrying
+GOOGLE_ADS_CONNECTION_STATUSES = frozenset({"UNAVAILABLE", "DEADLINE_EXCEEDED", "ABORTED"})
+GOOGLE_ADS_RATE_LIMIT_STATUS = "RESOURCE_EXHAUSTED"
+
+# Payloads are serialized with orjson and posted as raw bodies
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Batch bodies are gzip-compressed when CONVERSION_BATCH_GZIP is enabled
+GZIP_HEADERS = {"Content-Encoding": "gzip"}
+GZIP_COMPRESS_LEVEL = 3
+
+# Google Ads conversion_date_time format
+GOOGLE_ADS_DATE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S%z"
+
+# Refresh the Google Ads OAuth token this long before it expires
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# How long send_conversion_batched() waits for more conversions before flushing
+CONVERSION_BATCH_WAIT_SECONDS = 0.1
+
+# Batch uploads in flight at once per send_conversions_chunked() call or conversion batcher
+MAX_CONCURRENT_BATCHES = 4
+
+# Batch uploads skip event IDs already uploaded within this window (webhook replays, workflow retries)
+SENT_EVENT_ID_TTL_SECONDS = 3600
+SENT_EVENT_ID_CACHE_SIZE = 100_000
+
+# Threads sending one lifecycle conversion to its platforms in parallel
+SIGNALING_WORKERS = 8
+
+_sha256 = hashlib.sha256
+
+# Lowercase 64-character hex: a value the caller already SHA-256 hashed
+_IS_SHA256_HEX = re.compile(r"[0-9a-f]{64}").fullmatch
+
+# ASCII A-Z -> a-z, for lowercasing UTF-8 bytes in one translate() call
+_ASCII_LOWER = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
+# The ASCII characters str.strip() removes (bytes.strip() alone misses \x1c-\x1f)
+_ASCII_WHITESPACE = bytes(c for c in range(128) if chr(c).isspace())
+
+
+def _normalize(value: str) -> bytes:
+    """Lowercase, strip and UTF-8 encode a value for hashing"""
+    if value.isascii():
+        return value.encode().strip(_ASCII_WHITESPACE).translate(_ASCII_LOWER)
+    # Non-ASCII needs Unicode case folding and whitespace rules
+    return value.lower().strip().encode()
+
+
+def _hash_batch(values: List[str]) -> List[str]:
+    """SHA-256 hex digests of normalized (lowercased, stripped) values"""
+    return [_sha256(_normalize(value)).hexdigest() for value in values]
+
+
+def hash_user_data_batch(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Hash the string fields of many user-data dicts in one flattened pass
+
+    String values are normalized and SHA-256 hashed as ad platforms require,
+    except values that already are SHA-256 hex digests; other truthy values
+    pass through unchanged and empty values are dropped.
+
+    Args:
+        records: User-data dicts (e.g. one per event in a batch)
+
+    Returns:
+        Hashed dicts in the same order, with keys in their original order
+    """
+    hashed_records = [{} for _ in records]
+    slots = []
+    values = []
+
+    for hashed, data in zip(hashed_records, records):
+        for key, value in data.items():
+            if value and isinstance(value, str) and not _IS_SHA256_HEX(value):
+                hashed[key] = None  # Placeholder keeps key order
+                slots.append((hashed, key))
+                values.append(value)
+            elif value:
+                hashed[key] = value
+
+    for (hashed, key), digest in zip(slots, _hash_batch(values)):
+        hashed[key] = digest
+
+    return hashed_records
+
+
+@functools.lru_cache(maxsize=10_000)
+def _hashed_contact_fields(
+    email: Optional[str],
+    firstname: Optional[str],
+    lastname: Optional[str]
+) -> Tuple[Tuple[str, str], ...]:
+    """Hashed em/fn/ln of a contact, cached so repeat lifecycle transitions skip the hashing"""
+    return tuple(hash_user_data_batch([{"em": email, "fn": firstname, "ln": lastname}])[0].items())
+
+
+class _AsyncSession:
+    """
+    Lazily created aiohttp session shared by the connectors' async upload paths
+
+    One pooled session (and its keep-alive TLS connections) is reused for
+    every upload on an event loop; a new one is opened if the loop changes.
+    """
+
+    def __init__(self, limit: int = 50, keepalive_timeout: int = 30):
+        self.limit = limit
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self) -> aiohttp.ClientSession:
+        """Get the session for the running event loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(limit=self.limit, keepalive_timeout=self.keepalive_timeout)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+
+_ASYNC_SESSION = _AsyncSession()
+
+
+async def close_async_session() -> None:
+    """Close the connectors' shared aiohttp session (call on application shutdown)"""
+    await _ASYNC_SESSION.close()
+
+
+async def _gather_limited(coros: List[Any], limit: int = MAX_CONCURRENT_UPLOADS) -> List[Any]:
+    """Run coroutines concurrently, at most limit at a time, returning results or exceptions in order"""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
+
+
+def _retry_after(headers: Any) -> Optional[int]:
+    """Seconds from a Retry-After response header, if the platform sent one"""
+    value = headers.get("Retry-After") if headers else None
+    return int(value) if value and value.isdigit() else None
+
+
+def _retry_wait(error: Exception, attempt: int) -> float:
+    """Seconds to wait before the next attempt: the platform's Retry-After if given, else exponential backoff"""
+    if isinstance(error, APIRateLimitError) and error.retry_after:
+        return min(error.retry_after, MAX_RETRY_WAIT_SECONDS)
+    return min(2 ** (attempt + 1), MAX_RETRY_WAIT_SECONDS)
+
+
+def _google_ads_error(error: Exception) -> Exception:
+    """
+    Map a Google Ads client error to the exception to raise
+
+    Transient gRPC failures become APIConnectionError / APIRateLimitError so
+    _retry_transient retries them; anything else is a SyncError.
+    """
+    # GoogleAdsException wraps the failed gRPC call; grpc.RpcError is the call itself
+    call = getattr(error, "error", error)
+    code = getattr(call, "code", None)
+    status = code() if callable(code) else getattr(error, "grpc_status_code", None)
+    status_name = getattr(status, "name", None)
+
+    if status_name == GOOGLE_ADS_RATE_LIMIT_STATUS:
+        return APIRateLimitError("Google Ads")
+    if status_name in GOOGLE_ADS_CONNECTION_STATUSES:
+        return APIConnectionError("Google Ads", str(error))
+    return SyncError("Google Ads", str(error))
+
+
+def _retry_transient(func):
+    """Retry a sync or async send on RETRYABLE_ERRORS, re-raising the last error after MAX_SEND_ATTEMPTS"""
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            for attempt in range(MAX_SEND_ATTEMPTS):
+                try:
+                    return await func(*args, **kwargs)
+                except RETRYABLE_ERRORS as e:
+                    if attempt == MAX_SEND_ATTEMPTS - 1:
+                        raise
+                    wait = _retry_wait(e, attempt)
+                    logger.warning(f"{func.__qualname__} failed ({e}), retrying in {wait}s")
+                    await asyncio.sleep(wait)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(MAX_SEND_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt == MAX_SEND_ATTEMPTS - 1:
+                    raise
+                wait = _retry_wait(e, attempt)
+                logger.warning(f"{func.__qualname__} failed ({e}), retrying in {wait}s")
+                time.sleep(wait)
+
+    return wrapper
+
+
+# "%z" suffix per fixed-offset timezone (zone-rule tzinfos vary with DST and are not cached)
+_UTC_OFFSET_SUFFIXES: Dict[timezone, str] = {}
+
+
+def _format_google_ads_time(value: datetime) -> str:
+    """Format a datetime like value.strftime(GOOGLE_ADS_DATE_TIME_FORMAT), without re-parsing the format per call"""
+    tz = value.tzinfo
+    if tz is None:
+        suffix = ""
+    elif type(tz) is timezone:
+        suffix = _UTC_OFFSET_SUFFIXES.get(tz)
+        if suffix is None:
+            suffix = _UTC_OFFSET_SUFFIXES[tz] = value.strftime("%z")
+    else:
+        suffix = value.strftime("%z")
+
+    return (
+        f"{value.year:04d}-{value.month:02d}-{value.day:02d} "
+        f"{value.hour:02d}:{value.minute:02d}:{value.second:02d}{suffix}"
+    )
+
+
+def _build_click_conversion(click_conversion_type: Any, conv: Dict[str, Any]) -> Any:
+    """Build a Google Ads ClickConversion from a send_conversions_batch() entry in one constructor call"""
+    fields = {
+        "gclid": conv["gclid"],
+        "conversion_action": conv["conversion_action"],
+        "conversion_date_time": _format_google_ads_time(conv["conversion_time"])
+    }
+    if conv.get("conversion_value"):
+        fields["conversion_value"] = conv["conversion_value"]
+        fields["currency_code"] = conv.get("currency_code", "EUR")
+
+    return click_conversion_type(**fields)
+
+
+class GoogleAdsBatchConversion(TypedDict):
+    """GoogleAdsConnector.send_conversions_batch() entry"""
+    gclid: str
+    conversion_action: str
+    conversion_time: datetime
+    conversion_value: NotRequired[Optional[float]]
+    currency_code: NotRequired[str]
+
+
+class FacebookBatchEvent(TypedDict):
+    """FacebookAdsConnector.send_conversions_batch() entry"""
+    event_name: str
+    event_time: datetime
+    user_data: Dict[str, Any]
+    fbclid: NotRequired[Optional[str]]
+    fbc: NotRequired[Optional[str]]
+    fbp: NotRequired[Optional[str]]
+    value: NotRequired[Optional[float]]
+    currency: NotRequired[str]
+    event_source_url: NotRequired[Optional[str]]
+    custom_data: NotRequired[Optional[Dict[str, Any]]]
+    event_id: NotRequired[Optional[str]]
+
+
+class LinkedInBatchConversion(TypedDict):
+    """LinkedInAdsConnector.send_conversions_batch() entry"""
+    conversion_id: str
+    conversion_time: datetime
+    user_data: Dict[str, Any]
+    value: NotRequired[Optional[float]]
+    currency_code: NotRequired[str]
+    event_id: NotRequired[Optional[str]]
+
+
+GOOGLE_ADS_BATCH_ADAPTER = TypeAdapter(List[GoogleAdsBatchConversion])
+FACEBOOK_BATCH_ADAPTER = TypeAdapter(List[FacebookBatchEvent])
+LINKEDIN_BATCH_ADAPTER = TypeAdapter(List[LinkedInBatchConversion])
+
+
+def _validate_batch(adapter: TypeAdapter, field: str, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Validate every batch entry up front in one compiled pass, raising ValidationError on the first bad entry"""
+    try:
+        return adapter.validate_python(entries)
+    except PydanticValidationError as e:
+        error = e.errors()[0]
+        location = ".".join(str(part) for part in error["loc"])
+        raise ValidationError(field, f"Invalid batch entry at {location}: {error['msg']}") from e
+
+
+def _first_occurrences(keys: List[Optional[str]]) -> List[int]:
+    """Indices of the first occurrence of each key, in input order; entries without a key are all kept"""
+    first = {}
+    for index, key in enumerate(keys):
+        first.setdefault(index if key is None else key, index)
+    return list(first.values())
+
+
+class _SentEventIds:
+    """
+    Event IDs a connector uploaded recently, so replays are dropped before the next batch upload
+
+    Only explicit, per-conversion event IDs are remembered; conversions without
+    one are never treated as replays. The memory is per process, so it only
+    saves the upload: across workers sharing the queue, the platforms' own
+    event ID deduplication is what drops a replay.
+    """
+
+    def __init__(self, maxsize: int = SENT_EVENT_ID_CACHE_SIZE, ttl: float = SENT_EVENT_ID_TTL_SECONDS):
+        self._ids = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def unsent(self, event_ids: List[Optional[str]], indices: List[int]) -> List[int]:
+        """The indices without an event ID or whose event ID has not been uploaded within the window"""
+        with self._lock:
+            return [i for i in indices if event_ids[i] is None or event_ids[i] not in self._ids]
+
+    def add(self, event_ids: List[Optional[str]]) -> None:
+        """Record successfully uploaded event IDs"""
+        with self._lock:
+            for event_id in event_ids:
+                if event_id is not None:
+                    self._ids[event_id] = True
+
+
+def _pooled_session(headers: Dict[str, str]) -> requests.Session:
+    """requests.Session with keep-alive connection pooling and default headers"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=0))
+    session.headers.update(headers)
+    return session
+
+
+def _conversion_batcher(connector: Any, name: str) -> AsyncMicroBatcher:
+    """Micro-batcher that flushes queued conversions through connector.send_conversions_batch"""
+
+    async def send_batch(conversions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        result = await asyncio.to_thread(connector.send_conversions_batch, conversions)
+        # The batch endpoints report counts, not per-event results
+        return [{**result, "batched": True} for _ in conversions]
+
+    return AsyncMicroBatcher(
+        send_batch,
+        max_batch_size=connector.BATCH_SIZE,
+        max_wait_seconds=CONVERSION_BATCH_WAIT_SECONDS,
+        max_concurrent_batches=MAX_CONCURRENT_BATCHES,
+        name=f"{name} conversion batcher"
+    )
+
+
+async def _send_in_batches(connector: Any, conversions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Split conversions into BATCH_SIZE chunks and upload them concurrently through send_conversions_batch"""
+    size = connector.BATCH_SIZE
+    results = await _gather_limited(
+        [
+            asyncio.to_thread(connector.send_conversions_batch, conversions[start:start + size])
+            for start in range(0, len(conversions), size)
+        ],
+        limit=MAX_CONCURRENT_BATCHES
+    )
+    failed = sum(1 for result in results if isinstance(result, Exception))
+    return {
+        "success": failed == 0,
+        "total": len(conversions),
+        "batches": len(results),
+        "failed_batches": failed,
+        "results": [
+            {"success": False, "error": str(result)} if isinstance(result, Exception) else result
+            for result in results
+        ]
+    }
+
+
+def _batch_body(payload: Dict[str, Any]) -> Tuple[bytes, Optional[Dict[str, str]]]:
+    """Serialize a batch payload, gzip-compressed if enabled; returns the body and any extra headers"""
+    body = orjson.dumps(payload)
+    if settings.conversion_batch_gzip:
+        return gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL), GZIP_HEADERS
+    return body, None
+
+
+def _batch_item(**kwargs: Any) -> Dict[str, Any]:
+    """Batch entry from send_conversion keyword arguments (unset values omitted)"""
+    return {key: value for key, value in kwargs.items() if value is not None}
+
+
+def _summarize_uploads(results: List[Any]) -> Dict[str, Any]:
+    """Summarize send_conversions_many() results"""
+    failed = sum(1 for result in results if isinstance(result, Exception))
+    return {
+        "success": failed == 0,
+        "total": len(results),
+        "successful": len(results) - failed,
+        "failed": failed,
+        "results": [
+            {"success": False, "error": str(result)} if isinstance(result, Exception) else result
+            for result in results
+        ]
+    }
+
+
+# Static setup guides, built once and shared read-only
+
+GOOGLE_ENHANCED_CONVERSIONS_CONFIG = MappingProxyType({
+    "enabled": True,
+    "required_data": (
+        "email",
+        "phone_number",
+        "first_name",
+        "last_name",
+        "country",
+        "postal_code"
+    ),
+    "hashing": "SHA256",
+    "instructions": (
+        "Enable enhanced conversions in Google Ads account",
+        "Add enhanced conversion tag to website",
+        "Pass hashed user data with conversions",
+        "Verify data quality in Google Ads interface"
+    )
+})
+
+FACEBOOK_CONVERSION_EVENTS = (
+    MappingProxyType({
+        "name": "Lead",
+        "description": "User becomes a lead (lifecycle stage change)",
+        "hubspot_trigger": "lifecyclestage = 'lead'"
+    }),
+    MappingProxyType({
+        "name": "MQL",
+        "description": "Marketing Qualified Lead",
+        "hubspot_trigger": "lifecyclestage = 'marketingqualifiedlead'"
+    }),
+    MappingProxyType({
+        "name": "SQL",
+        "description": "Sales Qualified Lead",
+        "hubspot_trigger": "lifecyclestage = 'salesqualifiedlead'"
+    }),
+    MappingProxyType({
+        "name": "Opportunity",
+        "description": "Opportunity created",
+        "hubspot_trigger": "lifecyclestage = 'opportunity'"
+    }),
+    MappingProxyType({
+        "name": "Purchase",
+        "description": "Customer conversion",
+        "hubspot_trigger": "lifecyclestage = 'customer'"
+    })
+)
+
+HUBSPOT_AD_INTEGRATIONS_GUIDE = MappingProxyType({
+    "google_ads": MappingProxyType({
+        "steps": (
+            "Navigate to Marketing > Ads in HubSpot",
+            "Click 'Connect account' and select Google Ads",
+            "Authenticate with Google account",
+            "Select ad accounts to sync",
+            "Enable automatic sync of campaigns and audiences",
+            "Configure conversion tracking in Google Ads"
+        ),
+        "features": (
+            "Automatic campaign import",
+            "Contact-to-ad click attribution",
+            "Audience sync for remarketing",
+            "ROI reporting"
+        )
+    }),
+    "facebook_ads": MappingProxyType({
+        "steps": (
+            "Navigate to Marketing > Ads in HubSpot",
+            "Click 'Connect account' and select Facebook",
+            "Authenticate with Facebook account",
+            "Select ad accounts to sync",
+            "Set up Facebook Pixel on website",
+            "Configure Conversions API integration"
+        ),
+        "features": (
+            "Campaign performance tracking",
+            "Lead ads integration",
+            "Custom audience sync",
+            "Conversion tracking"
+        )
+    }),
+    "linkedin_ads": MappingProxyType({
+        "steps": (
+            "Navigate to Marketing > Ads in HubSpot",
+            "Click 'Connect account' and select LinkedIn",
+            "Authenticate with LinkedIn account",
+            "Select ad accounts to sync",
+            "Enable LinkedIn Insight Tag",
+            "Set up conversion tracking"
+        ),
+        "features": (
+            "Campaign sync",
+            "Lead gen forms integration",
+            "Matched audiences",
+            "B2B attribution reporting"
+        )
+    })
+})
 
 
 class GoogleAdsConnector:
@@ -37,6 +573,9 @@ class GoogleAdsConnector:
     BATCH_SIZE = 1000
     CALLS_PER_MINUTE = 10
 
+    # Shared across worker processes when Redis is configured
+    RATE_LIMIT = TokenBucket("google_ads", CALLS_PER_MINUTE, 60, settings.redis_url)
+
     def __init__(self):
         self.client_id = settings.google_ads_client_id
         self.client_secret = settings.google_ads_client_secret
@@ -46,7 +585,9 @@ class GoogleAdsConnector:
         self.enabled = bool(self.client_id and self.developer_token and self.refresh_token)
         self._client = None
         self._token_expires_at = None
-        self._conversion_queue = []
+        self._token_lock = threading.Lock()
+        self._stop_token_refresh = threading.Event()
+        self._batcher = _conversion_batcher(self, "Google Ads")
 
         if self.enabled:
             logger.info("Google Ads Connector initialized and enabled")
@@ -55,6 +596,9 @@ class GoogleAdsConnector:
             except Exception as e:
                 logger.error(f"Failed to initialize Google Ads client: {e}")
                 self.enabled = False
+            else:
+                if self._client is not None:
+                    threading.Thread(target=self._token_refresh_loop, name="google-ads-token-refresh", daemon=True).start()
         else:
             logger.info("Google Ads Connector initialized but disabled (missing credentials)")
 
@@ -82,19 +626,60 @@ class GoogleAdsConnector:
             logger.error(f"Error initializing Google Ads client: {e}")
             raise AuthenticationError("Google Ads", str(e))
 
+    def _token_is_fresh(self) -> bool:
+        """Whether the OAuth token is valid for longer than TOKEN_REFRESH_MARGIN"""
+        return bool(self._token_expires_at) and datetime.now() < self._token_expires_at - TOKEN_REFRESH_MARGIN
+
     def _refresh_token_if_needed(self):
-        """Refresh OAuth token if it's about to expire"""
-        if not self._token_expires_at or datetime.now() >= self._token_expires_at - timedelta(minutes=5):
+        """
+        Refresh OAuth token if it's about to expire
+
+        The background refresh thread normally keeps the token fresh, so this
+        is only a fallback (e.g. after clock skew or a failed refresh).
+        """
+        if self._client is None or self._token_is_fresh():
+            return
+
+        with self._token_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self._token_is_fresh():
+                return
             logger.info("Refreshing Google Ads OAuth token")
             self._initialize_client()
 
-    @sleep_and_retry
-    @limits(calls=CALLS_PER_MINUTE, period=60)
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((APIConnectionError, APIRateLimitError))
-    )
+    def _token_refresh_loop(self):
+        """Background thread refreshing the OAuth token shortly before it expires"""
+        while True:
+            wait_seconds = 0.0
+            if self._token_expires_at:
+                wait_seconds = max((self._token_expires_at - TOKEN_REFRESH_MARGIN - datetime.now()).total_seconds(), 0.0)
+
+            if self._stop_token_refresh.wait(wait_seconds):
+                return
+
+            try:
+                self._refresh_token_if_needed()
+            except Exception as e:
+                logger.error(f"Background Google Ads token refresh failed: {e}")
+                # Sends fall back to refreshing inline; try again in a minute
+                if self._stop_token_refresh.wait(60):
+                    return
+
+    def stop_token_refresh(self):
+        """Stop the background OAuth token refresh thread"""
+        self._stop_token_refresh.set()
+
+    def _validate_conversion(self, gclid: str, conversion_action: str, conversion_value: Optional[float]) -> None:
+        """Validate send_conversion arguments"""
+        if not gclid or not gclid.strip():
+            raise ValidationError("gclid", "Google Click ID cannot be empty")
+        if not conversion_action or not conversion_action.strip():
+            raise ValidationError("conversion_action", "Conversion action cannot be empty")
+        if conversion_value is not None and conversion_value < 0:
+            raise ValidationError("conversion_value", "Conversion value cannot be negative")
+
+    @_retry_transient
+    @RATE_LIMIT
     @with_correlation_id
     def send_conversion(
         self,
@@ -127,12 +712,7 @@ class GoogleAdsConnector:
             return {"success": False, "reason": "not_configured"}
 
         # Validate inputs
-        if not gclid or not gclid.strip():
-            raise ValidationError("gclid", "Google Click ID cannot be empty")
-        if not conversion_action or not conversion_action.strip():
-            raise ValidationError("conversion_action", "Conversion action cannot be empty")
-        if conversion_value is not None and conversion_value < 0:
-            raise ValidationError("conversion_value", "Conversion value cannot be negative")
+        self._validate_conversion(gclid, conversion_action, conversion_value)
 
         try:
             self._refresh_token_if_needed()
@@ -149,15 +729,13 @@ class GoogleAdsConnector:
                 }
 
             # Use actual Google Ads API
-            from google.ads.googleads.client import GoogleAdsClient
-
             conversion_upload_service = self._client.get_service("ConversionUploadService")
 
             # Create click conversion
             click_conversion = self._client.get_type("ClickConversion")
             click_conversion.gclid = gclid.strip()
             click_conversion.conversion_action = conversion_action
-            click_conversion.conversion_date_time = conversion_time.strftime("%Y-%m-%d %H:%M:%S%z")
+            click_conversion.conversion_date_time = _format_google_ads_time(conversion_time)
 
             if conversion_value:
                 click_conversion.conversion_value = conversion_value
@@ -191,8 +769,9 @@ class GoogleAdsConnector:
             raise
         except Exception as e:
             logger.error(f"Error sending conversion to Google Ads: {e}")
-            raise SyncError("Google Ads", str(e))
+            raise _google_ads_error(e) from e
 
+    @RATE_LIMIT
     @with_correlation_id
     def send_conversions_batch(
         self,
@@ -221,6 +800,8 @@ class GoogleAdsConnector:
         if len(conversions) > self.BATCH_SIZE:
             raise ValidationError("conversions", f"Batch size cannot exceed {self.BATCH_SIZE}")
 
+        conversions = _validate_batch(GOOGLE_ADS_BATCH_ADAPTER, "conversions", conversions)
+
         try:
             self._refresh_token_if_needed()
 
@@ -234,19 +815,12 @@ class GoogleAdsConnector:
                 }
 
             conversion_upload_service = self._client.get_service("ConversionUploadService")
-            click_conversions = []
-
-            for conv in conversions:
-                click_conversion = self._client.get_type("ClickConversion")
-                click_conversion.gclid = conv["gclid"]
-                click_conversion.conversion_action = conv["conversion_action"]
-                click_conversion.conversion_date_time = conv["conversion_time"].strftime("%Y-%m-%d %H:%M:%S%z")
 
-                if "conversion_value" in conv and conv["conversion_value"]:
-                    click_conversion.conversion_value = conv["conversion_value"]
-                    click_conversion.currency_code = conv.get("currency_code", "EUR")
+            # get_type() looks up the proto descriptor and returns a new instance;
+            # resolve the message class once and construct from it in the loop
+            click_conversion_type = type(self._client.get_type("ClickConversion"))
 
-                click_conversions.append(click_conversion)
+            click_conversions = [_build_click_conversion(click_conversion_type, conv) for conv in conversions]
 
             # Upload batch
             request = self._client.get_type("UploadClickConversionsRequest")
@@ -273,32 +847,43 @@ class GoogleAdsConnector:
             raise
         except Exception as e:
             logger.error(f"Error in batch conversion upload: {e}")
-            raise SyncError("Google Ads", str(e))
+            raise _google_ads_error(e) from e
+
+    async def send_conversion_batched(
+        self,
+        gclid: str,
+        conversion_action: str,
+        conversion_time: datetime,
+        conversion_value: Optional[float] = None,
+        currency_code: str = "EUR"
+    ) -> Dict[str, Any]:
+        """
+        Queue a conversion for the next batch upload and wait for that batch
 
-    def setup_enhanced_conversions(self) -> Dict:
+        Conversions queued within CONVERSION_BATCH_WAIT_SECONDS of each other
+        are sent in one send_conversions_batch() call. Arguments match
+        send_conversion(); the result is the batch's result.
+        """
+        if not self.enabled:
+            logger.warning("Google Ads not configured, skipping conversion sync")
+            return {"success": False, "reason": "not_configured"}
+
+        self._validate_conversion(gclid, conversion_action, conversion_value)
+        return await self._batcher.submit(_batch_item(
+            gclid=gclid.strip(),
+            conversion_action=conversion_action,
+            conversion_time=conversion_time,
+            conversion_value=conversion_value,
+            currency_code=currency_code
+        ))
+
+    def setup_enhanced_conversions(self) -> Mapping[str, Any]:
         """
         Configure enhanced conversions for better attribution
 
-        Returns configuration guide
+        Returns configuration guide (shared, read-only)
         """
-        return {
-            "enabled": True,
-            "required_data": [
-                "email",
-                "phone_number",
-                "first_name",
-                "last_name",
-                "country",
-                "postal_code"
-            ],
-            "hashing": "SHA256",
-            "instructions": [
-                "Enable enhanced conversions in Google Ads account",
-                "Add enhanced conversion tag to website",
-                "Pass hashed user data with conversions",
-                "Verify data quality in Google Ads interface"
-            ]
-        }
+        return GOOGLE_ENHANCED_CONVERSIONS_CONFIG
 
     def get_campaign_performance(self, start_date: str, end_date: str) -> Dict:
         """Fetch campaign performance data from Google Ads"""
@@ -335,6 +920,11 @@ class FacebookAdsConnector:
     BATCH_SIZE = 1000  # Facebook allows up to 1000 events per batch
     CALLS_PER_HOUR = 200
 
+    # Adapts to 429/503 responses; shared across worker processes when Redis is configured
+    RATE_LIMIT = AdaptiveTokenBucket("facebook_ads", CALLS_PER_HOUR, 3600, settings.redis_url)
+
+    _http = _ASYNC_SESSION
+
     def __init__(self):
         self.access_token = settings.facebook_access_token
         self.ad_account_id = settings.facebook_ad_account_id
@@ -343,8 +933,13 @@ class FacebookAdsConnector:
         self.api_version = "v18.0"
         self.base_url = f"https://graph.facebook.com/{self.api_version}"
         self.pixel_id = self.ad_account_id.replace("act_", "") if self.ad_account_id else None
+        self.events_url = f"{self.base_url}/{self.pixel_id}/events"
         self.enabled = bool(self.access_token and self.ad_account_id)
 
+        self._session = _pooled_session(JSON_HEADERS)
+        self._batcher = _conversion_batcher(self, "Facebook Ads")
+        self._sent_event_ids = _SentEventIds()
+
         if self.enabled:
             logger.info("Facebook Ads Connector initialized and enabled")
         else:
@@ -352,25 +947,66 @@ class FacebookAdsConnector:
 
     def _hash_user_data(self, data: Dict[str, Any]) -> Dict[str, str]:
         """Hash user data according to Facebook's requirements"""
-        hashed_data = {}
+        return hash_user_data_batch([data])[0]
 
-        for key, value in data.items():
-            if value and isinstance(value, str):
-                # Normalize and hash
-                normalized = value.lower().strip()
-                hashed_data[key] = hashlib.sha256(normalized.encode()).hexdigest()
-            elif value:
-                hashed_data[key] = value
+    def _validate_conversion(self, event_name: str, user_data: Dict[str, Any], value: Optional[float]) -> None:
+        """Validate send_conversion arguments"""
+        if not event_name or not event_name.strip():
+            raise ValidationError("event_name", "Event name cannot be empty")
+        if not user_data or not isinstance(user_data, dict):
+            raise ValidationError("user_data", "User data must be a non-empty dictionary")
+        if value is not None and value < 0:
+            raise ValidationError("value", "Conversion value cannot be negative")
 
-        return hashed_data
+    def _build_event_data(
+        self,
+        event_name: str,
+        event_time: datetime,
+        user_data: Dict[str, Any],
+        fbclid: Optional[str] = None,
+        fbc: Optional[str] = None,
+        fbp: Optional[str] = None,
+        value: Optional[float] = None,
+        currency: str = "EUR",
+        event_source_url: Optional[str] = None,
+        custom_data: Optional[Dict] = None,
+        event_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build one CAPI event payload (user data hashed) from send_conversion arguments"""
+        # Hash user data if not already hashed
+        hashed_user_data = self._hash_user_data(user_data)
+
+        # Build event data
+        event_timestamp = int(event_time.timestamp())
+        event_data = {
+            "event_name": event_name,
+            "event_time": event_timestamp,
+            "user_data": hashed_user_data,
+            "action_source": "website",
+            "event_id": event_id or f"{event_name}_{event_timestamp}"  # Deduplication ID
+        }
 
-    @sleep_and_retry
-    @limits(calls=CALLS_PER_HOUR, period=3600)
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((APIConnectionError, APIRateLimitError))
-    )
+        # Add click IDs and cookies
+        if fbclid or fbc:
+            event_data["fbc"] = fbc if fbc else f"fb.1.{event_timestamp}.{fbclid}"
+        if fbp:
+            event_data["fbp"] = fbp
+
+        # Add event source URL
+        if event_source_url:
+            event_data["event_source_url"] = event_source_url
+
+        # Add custom data
+        if value or custom_data:
+            event_data["custom_data"] = custom_data or {}
+            if value:
+                event_data["custom_data"]["value"] = value
+                event_data["custom_data"]["currency"] = currency
+
+        return event_data
+
+    @_retry_transient
+    @RATE_LIMIT
     @with_correlation_id
     def send_conversion(
         self,
@@ -412,44 +1048,15 @@ class FacebookAdsConnector:
             return {"success": False, "reason": "not_configured"}
 
         # Validate inputs
-        if not event_name or not event_name.strip():
-            raise ValidationError("event_name", "Event name cannot be empty")
-        if not user_data or not isinstance(user_data, dict):
-            raise ValidationError("user_data", "User data must be a non-empty dictionary")
-        if value is not None and value < 0:
-            raise ValidationError("value", "Conversion value cannot be negative")
+        self._validate_conversion(event_name, user_data, value)
 
         try:
-            url = f"{self.base_url}/{self.pixel_id}/events"
-
-            # Hash user data if not already hashed
-            hashed_user_data = self._hash_user_data(user_data)
-
-            # Build event data
-            event_data = {
-                "event_name": event_name,
-                "event_time": int(event_time.timestamp()),
-                "user_data": hashed_user_data,
-                "action_source": "website",
-                "event_id": f"{event_name}_{int(event_time.timestamp())}"  # Deduplication ID
-            }
-
-            # Add click IDs and cookies
-            if fbclid or fbc:
-                event_data["fbc"] = fbc if fbc else f"fb.1.{int(event_time.timestamp())}.{fbclid}"
-            if fbp:
-                event_data["fbp"] = fbp
+            url = self.events_url
 
-            # Add event source URL
-            if event_source_url:
-                event_data["event_source_url"] = event_source_url
-
-            # Add custom data
-            if value or custom_data:
-                event_data["custom_data"] = custom_data or {}
-                if value:
-                    event_data["custom_data"]["value"] = value
-                    event_data["custom_data"]["currency"] = currency
+            event_data = self._build_event_data(
+                event_name, event_time, user_data, fbclid, fbc, fbp,
+                value, currency, event_source_url, custom_data
+            )
 
             payload = {
                 "data": [event_data],
@@ -457,9 +1064,10 @@ class FacebookAdsConnector:
                 "test_event_code": None  # Set to test code for testing
             }
 
-            response = requests.post(url, json=payload, timeout=30)
+            response = self._session.post(url, data=orjson.dumps(payload), timeout=30)
+            self.RATE_LIMIT.observe(response.status_code)
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
             logger.info(f"Sent conversion to Facebook: {event_name}")
             log_with_context("info", f"Facebook CAPI event sent: {event_name}, events_received={result.get('events_received', 0)}")
@@ -473,10 +1081,12 @@ class FacebookAdsConnector:
 
         except ValidationError:
             raise
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            raise APIConnectionError("Facebook Ads", str(e))
         except requests.exceptions.RequestException as e:
             if hasattr(e.response, 'status_code'):
                 if e.response.status_code == 429:
-                    raise APIRateLimitError("Facebook Ads", retry_after=3600)
+                    raise APIRateLimitError("Facebook Ads", retry_after=_retry_after(e.response.headers))
                 elif e.response.status_code == 401:
                     raise AuthenticationError("Facebook Ads", "Invalid access token")
             logger.error(f"Error sending conversion to Facebook: {e}")
@@ -485,6 +1095,7 @@ class FacebookAdsConnector:
             logger.error(f"Error sending conversion to Facebook: {e}")
             raise SyncError("Facebook Ads", str(e))
 
+    @RATE_LIMIT
     @with_correlation_id
     def send_conversions_batch(
         self,
@@ -509,23 +1120,43 @@ class FacebookAdsConnector:
         if len(events) > self.BATCH_SIZE:
             raise ValidationError("events", f"Batch size cannot exceed {self.BATCH_SIZE}")
 
+        events = _validate_batch(FACEBOOK_BATCH_ADAPTER, "events", events)
+
         try:
-            url = f"{self.base_url}/{self.pixel_id}/events"
+            url = self.events_url
+
+            event_times = [int(event["event_time"].timestamp()) for event in events]
+            # Only an explicit event_id identifies a conversion; events without one are all sent
+            event_ids = [event.get("event_id") for event in events]
+
+            # Re-queued events share an event_id; send each one once, skipping recent uploads
+            unique = self._sent_event_ids.unsent(event_ids, _first_occurrences(event_ids))
+            if len(unique) < len(events):
+                logger.info(f"Deduped {len(events) - len(unique)} Facebook events with repeated event_id")
+            if not unique:
+                return {
+                    "success": True,
+                    "total": len(events),
+                    "duplicates_skipped": len(events),
+                    "events_received": 0,
+                    "messages": []
+                }
 
             batch_data = []
-            for event in events:
-                hashed_user_data = self._hash_user_data(event["user_data"])
+            hashed_batch = hash_user_data_batch([events[i]["user_data"] for i in unique])
+            for i, hashed_user_data in zip(unique, hashed_batch):
+                event, event_time = events[i], event_times[i]
 
                 event_data = {
                     "event_name": event["event_name"],
-                    "event_time": int(event["event_time"].timestamp()),
+                    "event_time": event_time,
                     "user_data": hashed_user_data,
                     "action_source": "website",
-                    "event_id": event.get("event_id", f"{event['event_name']}_{int(event['event_time'].timestamp())}")
+                    "event_id": event_ids[i] or f"{event['event_name']}_{event_time}"
                 }
 
                 if "fbclid" in event or "fbc" in event:
-                    event_data["fbc"] = event.get("fbc", f"fb.1.{int(event['event_time'].timestamp())}.{event.get('fbclid')}")
+                    event_data["fbc"] = event.get("fbc") or f"fb.1.{event_time}.{event.get('fbclid')}"
                 if "fbp" in event:
                     event_data["fbp"] = event["fbp"]
                 if "event_source_url" in event:
@@ -544,9 +1175,12 @@ class FacebookAdsConnector:
                 "access_token": self.access_token
             }
 
-            response = requests.post(url, json=payload, timeout=60)
+            body, headers = _batch_body(payload)
+            response = self._session.post(url, data=body, headers=headers, timeout=60)
+            self.RATE_LIMIT.observe(response.status_code)
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
+            self._sent_event_ids.add([event_ids[i] for i in unique if event_ids[i]])
 
             logger.info(f"Batch sent {len(events)} events to Facebook")
             log_with_context("info", f"Facebook CAPI batch: {result.get('events_received', 0)} events received")
@@ -554,6 +1188,7 @@ class FacebookAdsConnector:
             return {
                 "success": True,
                 "total": len(events),
+                "duplicates_skipped": len(events) - len(unique),
                 "events_received": result.get("events_received", 0),
                 "messages": result.get("messages", [])
             }
@@ -564,41 +1199,147 @@ class FacebookAdsConnector:
             logger.error(f"Error in Facebook batch upload: {e}")
             raise SyncError("Facebook Ads", str(e))
 
-    def setup_conversion_events(self) -> List[Dict]:
+    @_retry_transient
+    @RATE_LIMIT
+    async def send_conversion_async(
+        self,
+        event_name: str,
+        event_time: datetime,
+        user_data: Dict[str, Any],
+        fbclid: Optional[str] = None,
+        fbc: Optional[str] = None,
+        fbp: Optional[str] = None,
+        value: Optional[float] = None,
+        currency: str = "EUR",
+        event_source_url: Optional[str] = None,
+        custom_data: Optional[Dict] = None,
+        event_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        Define custom conversion events for Facebook
+        Send a conversion event over the shared async session
 
-        Returns list of event configurations
+        Same arguments, payload and result as send_conversion(), without
+        blocking the calling thread on the HTTP round-trip.
         """
-        events = [
-            {
-                "name": "Lead",
-                "description": "User becomes a lead (lifecycle stage change)",
-                "hubspot_trigger": "lifecyclestage = 'lead'"
-            },
-            {
-                "name": "MQL",
-                "description": "Marketing Qualified Lead",
-                "hubspot_trigger": "lifecyclestage = 'marketingqualifiedlead'"
-            },
-            {
-                "name": "SQL",
-                "description": "Sales Qualified Lead",
-                "hubspot_trigger": "lifecyclestage = 'salesqualifiedlead'"
-            },
-            {
-                "name": "Opportunity",
-                "description": "Opportunity created",
-                "hubspot_trigger": "lifecyclestage = 'opportunity'"
-            },
-            {
-                "name": "Purchase",
-                "description": "Customer conversion",
-                "hubspot_trigger": "lifecyclestage = 'customer'"
-            }
-        ]
+        if not self.enabled:
+            logger.warning("Facebook Ads not configured, skipping conversion sync")
+            return {"success": False, "reason": "not_configured"}
 
-        return events
+        self._validate_conversion(event_name, user_data, value)
+
+        event_data = self._build_event_data(
+            event_name, event_time, user_data, fbclid, fbc, fbp,
+            value, currency, event_source_url, custom_data, event_id
+        )
+        payload = {
+            "data": [event_data],
+            "access_token": self.access_token
+        }
+
+        try:
+            async with self._http.get().post(
+                self.events_url,
+                data=orjson.dumps(payload),
+                headers=JSON_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                self.RATE_LIMIT.observe(response.status)
+                response.raise_for_status()
+                result = orjson.loads(await response.read())
+        except aiohttp.ClientResponseError as e:
+            if e.status == 429:
+                raise APIRateLimitError("Facebook Ads", retry_after=_retry_after(e.headers))
+            elif e.status == 401:
+                raise AuthenticationError("Facebook Ads", "Invalid access token")
+            logger.error(f"Error sending conversion to Facebook: {e}")
+            raise SyncError("Facebook Ads", str(e))
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            raise APIConnectionError("Facebook Ads", str(e))
+        except aiohttp.ClientError as e:
+            logger.error(f"Error sending conversion to Facebook: {e}")
+            raise SyncError("Facebook Ads", str(e))
+
+        logger.info(f"Sent conversion to Facebook: {event_name}")
+
+        return {
+            "success": True,
+            "events_received": result.get("events_received", 0),
+            "messages": result.get("messages", []),
+            "event_id": event_data["event_id"]
+        }
+
+    async def send_conversion_batched(
+        self,
+        event_name: str,
+        event_time: datetime,
+        user_data: Dict[str, Any],
+        fbclid: Optional[str] = None,
+        fbc: Optional[str] = None,
+        fbp: Optional[str] = None,
+        value: Optional[float] = None,
+        currency: str = "EUR",
+        event_source_url: Optional[str] = None,
+        custom_data: Optional[Dict] = None,
+        event_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Queue an event for the next batch upload and wait for that batch
+
+        Events queued within CONVERSION_BATCH_WAIT_SECONDS of each other are
+        sent in one send_conversions_batch() call. Arguments match
+        send_conversion(); the result is the batch's result.
+        """
+        if not self.enabled:
+            logger.warning("Facebook Ads not configured, skipping conversion sync")
+            return {"success": False, "reason": "not_configured"}
+
+        self._validate_conversion(event_name, user_data, value)
+        return await self._batcher.submit(_batch_item(
+            event_name=event_name,
+            event_time=event_time,
+            user_data=user_data,
+            fbclid=fbclid,
+            fbc=fbc,
+            fbp=fbp,
+            value=value,
+            currency=currency,
+            event_source_url=event_source_url,
+            custom_data=custom_data,
+            event_id=event_id
+        ))
+
+    async def send_conversions_many(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Send many conversion events concurrently over one pooled connection
+
+        Args:
+            events: List of event dicts with keys matching send_conversion_async args
+
+        Returns:
+            Dict with per-event results (in input order) and success/failure counts
+        """
+        results = await _gather_limited([self.send_conversion_async(**event) for event in events])
+        return _summarize_uploads(results)
+
+    async def send_conversions_chunked(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Send any number of events as concurrent BATCH_SIZE batch uploads
+
+        Args:
+            events: List of event dicts, as for send_conversions_batch()
+
+        Returns:
+            Dict with per-batch results (in input order) and event/batch counts
+        """
+        return await _send_in_batches(self, events)
+
+    def setup_conversion_events(self) -> Tuple[Mapping[str, str], ...]:
+        """
+        Define custom conversion events for Facebook
+
+        Returns event configurations (shared, read-only)
+        """
+        return FACEBOOK_CONVERSION_EVENTS
 
 
 class LinkedInAdsConnector:
@@ -608,39 +1349,100 @@ class LinkedInAdsConnector:
     BATCH_SIZE = 1000  # LinkedIn allows up to 1000 conversions per batch
     CALLS_PER_DAY = 100
 
+    # Adapts to 429/503 responses; shared across worker processes when Redis is configured
+    RATE_LIMIT = AdaptiveTokenBucket("linkedin_ads", CALLS_PER_DAY, 86400, settings.redis_url)
+
+    _http = _ASYNC_SESSION
+
     def __init__(self):
         self.access_token = settings.linkedin_access_token
         self.ad_account_id = settings.linkedin_ad_account_id
         self.api_version = "202401"
         self.base_url = "https://api.linkedin.com/rest"
+        self.conversions_url = f"{self.base_url}/conversions"
+        self.headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Content-Type": "application/json",
+            "LinkedIn-Version": self.api_version,
+            "X-RestLi-Protocol-Version": "2.0.0"
+        }
         self.enabled = bool(self.access_token and self.ad_account_id)
 
+        self._session = _pooled_session(self.headers)
+        self._batcher = _conversion_batcher(self, "LinkedIn Ads")
+        self._sent_event_ids = _SentEventIds()
+
         if self.enabled:
             logger.info("LinkedIn Ads Connector initialized and enabled")
         else:
             logger.info("LinkedIn Ads Connector initialized but disabled (missing credentials)")
 
     def _hash_user_data(self, data: Dict[str, Any]) -> Dict[str, str]:
-        """Hash user data according to LinkedIn's requirements"""
-        hashed_data = {}
+        """Hash user data according to LinkedIn's requirements (SHA256)"""
+        return hash_user_data_batch([data])[0]
 
-        # LinkedIn requires SHA256 hashing
-        for key, value in data.items():
-            if value and isinstance(value, str):
-                normalized = value.lower().strip()
-                hashed_data[key] = hashlib.sha256(normalized.encode()).hexdigest()
-            elif value:
-                hashed_data[key] = value
+    def _validate_conversion(self, conversion_id: str, user_data: Dict[str, Any], value: Optional[float]) -> None:
+        """Validate send_conversion arguments"""
+        if not conversion_id or not conversion_id.strip():
+            raise ValidationError("conversion_id", "Conversion ID cannot be empty")
+        if not user_data or not isinstance(user_data, dict):
+            raise ValidationError("user_data", "User data must be a non-empty dictionary")
+        if value is not None and value < 0:
+            raise ValidationError("value", "Conversion value cannot be negative")
 
-        return hashed_data
+    def _build_conversion_data(
+        self,
+        conversion_id: str,
+        conversion_time: datetime,
+        user_data: Dict[str, Any],
+        value: Optional[float] = None,
+        currency_code: str = "EUR",
+        event_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build one conversions API element (user data hashed) from send_conversion arguments"""
+        # Hash user data
+        hashed_user_data = self._hash_user_data(user_data)
+
+        # Build user identifiers
+        user_identifiers = []
+        if "email" in hashed_user_data:
+            user_identifiers.append({
+                "idType": "SHA256_EMAIL",
+                "idValue": hashed_user_data["email"]
+            })
+        if "firstName" in hashed_user_data and "lastName" in hashed_user_data:
+            user_identifiers.append({
+                "idType": "LINKEDIN_FIRST_PARTY_ADS_TRACKING_UUID",
+                "idValue": f"{hashed_user_data['firstName']}_{hashed_user_data['lastName']}"
+            })
+
+        # Build conversion data
+        conversion_timestamp = conversion_time.timestamp()
+        conversion_data = {
+            "conversion": conversion_id,
+            "conversionHappenedAt": int(conversion_timestamp * 1000),
+            "user": {
+                "userIds": user_identifiers
+            }
+        }
 
-    @sleep_and_retry
-    @limits(calls=CALLS_PER_DAY, period=86400)
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((APIConnectionError, APIRateLimitError))
-    )
+        # Add event ID for deduplication
+        if event_id:
+            conversion_data["eventId"] = event_id
+        else:
+            conversion_data["eventId"] = f"{conversion_id}_{int(conversion_timestamp)}"
+
+        # Add conversion value
+        if value:
+            conversion_data["conversionValue"] = {
+                "amount": str(value),
+                "currencyCode": currency_code
+            }
+
+        return conversion_data
+
+    @_retry_transient
+    @RATE_LIMIT
     @with_correlation_id
     def send_conversion(
         self,
@@ -675,66 +1477,21 @@ class LinkedInAdsConnector:
             return {"success": False, "reason": "not_configured"}
 
         # Validate inputs
-        if not conversion_id or not conversion_id.strip():
-            raise ValidationError("conversion_id", "Conversion ID cannot be empty")
-        if not user_data or not isinstance(user_data, dict):
-            raise ValidationError("user_data", "User data must be a non-empty dictionary")
-        if value is not None and value < 0:
-            raise ValidationError("value", "Conversion value cannot be negative")
+        self._validate_conversion(conversion_id, user_data, value)
 
         try:
-            url = f"{self.base_url}/conversions"
-
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/json",
-                "LinkedIn-Version": self.api_version,
-                "X-RestLi-Protocol-Version": "2.0.0"
-            }
-
-            # Hash user data
-            hashed_user_data = self._hash_user_data(user_data)
-
-            # Build user identifiers
-            user_identifiers = []
-            if "email" in hashed_user_data:
-                user_identifiers.append({
-                    "idType": "SHA256_EMAIL",
-                    "idValue": hashed_user_data["email"]
-                })
-            if "firstName" in hashed_user_data and "lastName" in hashed_user_data:
-                user_identifiers.append({
-                    "idType": "LINKEDIN_FIRST_PARTY_ADS_TRACKING_UUID",
-                    "idValue": f"{hashed_user_data['firstName']}_{hashed_user_data['lastName']}"
-                })
-
-            # Build conversion data
-            conversion_data = {
-                "conversion": conversion_id,
-                "conversionHappenedAt": int(conversion_time.timestamp() * 1000),
-                "user": {
-                    "userIds": user_identifiers
-                }
-            }
-
-            # Add event ID for deduplication
-            if event_id:
-                conversion_data["eventId"] = event_id
-            else:
-                conversion_data["eventId"] = f"{conversion_id}_{int(conversion_time.timestamp())}"
+            url = self.conversions_url
 
-            # Add conversion value
-            if value:
-                conversion_data["conversionValue"] = {
-                    "amount": str(value),
-                    "currencyCode": currency_code
-                }
+            conversion_data = self._build_conversion_data(
+                conversion_id, conversion_time, user_data, value, currency_code, event_id
+            )
 
             payload = {"elements": [conversion_data]}
 
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self._session.post(url, data=orjson.dumps(payload), timeout=30)
+            self.RATE_LIMIT.observe(response.status_code)
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
             logger.info(f"Sent conversion to LinkedIn: {conversion_id}")
             log_with_context("info", f"LinkedIn CAPI conversion sent: {conversion_id}")
@@ -748,11 +1505,13 @@ class LinkedInAdsConnector:
 
         except ValidationError:
             raise
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            raise APIConnectionError("LinkedIn Ads", str(e))
         except requests.exceptions.RequestException as e:
             if hasattr(e.response, 'status_code'):
                 if e.response.status_code == 429:
-                    raise APIRateLimitError("LinkedIn Ads", retry_after=86400)
-                elif e.response.status_code in [401, 403]:
+                    raise APIRateLimitError("LinkedIn Ads", retry_after=_retry_after(e.response.headers))
+                elif e.response.status_code in AUTH_ERROR_STATUSES:
                     raise AuthenticationError("LinkedIn Ads", "Invalid or expired access token")
             logger.error(f"Error sending conversion to LinkedIn: {e}")
             raise SyncError("LinkedIn Ads", str(e))
@@ -760,6 +1519,7 @@ class LinkedInAdsConnector:
             logger.error(f"Error sending conversion to LinkedIn: {e}")
             raise SyncError("LinkedIn Ads", str(e))
 
+    @RATE_LIMIT
     @with_correlation_id
     def send_conversions_batch(
         self,
@@ -784,39 +1544,47 @@ class LinkedInAdsConnector:
         if len(conversions) > self.BATCH_SIZE:
             raise ValidationError("conversions", f"Batch size cannot exceed {self.BATCH_SIZE}")
 
+        conversions = _validate_batch(LINKEDIN_BATCH_ADAPTER, "conversions", conversions)
+
         try:
-            url = f"{self.base_url}/conversions"
+            url = self.conversions_url
 
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/json",
-                "LinkedIn-Version": self.api_version,
-                "X-RestLi-Protocol-Version": "2.0.0"
-            }
+            conversion_times = [conv["conversion_time"].timestamp() for conv in conversions]
+            # Only an explicit event_id identifies a conversion; conversions without one are all sent
+            event_ids = [conv.get("event_id") for conv in conversions]
 
-            batch_elements = []
-            for conv in conversions:
-                hashed_user_data = self._hash_user_data(conv["user_data"])
+            # Re-queued conversions share an eventId; send each one once, skipping recent uploads
+            unique = self._sent_event_ids.unsent(event_ids, _first_occurrences(event_ids))
+            if len(unique) < len(conversions):
+                logger.info(f"Deduped {len(conversions) - len(unique)} LinkedIn conversions with repeated eventId")
+            if not unique:
+                return {
+                    "success": True,
+                    "total": len(conversions),
+                    "duplicates_skipped": len(conversions),
+                    "response": None
+                }
 
-                user_identifiers = []
-                if "email" in hashed_user_data:
-                    user_identifiers.append({
-                        "idType": "SHA256_EMAIL",
-                        "idValue": hashed_user_data["email"]
-                    })
+            batch_elements = []
+            hashed_batch = hash_user_data_batch([conversions[i]["user_data"] for i in unique])
+            for i, hashed_user_data in zip(unique, hashed_batch):
+                conv = conversions[i]
+                email_hash = hashed_user_data.get("email")
 
                 conversion_data = {
                     "conversion": conv["conversion_id"],
-                    "conversionHappenedAt": int(conv["conversion_time"].timestamp() * 1000),
+                    "conversionHappenedAt": int(conversion_times[i] * 1000),
                     "user": {
-                        "userIds": user_identifiers
-                    },
-                    "eventId": conv.get("event_id", f"{conv['conversion_id']}_{int(conv['conversion_time'].timestamp())}")
+                        "userIds": [{"idType": "SHA256_EMAIL", "idValue": email_hash}] if email_hash else []
+                    }
                 }
+                if event_ids[i]:
+                    conversion_data["eventId"] = event_ids[i]
 
-                if "value" in conv and conv["value"]:
+                value = conv.get("value")
+                if value:
                     conversion_data["conversionValue"] = {
-                        "amount": str(conv["value"]),
+                        "amount": str(value),
                         "currencyCode": conv.get("currency_code", "EUR")
                     }
 
@@ -824,9 +1592,12 @@ class LinkedInAdsConnector:
 
             payload = {"elements": batch_elements}
 
-            response = requests.post(url, headers=headers, json=payload, timeout=60)
+            body, headers = _batch_body(payload)
+            response = self._session.post(url, data=body, headers=headers, timeout=60)
+            self.RATE_LIMIT.observe(response.status_code)
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
+            self._sent_event_ids.add([event_ids[i] for i in unique if event_ids[i]])
 
             logger.info(f"Batch sent {len(conversions)} conversions to LinkedIn")
             log_with_context("info", f"LinkedIn CAPI batch: {len(conversions)} conversions sent")
@@ -834,6 +1605,7 @@ class LinkedInAdsConnector:
             return {
                 "success": True,
                 "total": len(conversions),
+                "duplicates_skipped": len(conversions) - len(unique),
                 "response": result
             }
 
@@ -843,19 +1615,299 @@ class LinkedInAdsConnector:
             logger.error(f"Error in LinkedIn batch upload: {e}")
             raise SyncError("LinkedIn Ads", str(e))
 
+    @_retry_transient
+    @RATE_LIMIT
+    async def send_conversion_async(
+        self,
+        conversion_id: str,
+        conversion_time: datetime,
+        user_data: Dict[str, Any],
+        value: Optional[float] = None,
+        currency_code: str = "EUR",
+        event_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a conversion over the shared async session
+
+        Same arguments, payload and result as send_conversion(), without
+        blocking the calling thread on the HTTP round-trip.
+        """
+        if not self.enabled:
+            logger.warning("LinkedIn Ads not configured, skipping conversion sync")
+            return {"success": False, "reason": "not_configured"}
+
+        self._validate_conversion(conversion_id, user_data, value)
+
+        conversion_data = self._build_conversion_data(
+            conversion_id, conversion_time, user_data, value, currency_code, event_id
+        )
+
+        try:
+            async with self._http.get().post(
+                self.conversions_url,
+                headers=self.headers,
+                data=orjson.dumps({"elements": [conversion_data]}),
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                self.RATE_LIMIT.observe(response.status)
+                response.raise_for_status()
+                result = orjson.loads(await response.read())
+        except aiohttp.ClientResponseError as e:
+            if e.status == 429:
+                raise APIRateLimitError("LinkedIn Ads", retry_after=_retry_after(e.headers))
+            elif e.status in AUTH_ERROR_STATUSES:
+                raise AuthenticationError("LinkedIn Ads", "Invalid or expired access token")
+            logger.error(f"Error sending conversion to LinkedIn: {e}")
+            raise SyncError("LinkedIn Ads", str(e))
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            raise APIConnectionError("LinkedIn Ads", str(e))
+        except aiohttp.ClientError as e:
+            logger.error(f"Error sending conversion to LinkedIn: {e}")
+            raise SyncError("LinkedIn Ads", str(e))
+
+        logger.info(f"Sent conversion to LinkedIn: {conversion_id}")
+
+        return {
+            "success": True,
+            "conversion_id": conversion_id,
+            "event_id": conversion_data["eventId"],
+            "response": result
+        }
+
+    async def send_conversion_batched(
+        self,
+        conversion_id: str,
+        conversion_time: datetime,
+        user_data: Dict[str, Any],
+        value: Optional[float] = None,
+        currency_code: str = "EUR",
+        event_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Queue a conversion for the next batch upload and wait for that batch
+
+        Conversions queued within CONVERSION_BATCH_WAIT_SECONDS of each other
+        are sent in one send_conversions_batch() call. Arguments match
+        send_conversion(); the result is the batch's result.
+        """
+        if not self.enabled:
+            logger.warning("LinkedIn Ads not configured, skipping conversion sync")
+            return {"success": False, "reason": "not_configured"}
+
+        self._validate_conversion(conversion_id, user_data, value)
+        return await self._batcher.submit(_batch_item(
+            conversion_id=conversion_id,
+            conversion_time=conversion_time,
+            user_data=user_data,
+            value=value,
+            currency_code=currency_code,
+            event_id=event_id
+        ))
+
+    async def send_conversions_many(self, conversions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Send many conversions concurrently over one pooled connection
+
+        Args:
+            conversions: List of conversion dicts with keys matching send_conversion_async args
+
+        Returns:
+            Dict with per-conversion results (in input order) and success/failure counts
+        """
+        results = await _gather_limited([self.send_conversion_async(**conv) for conv in conversions])
+        return _summarize_uploads(results)
+
+    async def send_conversions_chunked(self, conversions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Send any number of conversions as concurrent BATCH_SIZE batch uploads
+
+        Args:
+            conversions: List of conversion dicts, as for send_conversions_batch()
+
+        Returns:
+            Dict with per-batch results (in input order) and conversion/batch counts
+        """
+        return await _send_in_batches(self, conversions)
+
+
+# HubSpot lifecycle stage -> per-platform conversion, shared read-only
+
+GOOGLE_LIFECYCLE_CONVERSION_ACTIONS = MappingProxyType({
+    LifecycleStage.LEAD: "lead_generation",
+    LifecycleStage.MARKETING_QUALIFIED_LEAD: "mql_conversion",
+    LifecycleStage.SALES_QUALIFIED_LEAD: "sql_conversion",
+    LifecycleStage.OPPORTUNITY: "opportunity_created",
+    LifecycleStage.CUSTOMER: "purchase"
+})
+
+FACEBOOK_LIFECYCLE_EVENTS = MappingProxyType({
+    LifecycleStage.LEAD: "Lead",
+    LifecycleStage.MARKETING_QUALIFIED_LEAD: "MQL",
+    LifecycleStage.SALES_QUALIFIED_LEAD: "SQL",
+    LifecycleStage.OPPORTUNITY: "Opportunity",
+    LifecycleStage.CUSTOMER: "Purchase"
+})
+
+# These would be actual conversion IDs from LinkedIn Campaign Manager
+LINKEDIN_LIFECYCLE_CONVERSIONS = MappingProxyType({
+    LifecycleStage.LEAD: "lead_gen_conversion",
+    LifecycleStage.MARKETING_QUALIFIED_LEAD: "mql_conversion",
+    LifecycleStage.SALES_QUALIFIED_LEAD: "sql_conversion",
+    LifecycleStage.OPPORTUNITY: "opportunity_conversion",
+    LifecycleStage.CUSTOMER: "purchase_conversion"
+})
+
+# Stages at least one platform has a conversion for
+STAGES_WITH_CONVERSIONS = frozenset(
+    GOOGLE_LIFECYCLE_CONVERSION_ACTIONS.keys()
+    | FACEBOOK_LIFECYCLE_EVENTS.keys()
+    | LINKEDIN_LIFECYCLE_CONVERSIONS.keys()
+)
+
 
 class AdPlatformSignalingManager:
     """
     Orchestrates conversion event signaling across all ad platforms
     """
 
+    # HubSpot batch read accepts at most 100 IDs per call
+    HUBSPOT_BATCH_LIMIT = 100
+
+    # Contact properties used to build conversions
+    CONTACT_PROPERTIES = ["email", "gclid", "fbclid", "firstname", "lastname", "phone"]
+
     def __init__(self):
         self.google_ads = GoogleAdsConnector()
         self.facebook_ads = FacebookAdsConnector()
         self.linkedin_ads = LinkedInAdsConnector()
-        self.hubspot = HubSpot(access_token=settings.hubspot_api_key)
+        self.connectors = {
+            "google_ads": self.google_ads,
+            "facebook_ads": self.facebook_ads,
+            "linkedin_ads": self.linkedin_ads
+        }
+        self.hubspot = get_hubspot_client()
+        self._pool = ThreadPoolExecutor(max_workers=SIGNALING_WORKERS, thread_name_prefix="ad-signaling")
+
+        # Durable queue drained by a background thread (CONVERSION_QUEUE_PATH, empty to upload inline)
+        self.conversion_queue = None
+        self._upload_worker = None
+        if settings.conversion_queue_path:
+            self.conversion_queue = ConversionQueue(settings.conversion_queue_path)
+            self._upload_worker = ConversionUploadWorker(
+                self.conversion_queue,
+                {platform: connector.send_conversions_batch for platform, connector in self.connectors.items()}
+            )
+            self._upload_worker.start()
+
         logger.info("Ad Platform Signaling Manager initialized")
 
+    async def aclose(self) -> None:
+        """Stop the connectors' batchers, token refresh, upload worker and send threads, and close the shared HTTP session"""
+        for connector in self.connectors.values():
+            await connector._batcher.stop()
+        self.google_ads.stop_token_refresh()
+        if self._upload_worker is not None:
+            await asyncio.to_thread(self._upload_worker.stop)
+            self.conversion_queue.close()
+        await asyncio.to_thread(self._pool.shutdown)
+        await close_async_session()
+
+    def _lifecycle_conversion_payloads(
+        self,
+        contact_id: str,
+        from_stage: LifecycleStage,
+        to_stage: LifecycleStage,
+        conversion_value: Optional[float] = None
+    ) -> Tuple[ConversionEvent, Dict[str, Dict[str, Any]]]:
+        """
+        Look up a contact and build each eligible platform's send_conversion arguments
+
+        Returns:
+            The ConversionEvent (not yet synced anywhere) and a platform -> keyword arguments dict
+        """
+        # No platform maps this stage, so there is nothing to look the contact up for
+        if not self._stage_has_conversions(to_stage):
+            logger.debug(f"No ad platform conversion for stage {to_stage}, skipping contact {contact_id}")
+            return self._conversion_payloads(contact_id, {}, from_stage, to_stage, conversion_value)
+
+        # Get contact data from HubSpot
+        contact = self.hubspot.crm.contacts.basic_api.get_by_id(
+            contact_id=contact_id,
+            properties=self.CONTACT_PROPERTIES
+        )
+
+        return self._conversion_payloads(contact_id, contact.properties, from_stage, to_stage, conversion_value)
+
+    def _conversion_payloads(
+        self,
+        contact_id: str,
+        properties: Dict[str, Any],
+        from_stage: LifecycleStage,
+        to_stage: LifecycleStage,
+        conversion_value: Optional[float] = None
+    ) -> Tuple[ConversionEvent, Dict[str, Dict[str, Any]]]:
+        """Build each eligible platform's send_conversion arguments from already-fetched contact properties"""
+        email = properties.get("email")
+        gclid = properties.get("gclid")
+        fbclid = properties.get("fbclid")
+
+        # Create conversion event
+        conversion_event = ConversionEvent(
+            contact_id=contact_id,
+            from_stage=from_stage,
+            to_stage=to_stage,
+            timestamp=datetime.utcnow(),
+            conversion_value=conversion_value,
+            synced_to_ad_platforms=[]
+        )
+
+        # Prepare user data for conversions, normalized and hashed once here;
+        # the connectors pass the digests through instead of re-hashing
+        user_data = dict(_hashed_contact_fields(email, properties.get("firstname"), properties.get("lastname")))
+
+        # Identifies this contact's stage change, so platforms and batch uploads
+        # drop replays of it but never another contact's conversion
+        event_id = f"{contact_id}_{to_stage.value}_{int(conversion_event.timestamp.timestamp())}"
+
+        payloads = {}
+
+        # Google Ads if we have GCLID
+        if gclid:
+            conversion_action = self._map_lifecycle_to_google_conversion(to_stage)
+            if conversion_action:
+                payloads["google_ads"] = {
+                    "gclid": gclid,
+                    "conversion_action": conversion_action,
+                    "conversion_time": conversion_event.timestamp,
+                    "conversion_value": conversion_value
+                }
+
+        # Facebook if we have FBCLID
+        if fbclid:
+            event_name = self._map_lifecycle_to_facebook_event(to_stage)
+            if event_name:
+                payloads["facebook_ads"] = {
+                    "event_name": event_name,
+                    "event_time": conversion_event.timestamp,
+                    "user_data": user_data,
+                    "fbclid": fbclid,
+                    "value": conversion_value,
+                    "event_id": event_id
+                }
+
+        # Always try LinkedIn (uses user data matching)
+        linkedin_conversion_id = self._map_lifecycle_to_linkedin_conversion(to_stage)
+        if linkedin_conversion_id:
+            payloads["linkedin_ads"] = {
+                "conversion_id": linkedin_conversion_id,
+                "conversion_time": conversion_event.timestamp,
+                "user_data": user_data,
+                "value": conversion_value,
+                "event_id": event_id
+            }
+
+        return conversion_event, payloads
+
     def sync_lifecycle_conversion(
         self,
         contact_id: str,
@@ -876,178 +1928,204 @@ class AdPlatformSignalingManager:
             ConversionEvent with sync status
         """
         try:
-            # Get contact data from HubSpot
-            contact = self.hubspot.crm.contacts.basic_api.get_by_id(
-                contact_id=contact_id,
-                properties=["email", "gclid", "fbclid", "firstname", "lastname", "phone"]
+            conversion_event, payloads = self._lifecycle_conversion_payloads(
+                contact_id, from_stage, to_stage, conversion_value
             )
+            return self._collect_sends(conversion_event, self._submit_sends(payloads))
 
-            email = contact.properties.get("email")
-            gclid = contact.properties.get("gclid")
-            fbclid = contact.properties.get("fbclid")
-
-            # Create conversion event
-            conversion_event = ConversionEvent(
-                contact_id=contact_id,
-                from_stage=from_stage,
-                to_stage=to_stage,
-                timestamp=datetime.utcnow(),
-                conversion_value=conversion_value,
-                synced_to_ad_platforms=[]
-            )
+        except Exception as e:
+            logger.error(f"Error syncing lifecycle conversion: {e}")
+            raise
 
-            # Prepare user data for conversions
-            import hashlib
-            user_data = {
-                "em": hashlib.sha256(email.encode()).hexdigest() if email else None,
-                "fn": hashlib.sha256(
-                    contact.properties.get("firstname", "").encode()
-                ).hexdigest() if contact.properties.get("firstname") else None,
-                "ln": hashlib.sha256(
-                    contact.properties.get("lastname", "").encode()
-                ).hexdigest() if contact.properties.get("lastname") else None,
-            }
+    async def sync_lifecycle_conversion_async(
+        self,
+        contact_id: str,
+        from_stage: LifecycleStage,
+        to_stage: LifecycleStage,
+        conversion_value: Optional[float] = None
+    ) -> ConversionEvent:
+        """
+        Sync a lifecycle stage conversion to all relevant ad platforms from the event loop
 
-            # Sync to Google Ads if we have GCLID
-            if gclid:
-                conversion_action = self._map_lifecycle_to_google_conversion(to_stage)
-                if conversion_action:
-                    success = self.google_ads.send_conversion(
-                        gclid=gclid,
-                        conversion_action=conversion_action,
-                        conversion_time=conversion_event.timestamp,
-                        conversion_value=conversion_value
-                    )
-                    if success:
-                        conversion_event.synced_to_ad_platforms.append("google_ads")
-
-            # Sync to Facebook if we have FBCLID
-            if fbclid:
-                event_name = self._map_lifecycle_to_facebook_event(to_stage)
-                if event_name:
-                    success = self.facebook_ads.send_conversion(
-                        event_name=event_name,
-                        event_time=conversion_event.timestamp,
-                        user_data=user_data,
-                        fbclid=fbclid,
-                        value=conversion_value
-                    )
-                    if success:
-                        conversion_event.synced_to_ad_platforms.append("facebook_ads")
-
-            # Always try LinkedIn (uses user data matching)
-            linkedin_conversion_id = self._map_lifecycle_to_linkedin_conversion(to_stage)
-            if linkedin_conversion_id:
-                success = self.linkedin_ads.send_conversion(
-                    conversion_id=linkedin_conversion_id,
-                    conversion_time=conversion_event.timestamp,
-                    user_data=user_data,
-                    value=conversion_value
-                )
-                if success:
-                    conversion_event.synced_to_ad_platforms.append("linkedin_ads")
+        Facebook and LinkedIn uploads run as coroutines on the shared aiohttp
+        session, so many contact syncs can be in flight without a thread each;
+        the HubSpot lookup and the Google Ads SDK call run in worker threads.
 
-            logger.info(
-                f"Synced conversion for contact {contact_id} to platforms: "
-                f"{conversion_event.synced_to_ad_platforms}"
-            )
-
-            return conversion_event
+        Args:
+            contact_id: HubSpot contact ID
+            from_stage: Previous lifecycle stage
+            to_stage: New lifecycle stage
+            conversion_value: Optional monetary value
 
+        Returns:
+            ConversionEvent with sync status
+        """
+        try:
+            conversion_event, payloads = await asyncio.to_thread(
+                self._lifecycle_conversion_payloads, contact_id, from_stage, to_stage, conversion_value
+            )
         except Exception as e:
             logger.error(f"Error syncing lifecycle conversion: {e}")
             raise
 
+        sends = []
+        for platform, kwargs in payloads.items():
+            connector = self.connectors[platform]
+            send_async = getattr(connector, "send_conversion_async", None)
+            if send_async is not None:
+                sends.append(send_async(**kwargs))
+            else:
+                sends.append(asyncio.to_thread(connector.send_conversion, **kwargs))
+
+        # One platform failing doesn't stop the others
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        for platform, result in zip(payloads, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error syncing conversion for contact {contact_id} to {platform}: {result}")
+            elif result.get("success"):
+                conversion_event.synced_to_ad_platforms.append(platform)
+
+        logger.info(
+            f"Synced conversion for contact {contact_id} to platforms: "
+            f"{conversion_event.synced_to_ad_platforms}"
+        )
+        return conversion_event
+
+    def sync_lifecycle_conversions_batch(
+        self,
+        items: List[Tuple[str, LifecycleStage, LifecycleStage, Optional[float]]]
+    ) -> List[Union[ConversionEvent, Exception]]:
+        """
+        Sync many lifecycle stage conversions, reading contacts in HubSpot batches
+
+        Contacts are fetched HUBSPOT_BATCH_LIMIT at a time instead of one
+        get_by_id per contact, and every contact's platform sends run in
+        parallel on the signaling threads.
+
+        Args:
+            items: (contact_id, from_stage, to_stage, conversion_value) tuples
+
+        Returns:
+            One entry per item, in order: the ConversionEvent with sync status, or
+            the Exception raised for that item
+        """
+        contact_ids = list(dict.fromkeys(item[0] for item in items if self._stage_has_conversions(item[2])))
+        contacts: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(contact_ids), self.HUBSPOT_BATCH_LIMIT):
+            response = self.hubspot.crm.contacts.batch_api.read(
+                batch_read_input_simple_public_object_id=BatchReadInputSimplePublicObjectId(
+                    properties=self.CONTACT_PROPERTIES,
+                    inputs=[{"id": contact_id} for contact_id in contact_ids[start:start + self.HUBSPOT_BATCH_LIMIT]]
+                )
+            )
+            contacts.update((contact.id, contact.properties) for contact in response.results)
+
+        # Submit every contact's sends before waiting on any of them
+        pending = []
+        for contact_id, from_stage, to_stage, conversion_value in items:
+            try:
+                properties = contacts.get(contact_id) if self._stage_has_conversions(to_stage) else {}
+                if properties is None:
+                    raise SyncError("hubspot", f"Contact {contact_id} not found")
+                conversion_event, payloads = self._conversion_payloads(
+                    contact_id, properties, from_stage, to_stage, conversion_value
+                )
+                pending.append((conversion_event, self._submit_sends(payloads)))
+            except Exception as e:
+                logger.error(f"Error syncing lifecycle conversion for contact {contact_id}: {e}")
+                pending.append((e, None))
+
+        return [
+            result if futures is None else self._collect_sends(result, futures)
+            for result, futures in pending
+        ]
+
+    def _submit_sends(self, payloads: Dict[str, Dict[str, Any]]) -> List[Tuple[str, Future]]:
+        """Start each platform's send_conversion on the signaling threads"""
+        return [
+            (platform, self._pool.submit(self.connectors[platform].send_conversion, **kwargs))
+            for platform, kwargs in payloads.items()
+        ]
+
+    def _collect_sends(self, conversion_event: ConversionEvent, futures: List[Tuple[str, Future]]) -> ConversionEvent:
+        """Wait for submitted sends and record the platforms that accepted the conversion"""
+        # One platform failing doesn't stop the others
+        for platform, future in futures:
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error(f"Error syncing conversion for contact {conversion_event.contact_id} to {platform}: {e}")
+                continue
+            if result.get("success"):
+                conversion_event.synced_to_ad_platforms.append(platform)
+
+        logger.info(
+            f"Synced conversion for contact {conversion_event.contact_id} to platforms: "
+            f"{conversion_event.synced_to_ad_platforms}"
+        )
+        return conversion_event
+
+    def queue_lifecycle_conversion(
+        self,
+        contact_id: str,
+        from_stage: LifecycleStage,
+        to_stage: LifecycleStage,
+        conversion_value: Optional[float] = None
+    ) -> Tuple[ConversionEvent, List[str]]:
+        """
+        Queue a lifecycle stage conversion for background upload to all relevant ad platforms
+
+        Returns once the conversion is durably queued, without waiting for the
+        ad platforms. Without a configured queue this syncs inline instead.
+
+        Args:
+            contact_id: HubSpot contact ID
+            from_stage: Previous lifecycle stage
+            to_stage: New lifecycle stage
+            conversion_value: Optional monetary value
+
+        Returns:
+            The ConversionEvent and the platforms it was queued for (or synced to)
+        """
+        if self.conversion_queue is None:
+            conversion_event = self.sync_lifecycle_conversion(contact_id, from_stage, to_stage, conversion_value)
+            return conversion_event, conversion_event.synced_to_ad_platforms
+
+        conversion_event, payloads = self._lifecycle_conversion_payloads(
+            contact_id, from_stage, to_stage, conversion_value
+        )
+        queued = {platform: kwargs for platform, kwargs in payloads.items() if self.connectors[platform].enabled}
+        self.conversion_queue.enqueue([
+            (platform, {key: value for key, value in kwargs.items() if value is not None})
+            for platform, kwargs in queued.items()
+        ])
+
+        logger.info(f"Queued conversion for contact {contact_id} to platforms: {list(queued)}")
+        return conversion_event, list(queued)
+
+    def _stage_has_conversions(self, stage: LifecycleStage) -> bool:
+        """Whether any ad platform has a conversion mapped for a lifecycle stage"""
+        return stage in STAGES_WITH_CONVERSIONS
+
     def _map_lifecycle_to_google_conversion(self, stage: LifecycleStage) -> Optional[str]:
         """Map HubSpot lifecycle stage to Google Ads conversion action"""
-        mapping = {
-            LifecycleStage.LEAD: "lead_generation",
-            LifecycleStage.MARKETING_QUALIFIED_LEAD: "mql_conversion",
-            LifecycleStage.SALES_QUALIFIED_LEAD: "sql_conversion",
-            LifecycleStage.OPPORTUNITY: "opportunity_created",
-            LifecycleStage.CUSTOMER: "purchase"
-        }
-        return mapping.get(stage)
+        return GOOGLE_LIFECYCLE_CONVERSION_ACTIONS.get(stage)
 
     def _map_lifecycle_to_facebook_event(self, stage: LifecycleStage) -> Optional[str]:
         """Map HubSpot lifecycle stage to Facebook event name"""
-        mapping = {
-            LifecycleStage.LEAD: "Lead",
-            LifecycleStage.MARKETING_QUALIFIED_LEAD: "MQL",
-            LifecycleStage.SALES_QUALIFIED_LEAD: "SQL",
-            LifecycleStage.OPPORTUNITY: "Opportunity",
-            LifecycleStage.CUSTOMER: "Purchase"
-        }
-        return mapping.get(stage)
+        return FACEBOOK_LIFECYCLE_EVENTS.get(stage)
 
     def _map_lifecycle_to_linkedin_conversion(self, stage: LifecycleStage) -> Optional[str]:
         """Map HubSpot lifecycle stage to LinkedIn conversion ID"""
-        # These would be actual conversion IDs from LinkedIn Campaign Manager
-        mapping = {
-            LifecycleStage.LEAD: "lead_gen_conversion",
-            LifecycleStage.MARKETING_QUALIFIED_LEAD: "mql_conversion",
-            LifecycleStage.SALES_QUALIFIED_LEAD: "sql_conversion",
-            LifecycleStage.OPPORTUNITY: "opportunity_conversion",
-            LifecycleStage.CUSTOMER: "purchase_conversion"
-        }
-        return mapping.get(stage)
+        return LINKEDIN_LIFECYCLE_CONVERSIONS.get(stage)
 
-    def setup_hubspot_ad_integrations(self) -> Dict:
+    def setup_hubspot_ad_integrations(self) -> Mapping[str, Any]:
         """
         Guide for setting up HubSpot's built-in ad platform integrations
 
-        Returns configuration instructions
+        Returns configuration instructions (shared, read-only)
         """
-        return {
-            "google_ads": {
-                "steps": [
-                    "Navigate to Marketing > Ads in HubSpot",
-                    "Click 'Connect account' and select Google Ads",
-                    "Authenticate with Google account",
-                    "Select ad accounts to sync",
-                    "Enable automatic sync of campaigns and audiences",
-                    "Configure conversion tracking in Google Ads"
-                ],
-                "features": [
-                    "Automatic campaign import",
-                    "Contact-to-ad click attribution",
-                    "Audience sync for remarketing",
-                    "ROI reporting"
-                ]
-            },
-            "facebook_ads": {
-                "steps": [
-                    "Navigate to Marketing > Ads in HubSpot",
-                    "Click 'Connect account' and select Facebook",
-                    "Authenticate with Facebook account",
-                    "Select ad accounts to sync",
-                    "Set up Facebook Pixel on website",
-                    "Configure Conversions API integration"
-                ],
-                "features": [
-                    "Campaign performance tracking",
-                    "Lead ads integration",
-                    "Custom audience sync",
-                    "Conversion tracking"
-                ]
-            },
-            "linkedin_ads": {
-                "steps": [
-                    "Navigate to Marketing > Ads in HubSpot",
-                    "Click 'Connect account' and select LinkedIn",
-                    "Authenticate with LinkedIn account",
-                    "Select ad accounts to sync",
-                    "Enable LinkedIn Insight Tag",
-                    "Set up conversion tracking"
-                ],
-                "features": [
-                    "Campaign sync",
-                    "Lead gen forms integration",
-                    "Matched audiences",
-                    "B2B attribution reporting"
-                ]
-            }
-        }
+        return HUBSPOT_AD_INTEGRATIONS_GUIDE
 
     def get_cross_platform_performance_report(
         self,
@@ -0,0 +1,159 @@
+"""
+Async Request Batching
+
+This module provides a small micro-batching queue: callers submit single
+items and await their result, while a background task groups items that
+arrive close together and hands them to a batch handler in one call.
+Several batches can be in flight at once, so a slow handler call does not
+hold back the items queued behind it.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+from loguru import logger
+
+
+class AsyncMicroBatcher:
+    """Groups concurrent submissions into batches for a single handler call"""
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 32,
+        max_wait_seconds: float = 0.02,
+        max_concurrent_batches: int = 4,
+        name: str = "batcher"
+    ):
+        """
+        Initialize the batcher
+
+        Args:
+            handler: Async callable taking a list of items and returning a list of
+                results in the same order (an Exception entry fails that item only)
+            max_batch_size: Maximum number of items passed to the handler at once
+            max_wait_seconds: How long to wait for more items after the first arrives
+            max_concurrent_batches: Maximum number of handler calls in flight at once
+            name: Name used in log messages
+        """
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.max_concurrent_batches = max_concurrent_batches
+        self.name = name
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start the background batching task on the running event loop"""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+            self._worker = asyncio.create_task(self._run())
+            logger.info(f"Started {self.name} (batch size {self.max_batch_size}, wait {self.max_wait_seconds}s)")
+
+    async def stop(self) -> None:
+        """
+        Stop batching
+
+        Batches already passed to the handler are allowed to finish; items
+        still queued fail with RuntimeError instead of waiting forever.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+            stopped = 0
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                self._fail(future, RuntimeError(f"{self.name} stopped"))
+                stopped += 1
+            if stopped:
+                logger.warning(f"{self.name} stopped with {stopped} queued items, failing them")
+            logger.info(f"Stopped {self.name}")
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Queue an item and wait for its result
+
+        Args:
+            item: Item to pass to the batch handler
+
+        Returns:
+            The handler's result for this item
+        """
+        if self._worker is None:
+            self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[Any, asyncio.Future]]:
+        """Wait for one item, then gather more until the batch is full or the window closes"""
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_wait_seconds
+
+        try:
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            # Stopped mid-window: these items have left the queue, so fail them here
+            for _, future in batch:
+                self._fail(future, RuntimeError(f"{self.name} stopped"))
+            raise
+
+        return batch
+
+    @staticmethod
+    def _fail(future: asyncio.Future, error: Exception) -> None:
+        """Fail a submission unless its caller already gave up on it"""
+        if not future.done():
+            future.set_exception(error)
+
+    async def _run(self) -> None:
+        """Background loop handing batches to the handler, up to max_concurrent_batches at a time"""
+        while True:
+            await self._slots.acquire()
+            try:
+                batch = await self._collect_batch()
+            except BaseException:
+                self._slots.release()
+                raise
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run the handler on one batch and resolve its futures"""
+        items = [item for item, _ in batch]
+
+        try:
+            results = await self.handler(items)
+            if len(results) != len(items):
+                raise ValueError(f"handler returned {len(results)} results for {len(items)} items")
+        except Exception as e:
+            logger.error(f"{self.name} batch of {len(items)} failed: {e}")
+            results = [e] * len(items)
+        finally:
+            self._slots.release()
+
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                self._fail(future, result)
+            elif not future.done():
+                future.set_result(result)
@@ -0,0 +1,82 @@
+"""
+Redis Response Cache
+
+This module provides a small Redis-backed cache for serialized API responses.
+When Redis is not configured or unreachable, lookups miss and writes are
+skipped so requests fall through to the database.
+"""
+from typing import Optional
+from loguru import logger
+
+
+class RedisResponseCache:
+    """Caches serialized response bodies in Redis with a TTL"""
+
+    def __init__(self, redis_url: str = "", default_ttl: int = 60, key_prefix: str = "hubspot_api:"):
+        """
+        Initialize the response cache
+
+        Args:
+            redis_url: Redis connection URL (empty to disable caching)
+            default_ttl: Default time-to-live for cached entries, in seconds
+            key_prefix: Prefix applied to every cache key
+        """
+        self.default_ttl = default_ttl
+        self.key_prefix = key_prefix
+        self._redis = None
+
+        if redis_url:
+            from redis.asyncio import Redis
+
+            self._redis = Redis.from_url(redis_url)
+            logger.info("Redis response cache enabled")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a Redis backend is configured"""
+        return self._redis is not None
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a cached response body, or None on a miss"""
+        if not self._redis:
+            return None
+        try:
+            return await self._redis.get(self.key_prefix + key)
+        except Exception as e:
+            logger.warning(f"Response cache read failed for {key}: {e}")
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        """Store a response body for ttl seconds"""
+        if not self._redis:
+            return
+        try:
+            await self._redis.set(self.key_prefix + key, value, ex=ttl or self.default_ttl)
+        except Exception as e:
+            logger.warning(f"Response cache write failed for {key}: {e}")
+
+    async def invalidate(self, pattern: str) -> int:
+        """
+        Delete all cached entries matching a key pattern
+
+        Args:
+            pattern: Glob pattern relative to the key prefix (e.g. "campaigns:*")
+
+        Returns:
+            Number of keys deleted
+        """
+        if not self._redis:
+            return 0
+        try:
+            keys = [key async for key in self._redis.scan_iter(match=self.key_prefix + pattern)]
+            if keys:
+                await self._redis.delete(*keys)
+            return len(keys)
+        except Exception as e:
+            logger.warning(f"Response cache invalidation failed for {pattern}: {e}")
+            return 0
+
+    async def close(self) -> None:
+        """Close the Redis connection pool"""
+        if self._redis:
+            await self._redis.aclose()
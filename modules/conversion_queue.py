@@ -0,0 +1,249 @@
+"""
+Durable Conversion Upload Queue
+
+This module lets request handlers hand ad platform conversions off instead
+of uploading them inline: conversions are written to a local SQLite queue
+and background worker threads (one per platform) drain it, sending each
+platform's pending conversions through its connector's send_conversions_batch().
+"""
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+import orjson
+from loguru import logger
+
+# Payload keys holding datetimes (stored as ISO 8601 strings)
+_DATETIME_KEYS = ("conversion_time", "event_time")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversion_queue (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    platform TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    enqueued_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    claimed_until REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_conversion_queue_platform ON conversion_queue (platform, id);
+"""
+
+
+def _encode_payload(payload: Dict[str, Any]) -> str:
+    return orjson.dumps(payload).decode()
+
+
+def _decode_payload(raw: str) -> Dict[str, Any]:
+    payload = orjson.loads(raw)
+    for key in _DATETIME_KEYS:
+        if key in payload:
+            payload[key] = datetime.fromisoformat(payload[key])
+    return payload
+
+
+class ConversionQueue:
+    """SQLite-backed queue of pending conversion uploads, safe to share across threads and processes"""
+
+    def __init__(self, path: str, max_attempts: int = 5, claim_seconds: float = 300):
+        """
+        Open (and create if needed) the queue database
+
+        Args:
+            path: SQLite database file
+            max_attempts: Failed uploads after which an entry stays in the table but is no longer claimed
+            claim_seconds: How long a claimed batch is hidden from other workers before it can be reclaimed
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+        self.claim_seconds = claim_seconds
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def enqueue(self, items: Sequence[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Queue conversions for upload in one transaction
+
+        Args:
+            items: (platform, send_conversion keyword arguments) pairs
+        """
+        now = time.time()
+        rows = [(platform, _encode_payload(payload), now) for platform, payload in items]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO conversion_queue (platform, payload, enqueued_at) VALUES (?, ?, ?)",
+                    rows
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def claim(self, platform: str, limit: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Claim up to limit pending conversions of a platform, oldest first
+
+        Returns:
+            (queue ID, payload) pairs; pass the IDs to complete() or fail()
+        """
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                UPDATE conversion_queue SET claimed_until = ?
+                WHERE id IN (
+                    SELECT id FROM conversion_queue
+                    WHERE platform = ? AND claimed_until < ? AND attempts < ?
+                    ORDER BY id LIMIT ?
+                )
+                RETURNING id, payload
+                """,
+                (now + self.claim_seconds, platform, now, self.max_attempts, limit)
+            ).fetchall()
+        rows.sort()
+        return [(queue_id, _decode_payload(payload)) for queue_id, payload in rows]
+
+    def renew(self, ids: Sequence[int]) -> None:
+        """Extend the claim on conversions still being uploaded by another claim_seconds"""
+        claimed_until = time.time() + self.claim_seconds
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE conversion_queue SET claimed_until = ? WHERE id = ?",
+                [(claimed_until, i) for i in ids]
+            )
+
+    def complete(self, ids: Sequence[int]) -> None:
+        """Remove uploaded conversions"""
+        with self._lock:
+            self._conn.executemany("DELETE FROM conversion_queue WHERE id = ?", [(i,) for i in ids])
+
+    def fail(self, ids: Sequence[int]) -> None:
+        """Release conversions whose upload failed so they are retried"""
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE conversion_queue SET attempts = attempts + 1, claimed_until = 0 WHERE id = ?",
+                [(i,) for i in ids]
+            )
+
+    def pending_count(self) -> int:
+        """Number of conversions still waiting to be uploaded"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT count(*) FROM conversion_queue WHERE attempts < ?", (self.max_attempts,)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class ConversionUploadWorker:
+    """
+    Background threads draining a ConversionQueue through per-platform batch senders
+
+    Each platform drains on its own thread, so a sender waiting on its rate
+    limit does not hold up the others. Claims are renewed while a batch is
+    being sent, so a long rate-limit wait never lets another process reclaim
+    and re-upload the same conversions.
+    """
+
+    def __init__(
+        self,
+        queue: ConversionQueue,
+        senders: Dict[str, Callable[[List[Dict[str, Any]]], Any]],
+        batch_size: int = 1000,
+        poll_seconds: float = 1.0
+    ):
+        """
+        Initialize the worker
+
+        Args:
+            queue: Queue to drain
+            senders: platform -> callable uploading a list of payloads (e.g. send_conversions_batch)
+            batch_size: Maximum conversions per upload
+            poll_seconds: Idle wait between polls when the queue is empty
+        """
+        self.queue = queue
+        self.senders = senders
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start one background thread per platform"""
+        if not self._threads:
+            self._stop.clear()
+            self._threads = [
+                threading.Thread(target=self._run, args=(platform,), name=f"conversion-upload-{platform}", daemon=True)
+                for platform in self.senders
+            ]
+            for thread in self._threads:
+                thread.start()
+            logger.info(f"Started conversion upload worker ({self.queue.path})")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background threads after their current uploads"""
+        self._stop.set()
+        if self._threads:
+            for thread in self._threads:
+                thread.join(timeout)
+            self._threads = []
+            logger.info("Stopped conversion upload worker")
+
+    def drain_platform(self, platform: str) -> int:
+        """Upload one batch of a platform's conversions; returns the number uploaded"""
+        claimed = self.queue.claim(platform, self.batch_size)
+        if not claimed:
+            return 0
+
+        ids = [queue_id for queue_id, _ in claimed]
+        try:
+            self._send_claimed(platform, ids, [payload for _, payload in claimed])
+        except Exception as e:
+            logger.error(f"Queued {platform} upload of {len(ids)} conversions failed: {e}")
+            self.queue.fail(ids)
+            return 0
+
+        self.queue.complete(ids)
+        return len(ids)
+
+    def drain_once(self) -> int:
+        """Upload one batch per platform; returns the number of conversions uploaded"""
+        return sum(self.drain_platform(platform) for platform in self.senders)
+
+    def _send_claimed(self, platform: str, ids: List[int], payloads: List[Dict[str, Any]]) -> None:
+        """Send a claimed batch, renewing the claim every third of claim_seconds until the send returns"""
+        sent = threading.Event()
+
+        def renew_claim() -> None:
+            while not sent.wait(self.queue.claim_seconds / 3):
+                try:
+                    self.queue.renew(ids)
+                except Exception as e:
+                    logger.warning(f"Renewing claim on {len(ids)} queued {platform} conversions failed: {e}")
+
+        renewer = threading.Thread(target=renew_claim, name=f"conversion-claim-{platform}", daemon=True)
+        renewer.start()
+        try:
+            self.senders[platform](payloads)
+        finally:
+            sent.set()
+            renewer.join()
+
+    def _run(self, platform: str) -> None:
+        while not self._stop.is_set():
+            try:
+                uploaded = self.drain_platform(platform)
+            except Exception as e:
+                logger.error(f"Conversion upload worker error ({platform}): {e}")
+                uploaded = 0
+            if not uploaded:
+                self._stop.wait(self.poll_seconds)
@@ -9,91 +9,234 @@ This module handles:
 - Lifecycle stage management
 - Partner/affiliate tracking
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Any, Tuple, Union, Callable, ClassVar
 from datetime import datetime, timedelta
-from hubspot import HubSpot
-from hubspot.crm.contacts import ApiException
+from functools import lru_cache
+import threading
+from types import MappingProxyType
+from cachetools import LRUCache, TTLCache
+from hubspot.crm.associations.v4 import BatchInputPublicDefaultAssociationMultiPost
+from hubspot.crm.contacts import (
+    ApiException,
+    BatchInputSimplePublicObjectBatchInput,
+    BatchReadInputSimplePublicObjectId
+)
+from hubspot.crm.objects import BatchInputSimplePublicObjectBatchInputForCreate, PublicObjectSearchRequest
+from hubspot.crm.properties import BatchInputPropertyCreate
 from loguru import logger
+import numpy as np
+import orjson
 
 from models.attribution import (
     Contact, Touchpoint, AttributionModel, LifecycleStage,
-    UTMParameters, ClickID, TouchpointType, ConversionEvent
+    UTMParameters, ClickID, TouchpointType, ConversionEvent, TOUCHPOINT_ADAPTER
 )
 from config import settings
+from modules.exceptions import AttributionCalculationError, SyncError, ValidationError
+from modules.hubspot_client import get_hubspot_client
+
+
+# Custom contact properties used for attribution tracking
+CUSTOM_CONTACT_PROPERTIES = (
+    MappingProxyType({
+        "name": "first_touch_utm_source",
+        "label": "First Touch UTM Source",
+        "type": "string",
+        "fieldType": "text",
+        "groupName": "contactinformation"
+    }),
+    MappingProxyType({
+        "name": "first_touch_utm_campaign",
+        "label": "First Touch UTM Campaign",
+        "type": "string",
+        "fieldType": "text",
+        "groupName": "contactinformation"
+    }),
+    MappingProxyType({
+        "name": "last_touch_utm_source",
+        "label": "Last Touch UTM Source",
+        "type": "string",
+        "fieldType": "text",
+        "groupName": "contactinformation"
+    }),
+    MappingProxyType({
+        "name": "last_touch_utm_campaign",
+        "label": "Last Touch UTM Campaign",
+        "type": "string",
+        "fieldType": "text",
+        "groupName": "contactinformation"
+    }),
+    MappingProxyType({
+        "name": "all_touchpoints_json",
+        "label": "All Touchpoints (JSON)",
+        "type": "string",
+        "fieldType": "textarea",
+        "groupName": "contactinformation"
+    }),
+    MappingProxyType({
+        "name": "gclid",
+        "label": "Google Click ID (GCLID)",
+        "type": "string",
+        "fieldType": "text",
+        "groupName": "contactinformation"
+    }),
+    MappingProxyType({
+        "name": "fbclid",
+        "label": "Facebook Click ID",
+        "type": "string",
+        "fieldType": "text",
+        "groupName": "contactinformation"
+    }),
+    MappingProxyType({
+        "name": "partner_id",
+        "label": "Partner/Affiliate ID",
+        "type": "string",
+        "fieldType": "text",
+        "groupName": "contactinformation"
+    }),
+    MappingProxyType({
+        "name": "touchpoint_count",
+        "label": "Touchpoint Count",
+        "type": "number",
+        "fieldType": "number",
+        "groupName": "contactinformation"
+    }),
+    MappingProxyType({
+        "name": "attributed_revenue",
+        "label": "Attributed Revenue",
+        "type": "number",
+        "fieldType": "number",
+        "groupName": "contactinformation"
+    })
+)
+
+
+# Tracking snippet served to web properties; {portal_id} is filled in per portal
+_TRACKING_CODE_TEMPLATE = """
+<!-- HubSpot Tracking Code -->
+<script type="text/javascript" id="hs-script-loader" async defer src="//js.hs-scripts.com/{portal_id}.js"></script>
+
+<!-- Custom UTM and Click ID Capture -->
+<script>
+(function() {{
+    // Parse URL parameters
+    function getUrlParameter(name) {{
+        name = name.replace(/[\\[]/, '\\\\[').replace(/[\\]]/, '\\\\]');
+        var regex = new RegExp('[\\\\?&]' + name + '=([^&#]*)');
+        var results = regex.exec(location.search);
+        return results === null ? '' : decodeURIComponent(results[1].replace(/\\+/g, ' '));
+    }}
+
+    // Store UTM parameters and click IDs
+    function captureTrackingParameters() {{
+        var params = {{
+            utm_source: getUrlParameter('utm_source'),
+            utm_medium: getUrlParameter('utm_medium'),
+            utm_campaign: getUrlParameter('utm_campaign'),
+            utm_term: getUrlParameter('utm_term'),
+            utm_content: getUrlParameter('utm_content'),
+            gclid: getUrlParameter('gclid'),
+            fbclid: getUrlParameter('fbclid'),
+            msclkid: getUrlParameter('msclkid'),
+            li_fat_id: getUrlParameter('li_fat_id'),
+            partner_id: getUrlParameter('partner_id')
+        }};
+
+        // Store in sessionStorage for session tracking
+        sessionStorage.setItem('tracking_params_' + Date.now(), JSON.stringify(params));
+
+        // Send to HubSpot via Forms API or track as event
+        if (window._hsq) {{
+            window._hsq.push(['setPath', window.location.pathname]);
+            window._hsq.push(['trackPageView']);
+
+            // Set custom properties
+            for (var key in params) {{
+                if (params[key]) {{
+                    window._hsq.push(['identify', {{[key]: params[key]}}]);
+                }}
+            }}
+        }}
+    }}
+
+    // Execute on page load
+    if (document.readyState === 'loading') {{
+        document.addEventListener('DOMContentLoaded', captureTrackingParameters);
+    }} else {{
+        captureTrackingParameters();
+    }}
+}})();
+</script>
+"""
+
+
+def _minify_snippet(source: str) -> str:
+    """Drop indentation, blank lines and whole-line // comments (line breaks are kept for ASI)"""
+    lines = (line.strip() for line in source.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+_MINIFIED_TRACKING_CODE_TEMPLATE = _minify_snippet(_TRACKING_CODE_TEMPLATE)
+
+
+@lru_cache(maxsize=4)
+def _tracking_code(portal_id: str) -> str:
+    """Minified tracking snippet for a HubSpot portal"""
+    return _MINIFIED_TRACKING_CODE_TEMPLATE.format(portal_id=portal_id)
 
 
 class AttributionCalculator:
     """Calculates attribution credits based on different models"""
 
     @staticmethod
-    def first_touch(touchpoints: List[Touchpoint], total_value: float) -> Dict[str, float]:
-        """First-touch attribution - 100% credit to first touchpoint"""
+    def _credits_by_touchpoint(
+        bulk_model: Callable[[np.ndarray, np.ndarray], np.ndarray],
+        touchpoints: List[Touchpoint],
+        total_value: float
+    ) -> Dict[str, float]:
+        """Score one contact with a bulk model and key the credits by touchpoint ID (repeated IDs add up)"""
         if not touchpoints:
             return {}
-        return {touchpoints[0].touchpoint_id: total_value}
+        position_credits = bulk_model(np.array([0, len(touchpoints)]), np.array([total_value], dtype=np.float64))
+        credits: Dict[str, float] = {}
+        for tp, credit in zip(touchpoints, position_credits.tolist()):
+            credits[tp.touchpoint_id] = credits.get(tp.touchpoint_id, 0.0) + credit
+        return credits
+
+    @staticmethod
+    def first_touch(touchpoints: List[Touchpoint], total_value: float) -> Dict[str, float]:
+        """First-touch attribution - 100% credit to first touchpoint"""
+        return AttributionCalculator._credits_by_touchpoint(
+            AttributionCalculator.first_touch_bulk, touchpoints[:1], total_value
+        )
 
     @staticmethod
     def last_touch(touchpoints: List[Touchpoint], total_value: float) -> Dict[str, float]:
         """Last-touch attribution - 100% credit to last touchpoint"""
-        if not touchpoints:
-            return {}
-        return {touchpoints[-1].touchpoint_id: total_value}
+        return AttributionCalculator._credits_by_touchpoint(
+            AttributionCalculator.last_touch_bulk, touchpoints[-1:], total_value
+        )
 
     @staticmethod
     def linear(touchpoints: List[Touchpoint], total_value: float) -> Dict[str, float]:
         """Linear attribution - equal credit to all touchpoints"""
-        if not touchpoints:
-            return {}
-        credit_per_touch = total_value / len(touchpoints)
-        return {tp.touchpoint_id: credit_per_touch for tp in touchpoints}
+        return AttributionCalculator._credits_by_touchpoint(AttributionCalculator.linear_bulk, touchpoints, total_value)
 
     @staticmethod
     def w_shaped(touchpoints: List[Touchpoint], total_value: float) -> Dict[str, float]:
         """
         W-shaped attribution:
         - 30% to first touch
-        - 30% to lead creation touch
-        - 30% to opportunity creation touch
+        - 30% to lead creation touch (simplified - the middle touch)
+        - 30% to opportunity creation touch (simplified - the last touch)
         - 10% distributed among remaining touches
-        """
-        if not touchpoints:
-            return {}
-
-        credits = {}
-        num_touches = len(touchpoints)
-
-        if num_touches == 1:
-            credits[touchpoints[0].touchpoint_id] = total_value
-        elif num_touches == 2:
-            credits[touchpoints[0].touchpoint_id] = total_value * 0.5
-            credits[touchpoints[-1].touchpoint_id] = total_value * 0.5
-        else:
-            # First touch gets 30%
-            credits[touchpoints[0].touchpoint_id] = total_value * 0.3
-
-            # Middle touchpoint gets 30% (simplified - should be lead creation)
-            middle_idx = num_touches // 2
-            credits[touchpoints[middle_idx].touchpoint_id] = total_value * 0.3
-
-            # Last touch gets 30%
-            credits[touchpoints[-1].touchpoint_id] = total_value * 0.3
-
-            # Remaining 10% distributed among other touches
-            other_touches = [tp for i, tp in enumerate(touchpoints)
-                           if i not in [0, middle_idx, num_touches - 1]]
-            if other_touches:
-                credit_per_other = (total_value * 0.1) / len(other_touches)
-                for tp in other_touches:
-                    credits[tp.touchpoint_id] = credit_per_other
-            else:
-                # If no other touches (e.g., exactly 3 touchpoints where all are key),
-                # distribute remaining 10% equally among the 3 key touchpoints
-                remaining_credit = (total_value * 0.1) / 3
-                credits[touchpoints[0].touchpoint_id] += remaining_credit
-                credits[touchpoints[middle_idx].touchpoint_id] += remaining_credit
-                credits[touchpoints[-1].touchpoint_id] += remaining_credit
 
-        return credits
+        One touch gets everything, two split it evenly, and with exactly
+        three the key touches also split the remaining 10%.
+        """
+        return AttributionCalculator._credits_by_touchpoint(
+            AttributionCalculator.w_shaped_bulk, touchpoints, total_value
+        )
 
     @staticmethod
     def full_path(touchpoints: List[Touchpoint], total_value: float) -> Dict[str, float]:
@@ -104,228 +247,438 @@ class AttributionCalculator:
         - 22.5% to opportunity creation
         - 22.5% to deal close
         - 10% distributed among remaining touches
+
+        With 4 or fewer touches the value is distributed equally.
         """
-        if not touchpoints:
-            return {}
+        return AttributionCalculator._credits_by_touchpoint(
+            AttributionCalculator.full_path_bulk, touchpoints, total_value
+        )
 
-        credits = {}
-        num_touches = len(touchpoints)
+    # Bulk scoring: many contacts at once in a flattened (CSR-style) layout.
+    # Touchpoints of contact i occupy positions offsets[i]:offsets[i + 1] and
+    # values[i] is the value to attribute; each method returns one credit per
+    # position. Contacts without touchpoints get no credit, as above.
 
-        if num_touches <= 4:
-            # If 4 or fewer touches, distribute equally
-            credit_per_touch = total_value / num_touches
-            return {tp.touchpoint_id: credit_per_touch for tp in touchpoints}
+    @staticmethod
+    def bulk_offsets(touchpoint_counts: List[int]) -> np.ndarray:
+        """Offsets array for contacts with the given numbers of touchpoints"""
+        offsets = np.zeros(len(touchpoint_counts) + 1, dtype=np.int64)
+        np.cumsum(touchpoint_counts, out=offsets[1:])
+        return offsets
 
-        # Key milestone indices
-        first_idx = 0
-        lead_idx = num_touches // 4
-        opp_idx = num_touches // 2
-        close_idx = num_touches - 1
+    @staticmethod
+    def first_touch_bulk(offsets: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """First-touch credits for many contacts"""
+        credits = np.zeros(offsets[-1])
+        has_touches = np.diff(offsets) > 0
+        credits[offsets[:-1][has_touches]] = values[has_touches]
+        return credits
 
-        # Assign credits to milestones
-        credits[touchpoints[first_idx].touchpoint_id] = total_value * 0.225
-        credits[touchpoints[lead_idx].touchpoint_id] = total_value * 0.225
-        credits[touchpoints[opp_idx].touchpoint_id] = total_value * 0.225
-        credits[touchpoints[close_idx].touchpoint_id] = total_value * 0.225
+    @staticmethod
+    def last_touch_bulk(offsets: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Last-touch credits for many contacts"""
+        credits = np.zeros(offsets[-1])
+        has_touches = np.diff(offsets) > 0
+        credits[offsets[1:][has_touches] - 1] = values[has_touches]
+        return credits
 
-        # Distribute remaining 10%
-        milestone_indices = {first_idx, lead_idx, opp_idx, close_idx}
-        other_touches = [tp for i, tp in enumerate(touchpoints) if i not in milestone_indices]
+    @staticmethod
+    def linear_bulk(offsets: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Linear credits for many contacts"""
+        counts = np.diff(offsets)
+        return np.repeat(values / np.maximum(counts, 1), counts)
 
-        if other_touches:
-            credit_per_other = (total_value * 0.1) / len(other_touches)
-            for tp in other_touches:
-                credits[tp.touchpoint_id] = credit_per_other
+    @staticmethod
+    def w_shaped_bulk(offsets: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """W-shaped credits for many contacts (same shares as w_shaped())"""
+        starts, counts = offsets[:-1], np.diff(offsets)
+
+        # Touches other than first/middle/last share 10%
+        credits = np.repeat(np.where(counts > 3, values * 0.1 / np.maximum(counts - 3, 1), 0.0), counts)
+
+        single = counts == 1
+        credits[starts[single]] = values[single]
+
+        pair = counts == 2
+        credits[starts[pair]] = values[pair] * 0.5
+        credits[starts[pair] + 1] = values[pair] * 0.5
+
+        # First, middle and last get 30% each; with exactly 3 touches they also split the 10%
+        many = counts >= 3
+        key_credit = np.where(counts[many] == 3, values[many] * 0.3 + values[many] * 0.1 / 3, values[many] * 0.3)
+        credits[starts[many]] = key_credit
+        credits[starts[many] + counts[many] // 2] = key_credit
+        credits[starts[many] + counts[many] - 1] = key_credit
+        return credits
 
+    @staticmethod
+    def full_path_bulk(offsets: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Full path credits for many contacts (same shares as full_path())"""
+        starts, counts = offsets[:-1], np.diff(offsets)
+
+        # Up to 4 touches split evenly; beyond that non-milestone touches share 10%
+        per_touch = np.where(counts <= 4, values / np.maximum(counts, 1), values * 0.1 / np.maximum(counts - 4, 1))
+        credits = np.repeat(per_touch, counts)
+
+        many = counts > 4
+        milestone_credit = values[many] * 0.225
+        for milestone in (0, counts[many] // 4, counts[many] // 2, counts[many] - 1):
+            credits[starts[many] + milestone] = milestone_credit
         return credits
 
 
 class CRMAttributionManager:
     """Manages CRM attribution and data model integration with HubSpot"""
 
+    # HubSpot batch read/update endpoints accept at most 100 inputs
+    HUBSPOT_BATCH_LIMIT = 100
+
+    # Attribution model name -> credit calculation
+    ATTRIBUTION_MODELS: ClassVar[Dict[str, Callable[[List[Touchpoint], float], Dict[str, float]]]] = {
+        "first_touch": AttributionCalculator.first_touch,
+        "last_touch": AttributionCalculator.last_touch,
+        "linear": AttributionCalculator.linear,
+        "w_shaped": AttributionCalculator.w_shaped,
+        "full_path": AttributionCalculator.full_path
+    }
+
+    # Touchpoint custom object properties (HUBSPOT_TOUCHPOINT_OBJECT_TYPE)
+    TOUCHPOINT_OBJECT_PROPERTIES = ["touchpoint_id", "contact_id", "touchpoint_json"]
+
+    # HubSpot search returns at most 200 results per page
+    HUBSPOT_SEARCH_PAGE_SIZE = 200
+
+    # Contact reads are reused for this long, unless this manager updates the contact first
+    CONTACT_CACHE_SIZE = 10_000
+    CONTACT_CACHE_TTL_SECONDS = 30
+
+    # Parsed touchpoint lists kept for re-attribution under other models
+    TOUCHPOINTS_CACHE_SIZE = 1_000
+
     def __init__(self):
-        self.hubspot = HubSpot(access_token=settings.hubspot_api_key)
+        self.hubspot = get_hubspot_client()
         self.calculator = AttributionCalculator()
+        # contact_id -> {properties: contact}
+        self._contact_cache = TTLCache(maxsize=self.CONTACT_CACHE_SIZE, ttl=self.CONTACT_CACHE_TTL_SECONDS)
+        self._contact_cache_lock = threading.Lock()
+        # (contact_id, all_touchpoints_json) -> validated touchpoints (frozen models, safe to share)
+        self._touchpoints_cache = LRUCache(maxsize=self.TOUCHPOINTS_CACHE_SIZE)
         logger.info("CRM Attribution Manager initialized")
 
+    def _get_contact_cached(self, contact_id: str, properties: Tuple[str, ...]) -> Any:
+        """Get a contact's properties, reusing a read made within CONTACT_CACHE_TTL_SECONDS"""
+        with self._contact_cache_lock:
+            contact = self._contact_cache.get(contact_id, {}).get(properties)
+        if contact is not None:
+            return contact
+
+        contact = self.hubspot.crm.contacts.basic_api.get_by_id(contact_id=contact_id, properties=list(properties))
+        with self._contact_cache_lock:
+            self._contact_cache.setdefault(contact_id, {})[properties] = contact
+        return contact
+
+    def _invalidate_contacts(self, contact_ids: List[str]) -> None:
+        """Drop cached reads of contacts this manager just updated"""
+        with self._contact_cache_lock:
+            for contact_id in contact_ids:
+                self._contact_cache.pop(contact_id, None)
+
     def install_tracking_code(self) -> str:
         """
         Generate HubSpot tracking code snippet for web properties
         Returns: JavaScript tracking code
         """
-        tracking_code = f"""
-<!-- HubSpot Tracking Code -->
-<script type="text/javascript" id="hs-script-loader" async defer src="//js.hs-scripts.com/{settings.hubspot_portal_id}.js"></script>
+        return _tracking_code(settings.hubspot_portal_id)
 
-<!-- Custom UTM and Click ID Capture -->
-<script>
-(function() {{
-    // Parse URL parameters
-    function getUrlParameter(name) {{
-        name = name.replace(/[\\[]/, '\\\\[').replace(/[\\]]/, '\\\\]');
-        var regex = new RegExp('[\\\\?&]' + name + '=([^&#]*)');
-        var results = regex.exec(location.search);
-        return results === null ? '' : decodeURIComponent(results[1].replace(/\\+/g, ' '));
-    }}
+    def create_custom_contact_properties(self) -> None:
+        """Create custom contact properties in HubSpot for attribution tracking"""
+        try:
+            existing = {prop.name for prop in self.hubspot.crm.properties.core_api.get_all(object_type="contacts").results}
+            missing = [dict(prop) for prop in CUSTOM_CONTACT_PROPERTIES if prop["name"] not in existing]
+            if not missing:
+                logger.info("Custom contact properties already exist")
+                return
+
+            response = self.hubspot.crm.properties.batch_api.create(
+                object_type="contacts",
+                batch_input_property_create=BatchInputPropertyCreate(inputs=missing)
+            )
+            for prop in response.results:
+                logger.info(f"Created custom property: {prop.name}")
+            for error in getattr(response, "errors", None) or []:
+                logger.error(f"Error creating custom property: {error.message}")
+        except Exception as e:
+            logger.error(f"Error creating custom contact properties: {e}")
 
-    // Store UTM parameters and click IDs
-    function captureTrackingParameters() {{
-        var params = {{
-            utm_source: getUrlParameter('utm_source'),
-            utm_medium: getUrlParameter('utm_medium'),
-            utm_campaign: getUrlParameter('utm_campaign'),
-            utm_term: getUrlParameter('utm_term'),
-            utm_content: getUrlParameter('utm_content'),
-            gclid: getUrlParameter('gclid'),
-            fbclid: getUrlParameter('fbclid'),
-            msclkid: getUrlParameter('msclkid'),
-            li_fat_id: getUrlParameter('li_fat_id'),
-            partner_id: getUrlParameter('partner_id')
-        }};
+    def create_touchpoint_object_schema(self) -> None:
+        """
+        Create the touchpoint custom object in HubSpot
 
-        // Store in sessionStorage for session tracking
-        sessionStorage.setItem('tracking_params_' + Date.now(), JSON.stringify(params));
+        With HUBSPOT_TOUCHPOINT_OBJECT_TYPE set to the created object type,
+        each touchpoint is stored as its own record associated with the contact
+        instead of being appended to the contact's all_touchpoints_json.
+        """
+        schema = {
+            "name": "touchpoints",
+            "labels": {"singular": "Touchpoint", "plural": "Touchpoints"},
+            "primaryDisplayProperty": "touchpoint_id",
+            "requiredProperties": ["touchpoint_id"],
+            "searchableProperties": ["touchpoint_id", "contact_id"],
+            "associatedObjects": ["CONTACT"],
+            "properties": [
+                {"name": "touchpoint_id", "label": "Touchpoint ID", "type": "string", "fieldType": "text"},
+                {"name": "contact_id", "label": "Contact ID", "type": "string", "fieldType": "text"},
+                {"name": "touchpoint_json", "label": "Touchpoint (JSON)", "type": "string", "fieldType": "textarea"}
+            ]
+        }
 
-        // Send to HubSpot via Forms API or track as event
-        if (window._hsq) {{
-            window._hsq.push(['setPath', window.location.pathname]);
-            window._hsq.push(['trackPageView']);
+        try:
+            created = self.hubspot.crm.schemas.core_api.create(object_schema_egg=schema)
+            logger.info(f"Created touchpoint object schema: {created.object_type_id}")
+        except Exception as e:
+            if "already exists" in str(e).lower():
+                logger.info("Touchpoint object schema already exists")
+            else:
+                logger.error(f"Error creating touchpoint object schema: {e}")
+                raise
 
-            // Set custom properties
-            for (var key in params) {{
-                if (params[key]) {{
-                    window._hsq.push(['identify', {{[key]: params[key]}}]);
-                }}
-            }}
-        }}
-    }}
+    def capture_touchpoint(self, contact_id: str, touchpoint: Touchpoint) -> None:
+        """
+        Capture and store a touchpoint for a contact in HubSpot
+        """
+        error = self.capture_touchpoints_batch([(contact_id, touchpoint)])[0]
+        if error is not None:
+            raise error
 
-    // Execute on page load
-    if (document.readyState === 'loading') {{
-        document.addEventListener('DOMContentLoaded', captureTrackingParameters);
-    }} else {{
-        captureTrackingParameters();
-    }}
-}})();
-</script>
-"""
-        return tracking_code
+    def capture_touchpoints_batch(self, items: List[Tuple[str, Touchpoint]]) -> List[Optional[Exception]]:
+        """
+        Capture and store many touchpoints with HubSpot batch reads and updates
 
-    def create_custom_contact_properties(self) -> None:
-        """Create custom contact properties in HubSpot for attribution tracking"""
-        custom_properties = [
-            {
-                "name": "first_touch_utm_source",
-                "label": "First Touch UTM Source",
-                "type": "string",
-                "fieldType": "text",
-                "groupName": "contactinformation"
-            },
-            {
-                "name": "first_touch_utm_campaign",
-                "label": "First Touch UTM Campaign",
-                "type": "string",
-                "fieldType": "text",
-                "groupName": "contactinformation"
-            },
-            {
-                "name": "last_touch_utm_source",
-                "label": "Last Touch UTM Source",
-                "type": "string",
-                "fieldType": "text",
-                "groupName": "contactinformation"
-            },
-            {
-                "name": "last_touch_utm_campaign",
-                "label": "Last Touch UTM Campaign",
-                "type": "string",
-                "fieldType": "text",
-                "groupName": "contactinformation"
-            },
-            {
-                "name": "all_touchpoints_json",
-                "label": "All Touchpoints (JSON)",
-                "type": "string",
-                "fieldType": "textarea",
-                "groupName": "contactinformation"
-            },
-            {
-                "name": "gclid",
-                "label": "Google Click ID (GCLID)",
-                "type": "string",
-                "fieldType": "text",
-                "groupName": "contactinformation"
-            },
-            {
-                "name": "fbclid",
-                "label": "Facebook Click ID",
-                "type": "string",
-                "fieldType": "text",
-                "groupName": "contactinformation"
-            },
-            {
-                "name": "partner_id",
-                "label": "Partner/Affiliate ID",
-                "type": "string",
-                "fieldType": "text",
-                "groupName": "contactinformation"
-            },
-            {
-                "name": "attributed_revenue",
-                "label": "Attributed Revenue",
-                "type": "number",
-                "fieldType": "number",
-                "groupName": "contactinformation"
-            }
-        ]
+        Contacts are read and updated HUBSPOT_BATCH_LIMIT at a time, so N
+        touchpoints cost about 2N / 100 round-trips instead of 2N. Several
+        touchpoints for one contact are appended in the order given. With
+        HUBSPOT_TOUCHPOINT_OBJECT_TYPE set, touchpoints are created as custom
+        object records instead, so capture no longer reads the contact's history.
 
-        for prop in custom_properties:
-            try:
-                self.hubspot.crm.properties.core_api.create(
-                    object_type="contacts",
-                    property_create=prop
-                )
-                logger.info(f"Created custom property: {prop['name']}")
-            except Exception as e:
-                if "already exists" in str(e).lower():
-                    logger.info(f"Property {prop['name']} already exists")
-                else:
-                    logger.error(f"Error creating property {prop['name']}: {e}")
+        Args:
+            items: (contact_id, touchpoint) pairs
 
-    def capture_touchpoint(self, contact_id: str, touchpoint: Touchpoint) -> None:
+        Returns:
+            One entry per item, in order: None if captured, or the Exception
+            raised for that item
         """
-        Capture and store a touchpoint for a contact in HubSpot
-        """
-        try:
-            # Get existing contact
-            contact = self.hubspot.crm.contacts.basic_api.get_by_id(
-                contact_id=contact_id,
-                properties=["all_touchpoints_json", "lifecyclestage"]
+        touchpoints_by_contact: Dict[str, List[int]] = {}
+        for index, (contact_id, _) in enumerate(items):
+            touchpoints_by_contact.setdefault(contact_id, []).append(index)
+
+        results: List[Optional[Exception]] = [None] * len(items)
+        contact_ids = list(touchpoints_by_contact)
+
+        for start in range(0, len(contact_ids), self.HUBSPOT_BATCH_LIMIT):
+            chunk = contact_ids[start:start + self.HUBSPOT_BATCH_LIMIT]
+            try:
+                if settings.hubspot_touchpoint_object_type:
+                    self._capture_touchpoint_objects_chunk(chunk, items, touchpoints_by_contact, results)
+                else:
+                    self._capture_touchpoints_chunk(chunk, items, touchpoints_by_contact, results)
+            except Exception as e:
+                logger.error(f"Error capturing touchpoints for {len(chunk)} contacts: {e}")
+                for contact_id in chunk:
+                    for index in touchpoints_by_contact[contact_id]:
+                        results[index] = e
+
+        logger.info(
+            f"Captured touchpoint batch: {sum(r is None for r in results)} captured, "
+            f"{sum(r is not None for r in results)} failed"
+        )
+        return results
+
+    def _capture_touchpoints_chunk(
+        self,
+        contact_ids: List[str],
+        items: List[Tuple[str, Touchpoint]],
+        touchpoints_by_contact: Dict[str, List[int]],
+        results: List[Optional[Exception]]
+    ) -> None:
+        """Read, append to and update up to HUBSPOT_BATCH_LIMIT contacts' touchpoints"""
+        response = self.hubspot.crm.contacts.batch_api.read(
+            batch_read_input_simple_public_object_id=BatchReadInputSimplePublicObjectId(
+                properties=["all_touchpoints_json", "lifecyclestage"],
+                inputs=[{"id": contact_id} for contact_id in contact_ids]
             )
+        )
+        contacts = {contact.id: contact for contact in response.results}
+
+        updates = []
+        for contact_id in contact_ids:
+            indices = touchpoints_by_contact[contact_id]
+            contact = contacts.get(contact_id)
+            if contact is None:
+                error = SyncError("hubspot", f"Contact {contact_id} not found")
+                logger.error(f"Error capturing touchpoint: {error}")
+                for index in indices:
+                    results[index] = error
+                continue
 
             # Parse existing touchpoints
-            import json
             existing_touchpoints = []
             if contact.properties.get("all_touchpoints_json"):
-                existing_touchpoints = json.loads(contact.properties["all_touchpoints_json"])
+                existing_touchpoints = orjson.loads(contact.properties["all_touchpoints_json"])
+            is_first_touch = not existing_touchpoints
+
+            # Add new touchpoints
+            new_touchpoints = [items[index][1] for index in indices]
+            existing_touchpoints.extend(touchpoint.model_dump(mode='json') for touchpoint in new_touchpoints)
+
+            properties = self._touchpoint_properties(new_touchpoints, is_first_touch)
+            properties["all_touchpoints_json"] = orjson.dumps(existing_touchpoints).decode()
+            updates.append({"id": contact_id, "properties": properties})
+
+        # Update every found contact with its new touchpoint data in one call
+        if updates:
+            self.hubspot.crm.contacts.batch_api.update(
+                batch_input_simple_public_object_batch_input=BatchInputSimplePublicObjectBatchInput(
+                    inputs=updates
+                )
+            )
+            self._invalidate_contacts([update["id"] for update in updates])
+            for update in updates:
+                logger.info(f"Captured touchpoint for contact {update['id']}")
+
+    def _capture_touchpoint_objects_chunk(
+        self,
+        contact_ids: List[str],
+        items: List[Tuple[str, Touchpoint]],
+        touchpoints_by_contact: Dict[str, List[int]],
+        results: List[Optional[Exception]]
+    ) -> None:
+        """Create touchpoint records for up to HUBSPOT_BATCH_LIMIT contacts and update their summaries"""
+        object_type = settings.hubspot_touchpoint_object_type
+
+        # Only the summary fields are read, never the touchpoint history
+        response = self.hubspot.crm.contacts.batch_api.read(
+            batch_read_input_simple_public_object_id=BatchReadInputSimplePublicObjectId(
+                properties=["touchpoint_count", "first_touch_utm_source"],
+                inputs=[{"id": contact_id} for contact_id in contact_ids]
+            )
+        )
+        contacts = {contact.id: contact for contact in response.results}
+
+        records = []
+        updates = []
+        for contact_id in contact_ids:
+            indices = touchpoints_by_contact[contact_id]
+            contact = contacts.get(contact_id)
+            if contact is None:
+                error = SyncError("hubspot", f"Contact {contact_id} not found")
+                logger.error(f"Error capturing touchpoint: {error}")
+                for index in indices:
+                    results[index] = error
+                continue
+
+            new_touchpoints = [items[index][1] for index in indices]
+            records.extend(
+                {
+                    "properties": {
+                        "touchpoint_id": touchpoint.touchpoint_id,
+                        "contact_id": contact_id,
+                        "touchpoint_json": touchpoint.model_dump_json()
+                    }
+                }
+                for touchpoint in new_touchpoints
+            )
 
-            # Add new touchpoint
-            touchpoint_dict = touchpoint.model_dump(mode='json')
-            existing_touchpoints.append(touchpoint_dict)
+            # Contacts captured before touchpoint_count existed still have their first touch recorded
+            count = int(float(contact.properties.get("touchpoint_count") or 0))
+            is_first_touch = not count and not contact.properties.get("first_touch_utm_source")
+            properties = self._touchpoint_properties(new_touchpoints, is_first_touch)
+            properties["touchpoint_count"] = str(count + len(new_touchpoints))
+            updates.append({"id": contact_id, "properties": properties})
 
-            # Update contact with new touchpoint data
-            properties = {
-                "all_touchpoints_json": json.dumps(existing_touchpoints),
-                "last_touch_utm_source": touchpoint.utm_parameters.utm_source or "",
-                "last_touch_utm_campaign": touchpoint.utm_parameters.utm_campaign or "",
-            }
+        if not records:
+            return
+
+        created = self.hubspot.crm.objects.batch_api.create(
+            object_type=object_type,
+            batch_input_simple_public_object_batch_input_for_create=BatchInputSimplePublicObjectBatchInputForCreate(
+                inputs=records
+            )
+        )
+
+        # Batch create doesn't preserve input order; each record carries its contact ID
+        self.hubspot.crm.associations.v4.batch_api.create_default(
+            from_object_type=object_type,
+            to_object_type="contacts",
+            batch_input_public_default_association_multi_post=BatchInputPublicDefaultAssociationMultiPost(
+                inputs=[
+                    {"from": {"id": record.id}, "to": {"id": record.properties["contact_id"]}}
+                    for record in created.results
+                ]
+            )
+        )
+
+        self.hubspot.crm.contacts.batch_api.update(
+            batch_input_simple_public_object_batch_input=BatchInputSimplePublicObjectBatchInput(
+                inputs=updates
+            )
+        )
+        self._invalidate_contacts([update["id"] for update in updates])
+        for update in updates:
+            logger.info(f"Captured touchpoint for contact {update['id']}")
 
-            # If this is the first touchpoint
-            if len(existing_touchpoints) == 1:
-                properties["first_touch_utm_source"] = touchpoint.utm_parameters.utm_source or ""
-                properties["first_touch_utm_campaign"] = touchpoint.utm_parameters.utm_campaign or ""
+    def _stored_touchpoints(self, contact_ids: List[str]) -> Dict[str, List[Touchpoint]]:
+        """
+        Touchpoint custom object records of contacts, oldest first
+
+        Returns an empty dict when HUBSPOT_TOUCHPOINT_OBJECT_TYPE is not set.
+        """
+        object_type = settings.hubspot_touchpoint_object_type
+        if not object_type:
+            return {}
+
+        touchpoints: Dict[str, List[Touchpoint]] = {contact_id: [] for contact_id in contact_ids}
+        for start in range(0, len(contact_ids), self.HUBSPOT_BATCH_LIMIT):
+            chunk = contact_ids[start:start + self.HUBSPOT_BATCH_LIMIT]
+            after = None
+            while True:
+                response = self.hubspot.crm.objects.search_api.do_search(
+                    object_type=object_type,
+                    public_object_search_request=PublicObjectSearchRequest(
+                        filter_groups=[{"filters": [{"propertyName": "contact_id", "operator": "IN", "values": chunk}]}],
+                        properties=self.TOUCHPOINT_OBJECT_PROPERTIES,
+                        limit=self.HUBSPOT_SEARCH_PAGE_SIZE,
+                        after=after
+                    )
+                )
+                for record in response.results:
+                    touchpoints[record.properties["contact_id"]].append(
+                        Touchpoint.model_validate_json(record.properties["touchpoint_json"])
+                    )
+                if not response.paging or not response.paging.next:
+                    break
+                after = response.paging.next.after
+
+        for contact_touchpoints in touchpoints.values():
+            contact_touchpoints.sort(key=lambda touchpoint: touchpoint.timestamp.timestamp())
+        return touchpoints
+
+    @staticmethod
+    def _touchpoint_properties(new_touchpoints: List[Touchpoint], is_first_touch: bool) -> Dict[str, str]:
+        """Contact summary properties to write after capturing new touchpoints (oldest first)"""
+        last = new_touchpoints[-1]
+        properties = {
+            "last_touch_utm_source": last.utm_parameters.utm_source or "",
+            "last_touch_utm_campaign": last.utm_parameters.utm_campaign or "",
+        }
+
+        # If the contact had no touchpoints before
+        if is_first_touch:
+            first = new_touchpoints[0]
+            properties["first_touch_utm_source"] = first.utm_parameters.utm_source or ""
+            properties["first_touch_utm_campaign"] = first.utm_parameters.utm_campaign or ""
 
-            # Store click IDs
+        # Store click IDs (the latest one wins)
+        for touchpoint in new_touchpoints:
             if touchpoint.click_ids.gclid:
                 properties["gclid"] = touchpoint.click_ids.gclid
             if touchpoint.click_ids.fbclid:
@@ -333,16 +686,7 @@ class CRMAttributionManager:
             if touchpoint.partner_id:
                 properties["partner_id"] = touchpoint.partner_id
 
-            self.hubspot.crm.contacts.basic_api.update(
-                contact_id=contact_id,
-                simple_public_object_input={"properties": properties}
-            )
-
-            logger.info(f"Captured touchpoint for contact {contact_id}")
-
-        except Exception as e:
-            logger.error(f"Error capturing touchpoint: {e}")
-            raise
+        return properties
 
     def calculate_attribution(
         self,
@@ -358,37 +702,10 @@ class CRMAttributionManager:
 
         # Get contact touchpoints
         try:
-            contact = self.hubspot.crm.contacts.basic_api.get_by_id(
-                contact_id=contact_id,
-                properties=["all_touchpoints_json"]
-            )
-
-            import json
-            touchpoints_data = json.loads(
-                contact.properties.get("all_touchpoints_json", "[]")
-            )
-            touchpoints = [Touchpoint(**tp) for tp in touchpoints_data]
-
-            # Calculate credits based on model
-            if model_type == "first_touch":
-                credits = self.calculator.first_touch(touchpoints, total_value)
-            elif model_type == "last_touch":
-                credits = self.calculator.last_touch(touchpoints, total_value)
-            elif model_type == "linear":
-                credits = self.calculator.linear(touchpoints, total_value)
-            elif model_type == "w_shaped":
-                credits = self.calculator.w_shaped(touchpoints, total_value)
-            elif model_type == "full_path":
-                credits = self.calculator.full_path(touchpoints, total_value)
-            else:
-                raise ValueError(f"Unknown attribution model: {model_type}")
+            contact = self._get_contact_cached(contact_id, ("all_touchpoints_json",))
 
-            attribution = AttributionModel(
-                contact_id=contact_id,
-                model_type=model_type,
-                touchpoint_credits=credits,
-                total_value=total_value
-            )
+            stored_touchpoints = self._stored_touchpoints([contact_id]).get(contact_id)
+            attribution = self._build_attribution(contact_id, contact, total_value, model_type, stored_touchpoints)
 
             # Update contact with attributed revenue
             self.hubspot.crm.contacts.basic_api.update(
@@ -397,6 +714,7 @@ class CRMAttributionManager:
                     "properties": {"attributed_revenue": str(total_value)}
                 }
             )
+            self._invalidate_contacts([contact_id])
 
             logger.info(f"Calculated {model_type} attribution for contact {contact_id}")
             return attribution
@@ -405,6 +723,115 @@ class CRMAttributionManager:
             logger.error(f"Error calculating attribution: {e}")
             raise
 
+    def calculate_attribution_batch(
+        self,
+        attribution_requests: List[Dict[str, Any]]
+    ) -> List[Union[AttributionModel, Exception]]:
+        """
+        Calculate attribution for several contacts with one HubSpot read and one update
+
+        Args:
+            attribution_requests: Dicts with contact_id, total_value and optional model_type
+                (at most HUBSPOT_BATCH_LIMIT distinct contacts)
+
+        Returns:
+            One entry per request, in order: the AttributionModel, or the Exception
+            raised for that request
+        """
+        contact_ids = list(dict.fromkeys(r["contact_id"] for r in attribution_requests))
+        if len(contact_ids) > self.HUBSPOT_BATCH_LIMIT:
+            raise ValidationError("attribution_requests", f"Batch cannot exceed {self.HUBSPOT_BATCH_LIMIT} contacts")
+
+        response = self.hubspot.crm.contacts.batch_api.read(
+            batch_read_input_simple_public_object_id=BatchReadInputSimplePublicObjectId(
+                properties=["all_touchpoints_json"],
+                inputs=[{"id": contact_id} for contact_id in contact_ids]
+            )
+        )
+        contacts = {contact.id: contact for contact in response.results}
+        stored_touchpoints = self._stored_touchpoints(list(contacts))
+
+        results: List[Union[AttributionModel, Exception]] = []
+        revenue_updates: Dict[str, str] = {}
+
+        for request in attribution_requests:
+            contact_id = request["contact_id"]
+            try:
+                contact = contacts.get(contact_id)
+                if contact is None:
+                    raise AttributionCalculationError(contact_id, "Contact not found in HubSpot")
+
+                attribution = self._build_attribution(
+                    contact_id,
+                    contact,
+                    request["total_value"],
+                    request.get("model_type") or settings.attribution_model,
+                    stored_touchpoints.get(contact_id)
+                )
+                revenue_updates[contact_id] = str(attribution.total_value)
+                results.append(attribution)
+            except Exception as e:
+                logger.error(f"Error calculating attribution for contact {contact_id}: {e}")
+                results.append(e)
+
+        # Update attributed revenue for every successful contact in one call
+        if revenue_updates:
+            self.hubspot.crm.contacts.batch_api.update(
+                batch_input_simple_public_object_batch_input=BatchInputSimplePublicObjectBatchInput(
+                    inputs=[
+                        {"id": contact_id, "properties": {"attributed_revenue": value}}
+                        for contact_id, value in revenue_updates.items()
+                    ]
+                )
+            )
+            self._invalidate_contacts(list(revenue_updates))
+
+        logger.info(
+            f"Calculated attribution batch: {len(revenue_updates)} contacts updated, "
+            f"{sum(isinstance(r, Exception) for r in results)} failed"
+        )
+        return results
+
+    def _parse_touchpoints(self, contact_id: str, touchpoints_json: str) -> List[Touchpoint]:
+        """Validate a contact's all_touchpoints_json, reusing the result while the JSON is unchanged"""
+        key = (contact_id, touchpoints_json)
+        with self._contact_cache_lock:
+            touchpoints = self._touchpoints_cache.get(key)
+        if touchpoints is None:
+            # Parse and validate in one pass through pydantic-core's JSON parser
+            touchpoints = TOUCHPOINT_ADAPTER.validate_json(touchpoints_json)
+            with self._contact_cache_lock:
+                self._touchpoints_cache[key] = touchpoints
+        return touchpoints
+
+    def _build_attribution(
+        self,
+        contact_id: str,
+        contact: Any,
+        total_value: float,
+        model_type: str,
+        stored_touchpoints: Optional[List[Touchpoint]] = None
+    ) -> AttributionModel:
+        """Calculate credits for a fetched HubSpot contact (plus its touchpoint records) using the given model"""
+        touchpoints = self._parse_touchpoints(contact_id, contact.properties.get("all_touchpoints_json") or "[]")
+        if stored_touchpoints:
+            # Touchpoints captured before the custom object was enabled come first
+            touchpoints = touchpoints + stored_touchpoints
+
+        # Calculate credits based on model
+        try:
+            calculate = self.ATTRIBUTION_MODELS[model_type]
+        except KeyError:
+            raise ValueError(f"Unknown attribution model: {model_type}") from None
+        credits = calculate(touchpoints, total_value)
+
+        return AttributionModel(
+            contact_id=contact_id,
+            model_type=model_type,
+            touchpoint_credits=credits,
+            total_value=total_value
+        )
+
     def setup_lifecycle_workflows(self) -> Dict:
         """
         Returns workflow configuration for HubSpot lifecycle stage management
@@ -464,21 +891,21 @@ class CRMAttributionManager:
     def get_contact_attribution_report(self, contact_id: str) -> Dict:
         """Get comprehensive attribution report for a contact"""
         try:
-            contact = self.hubspot.crm.contacts.basic_api.get_by_id(
-                contact_id=contact_id,
-                properties=[
-                    "email",
-                    "lifecyclestage",
-                    "all_touchpoints_json",
-                    "attributed_revenue",
-                    "first_touch_utm_source",
-                    "last_touch_utm_source"
-                ]
+            contact = self._get_contact_cached(contact_id, (
+                "email",
+                "lifecyclestage",
+                "all_touchpoints_json",
+                "attributed_revenue",
+                "first_touch_utm_source",
+                "last_touch_utm_source"
+            ))
+
+            touchpoints_data = orjson.loads(
+                contact.properties.get("all_touchpoints_json") or "[]"
             )
-
-            import json
-            touchpoints_data = json.loads(
-                contact.properties.get("all_touchpoints_json", "[]")
+            touchpoints_data.extend(
+                touchpoint.model_dump(mode='json')
+                for touchpoint in self._stored_touchpoints([contact_id]).get(contact_id, [])
             )
 
             report = {
@@ -0,0 +1,17 @@
+"""
+Shared HubSpot Client
+
+This module provides the process-wide HubSpot SDK client. The client holds
+only configuration and a pooled HTTP connection manager, so every manager
+reuses one instance instead of building its own.
+"""
+from functools import lru_cache
+from hubspot import HubSpot
+
+from config import settings
+
+
+@lru_cache(maxsize=1)
+def get_hubspot_client() -> HubSpot:
+    """Get the shared HubSpot client, creating it on first use"""
+    return HubSpot(access_token=settings.hubspot_api_key)
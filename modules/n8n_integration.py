@@ -8,7 +8,7 @@ Provides bidirectional integration between LangChain and n8n:
 - Pass attribution intelligence to visual workflows
 """
 import requests
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
 from loguru import logger
 import json
@@ -267,18 +267,21 @@ class N8nIntegrationManager:
         self.webhook_handlers[event_type] = handler
         logger.info(f"Registered webhook handler for event type: {event_type}")
 
-    def process_webhook(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def process_webhook(self, payload: Union[N8nWebhookPayload, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Process incoming webhook from n8n
 
         Args:
-            payload: Webhook payload from n8n
+            payload: Webhook payload from n8n, either already validated or as a raw dict
 
         Returns:
             Processing result
         """
         try:
-            webhook_payload = N8nWebhookPayload(**payload)
+            if isinstance(payload, N8nWebhookPayload):
+                webhook_payload = payload
+            else:
+                webhook_payload = N8nWebhookPayload.model_validate(payload)
 
             logger.info(
                 f"Processing n8n webhook: {webhook_payload.event_type} | "
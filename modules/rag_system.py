@@ -3,8 +3,11 @@ RAG (Retrieval-Augmented Generation) System using Supabase
 This module provides vector storage and retrieval capabilities using Supabase pgvector.
 """
 import os
-from typing import List, Dict, Optional, Any
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Optional, Any, Tuple
 from loguru import logger
+import numpy as np
 import openai
 from supabase import create_client, Client
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -129,7 +132,8 @@ class SupabaseVectorStore:
         self,
         query: str,
         k: int = 4,
-        filter_metadata: Optional[Dict] = None
+        filter_metadata: Optional[Dict] = None,
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """
         Search for similar documents using vector similarity
@@ -138,13 +142,15 @@ class SupabaseVectorStore:
             query: Query text
             k: Number of results to return
             filter_metadata: Optional metadata filter
+            query_embedding: Precomputed embedding of the query, if available
 
         Returns:
             List of documents with similarity scores
         """
         try:
             # Generate query embedding
-            query_embedding = self._generate_embedding(query)
+            if query_embedding is None:
+                query_embedding = self._generate_embedding(query)
 
             # Use Supabase RPC function for vector similarity search
             # This requires a custom SQL function to be created in Supabase
@@ -199,6 +205,83 @@ class SupabaseVectorStore:
             return 0
 
 
+class SemanticQueryCache:
+    """
+    In-memory LRU cache of RAG answers keyed by query embedding similarity
+
+    A lookup hits when a cached query with the same scope (e.g. k and model)
+    has cosine similarity at or above the threshold.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.97, max_entries: int = 1000):
+        """
+        Initialize the semantic cache
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum cached answers before the least recently used is evicted
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[Tuple, np.ndarray, Dict[str, Any]]]" = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, embedding: List[float], scope: Tuple) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached answer for a semantically similar query
+
+        Args:
+            embedding: Query embedding
+            scope: Parameters that must match exactly (e.g. (k, model))
+
+        Returns:
+            Cached result or None on a miss
+        """
+        query_vector = self._normalize(embedding)
+
+        with self._lock:
+            candidates = [
+                (entry_id, vector)
+                for entry_id, (entry_scope, vector, _) in self._entries.items()
+                if entry_scope == scope
+            ]
+            if not candidates:
+                return None
+
+            entry_ids, vectors = zip(*candidates)
+            scores = np.stack(vectors) @ query_vector
+            best = int(np.argmax(scores))
+            if scores[best] < self.similarity_threshold:
+                return None
+
+            self._entries.move_to_end(entry_ids[best])
+            return dict(self._entries[entry_ids[best]][2])
+
+    def put(self, embedding: List[float], scope: Tuple, result: Dict[str, Any]) -> None:
+        """Cache a result, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[self._next_id] = (scope, self._normalize(embedding), dict(result))
+            self._next_id += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached answers (e.g. after the knowledge base changes)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class RAGKnowledgeBase:
     """RAG-based knowledge base for HubSpot integration using Supabase"""
 
@@ -227,6 +310,9 @@ class RAGKnowledgeBase:
         self.openai_api_key = openai_api_key
         openai.api_key = openai_api_key
 
+        # Near-duplicate questions reuse earlier answers instead of re-running search + LLM
+        self.query_cache = SemanticQueryCache()
+
         logger.info("RAG Knowledge Base initialized")
 
     def load_documents_from_directory(
@@ -317,6 +403,7 @@ class RAGKnowledgeBase:
         # Add to vector store
         if documents:
             self.vector_store.add_documents(documents)
+            self.query_cache.clear()
             logger.info(f"Knowledge base initialized with {len(documents)} documents")
         else:
             logger.warning("No documents found to initialize knowledge base")
@@ -340,8 +427,19 @@ class RAGKnowledgeBase:
             Dictionary with answer and sources
         """
         try:
+            query_embedding = self.vector_store._generate_embedding(question)
+
+            cached = self.query_cache.get(query_embedding, scope=(k, model))
+            if cached is not None:
+                logger.info("Answered knowledge base query from semantic cache")
+                return cached
+
             # Retrieve relevant documents
-            similar_docs = self.vector_store.similarity_search(question, k=k)
+            similar_docs = self.vector_store.similarity_search(
+                question,
+                k=k,
+                query_embedding=query_embedding
+            )
 
             if not similar_docs:
                 return {
@@ -389,11 +487,14 @@ Answer:"""
                 for doc in similar_docs
             ]
 
-            return {
+            result = {
                 "answer": answer,
                 "sources": sources,
                 "retrieved_docs": len(similar_docs)
             }
+            self.query_cache.put(query_embedding, scope=(k, model), result=result)
+
+            return result
 
         except Exception as e:
             logger.error(f"Error querying knowledge base: {e}")
@@ -415,13 +516,15 @@ Answer:"""
             "metadata": metadata
         }
         self.vector_store.add_documents([document])
+        self.query_cache.clear()
         logger.info("Added custom document to knowledge base")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get knowledge base statistics"""
         return {
             "total_documents": self.vector_store.get_document_count(),
-            "table_name": self.vector_store.table_name
+            "table_name": self.vector_store.table_name,
+            "cached_queries": len(self.query_cache)
         }
 
 
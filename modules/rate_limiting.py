@@ -0,0 +1,210 @@
+"""
+Token Bucket Rate Limiting
+
+This module provides a token-bucket limiter for outbound API quotas. When
+Redis is configured the bucket lives in Redis and is consumed by an atomic
+Lua script, so every worker process draws from the same budget; otherwise
+(or if Redis is unreachable) each process keeps its own in-memory bucket.
+"""
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Optional
+from loguru import logger
+
+# Refill the bucket for the time elapsed since the last call, then take one
+# token or return how many milliseconds until one is available
+_CONSUME_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate) * 2)
+return wait
+"""
+
+
+class TokenBucket:
+    """Token bucket allowing bursts up to capacity and refilling at capacity / period"""
+
+    def __init__(self, name: str, capacity: int, period_seconds: float, redis_url: str = "", key_prefix: str = "ratelimit:"):
+        """
+        Initialize the bucket
+
+        Args:
+            name: Bucket name, shared by every process limiting the same quota
+            capacity: Calls allowed per period (and the maximum burst)
+            period_seconds: Length of the quota period, in seconds
+            redis_url: Redis connection URL (empty for a per-process bucket)
+            key_prefix: Prefix of the Redis key holding the bucket state
+        """
+        self.name = name
+        self.capacity = capacity
+        self.period_seconds = period_seconds
+        self.redis_url = redis_url
+        self.key = key_prefix + name
+        self._rate_per_ms = capacity / (period_seconds * 1000)
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._redis = None
+        self._async_redis = None
+
+    def _try_acquire_local(self) -> float:
+        """Take a token from the in-process bucket, or return seconds until one is available"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed_ms = (now - self._updated_at) * 1000
+            self._tokens = min(self.capacity, self._tokens + elapsed_ms * self._rate_per_ms)
+            self._updated_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self._rate_per_ms / 1000
+
+    def _try_acquire(self) -> float:
+        """Take a token, or return seconds until one is available"""
+        if not self.redis_url:
+            return self._try_acquire_local()
+        try:
+            if self._redis is None:
+                from redis import Redis
+
+                self._redis = Redis.from_url(self.redis_url)
+            return int(self._redis.eval(_CONSUME_SCRIPT, 1, self.key, self.capacity, self._rate_per_ms)) / 1000
+        except Exception as e:
+            logger.warning(f"Rate limit bucket {self.name} unavailable in Redis, limiting per process: {e}")
+            return self._try_acquire_local()
+
+    async def _try_acquire_async(self) -> float:
+        """Take a token without blocking the event loop, or return seconds until one is available"""
+        if not self.redis_url:
+            return self._try_acquire_local()
+        try:
+            if self._async_redis is None:
+                from redis.asyncio import Redis
+
+                self._async_redis = Redis.from_url(self.redis_url)
+            wait_ms = await self._async_redis.eval(_CONSUME_SCRIPT, 1, self.key, self.capacity, self._rate_per_ms)
+            return int(wait_ms) / 1000
+        except Exception as e:
+            logger.warning(f"Rate limit bucket {self.name} unavailable in Redis, limiting per process: {e}")
+            return self._try_acquire_local()
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available, then take it"""
+        while (wait := self._try_acquire()) > 0:
+            logger.debug(f"Rate limit bucket {self.name} empty, waiting {wait:.2f}s")
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait on the event loop until a token is available, then take it"""
+        while (wait := await self._try_acquire_async()) > 0:
+            logger.debug(f"Rate limit bucket {self.name} empty, waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> Optional[bool]:
+        return None
+
+    def __call__(self, func: Callable) -> Callable:
+        """Decorate a function (sync or async) so each call first takes a token"""
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                await self.acquire_async()
+                return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self.acquire()
+            return func(*args, **kwargs)
+
+        return wrapper
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """
+    Token bucket whose refill rate adapts to the platform's responses
+
+    Each successful call raises the rate additively and each throttling
+    response (429/503) halves it, so the bucket converges on the rate the
+    platform actually accepts instead of a hardcoded guess. The learned rate
+    is per process; the tokens themselves are still shared through Redis.
+    """
+
+    THROTTLE_STATUSES = frozenset({429, 503})
+
+    def __init__(
+        self,
+        name: str,
+        capacity: int,
+        period_seconds: float,
+        redis_url: str = "",
+        increment: float = 0.05,
+        beta: float = 0.5,
+        min_rate_factor: float = 0.25,
+        max_rate_factor: float = 4.0,
+        **kwargs: Any
+    ):
+        """
+        Initialize the bucket
+
+        Args:
+            name: Bucket name, shared by every process limiting the same quota
+            capacity: Calls allowed per period at the starting rate (and the maximum burst)
+            period_seconds: Length of the quota period, in seconds
+            redis_url: Redis connection URL (empty for a per-process bucket)
+            increment: Additive increase per success, as a fraction of the starting rate
+            beta: Multiplicative decrease applied on each throttling response
+            min_rate_factor: Lowest rate, as a multiple of the starting rate
+            max_rate_factor: Highest rate, as a multiple of the starting rate
+        """
+        super().__init__(name, capacity, period_seconds, redis_url, **kwargs)
+        base_rate = self._rate_per_ms
+        self.increment = base_rate * increment
+        self.beta = beta
+        self.min_rate = base_rate * min_rate_factor
+        self.max_rate = base_rate * max_rate_factor
+
+    @property
+    def rate_per_second(self) -> float:
+        """Current refill rate, in tokens per second"""
+        return self._rate_per_ms * 1000
+
+    def increase_rate(self) -> None:
+        """Raise the refill rate after a successful call"""
+        with self._lock:
+            self._rate_per_ms = min(self.max_rate, self._rate_per_ms + self.increment)
+
+    def decrease_rate(self) -> None:
+        """Cut the refill rate after the platform throttled a call"""
+        with self._lock:
+            self._rate_per_ms = max(self.min_rate, self._rate_per_ms * self.beta)
+        logger.warning(f"Rate limit bucket {self.name} throttled, rate lowered to {self.rate_per_second:.4f}/s")
+
+    def observe(self, status_code: int) -> None:
+        """Adjust the rate from a response status code"""
+        if status_code in self.THROTTLE_STATUSES:
+            self.decrease_rate()
+        elif status_code < 400:
+            self.increase_rate()
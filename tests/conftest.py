@@ -0,0 +1,11 @@
+"""
+Shared test configuration
+
+Settings are validated when config is first imported, so the required
+values are provided here before any test module imports application code.
+"""
+import os
+
+os.environ.setdefault("HUBSPOT_API_KEY", "test-hubspot-key")
+os.environ.setdefault("HUBSPOT_PORTAL_ID", "12345")
+os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
@@ -0,0 +1,188 @@
+"""
+Tests for ad platform conversion batching and event ID deduplication
+
+Uploads go to a mocked HTTP session; the posted bodies are decoded to check
+which conversions were actually sent.
+"""
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+import requests
+
+from models.attribution import LifecycleStage
+from modules import ad_platform_signaling
+from modules.ad_platform_signaling import (
+    AdPlatformSignalingManager,
+    FacebookAdsConnector,
+    GoogleAdsConnector,
+    LinkedInAdsConnector
+)
+from modules.exceptions import APIConnectionError, APIRateLimitError, SyncError
+
+CONVERSION_TIME = datetime(2024, 3, 1, 9, 30, 15)
+
+
+class _FixedDatetime(datetime):
+    """datetime whose utcnow() is CONVERSION_TIME, so conversions land in the same second"""
+
+    @classmethod
+    def utcnow(cls):
+        return CONVERSION_TIME
+
+
+def _mock_session(response_body: bytes) -> MagicMock:
+    session = MagicMock()
+    session.post.return_value = MagicMock(status_code=200, content=response_body)
+    return session
+
+
+def _posted_bodies(session: MagicMock):
+    return [orjson.loads(call.kwargs["data"]) for call in session.post.call_args_list]
+
+
+@pytest.fixture
+def configured(mocker):
+    mocker.patch.multiple(
+        ad_platform_signaling.settings,
+        facebook_access_token="fb-token",
+        facebook_ad_account_id="act_1",
+        linkedin_access_token="li-token",
+        linkedin_ad_account_id="2"
+    )
+
+
+@pytest.fixture
+def manager(configured, mocker):
+    mocker.patch.object(ad_platform_signaling, "get_hubspot_client", return_value=MagicMock())
+    mocker.patch.object(ad_platform_signaling, "datetime", _FixedDatetime)
+    manager = AdPlatformSignalingManager()
+    yield manager
+    manager._pool.shutdown()
+
+
+@pytest.fixture
+def facebook(configured):
+    connector = FacebookAdsConnector()
+    connector._session = _mock_session(b'{"events_received": 2, "messages": []}')
+    return connector
+
+
+@pytest.fixture
+def linkedin(configured):
+    connector = LinkedInAdsConnector()
+    connector._session = _mock_session(b'{}')
+    return connector
+
+
+def _payloads(manager: AdPlatformSignalingManager, contact_id: str):
+    properties = {"email": f"user{contact_id}@example.com", "fbclid": f"fb.{contact_id}"}
+    _, payloads = manager._conversion_payloads(
+        contact_id, properties, LifecycleStage.LEAD, LifecycleStage.MARKETING_QUALIFIED_LEAD
+    )
+    return payloads
+
+
+def test_payload_event_ids_identify_the_contact(manager):
+    first, second = _payloads(manager, "101"), _payloads(manager, "102")
+
+    assert first["facebook_ads"]["event_id"] == f"101_marketingqualifiedlead_{int(CONVERSION_TIME.timestamp())}"
+    assert first["facebook_ads"]["event_id"] != second["facebook_ads"]["event_id"]
+    assert first["linkedin_ads"]["event_id"] != second["linkedin_ads"]["event_id"]
+
+
+def test_facebook_batch_sends_contacts_converting_in_the_same_second(manager, facebook):
+    events = [_payloads(manager, "101")["facebook_ads"], _payloads(manager, "102")["facebook_ads"]]
+
+    result = facebook.send_conversions_batch(events)
+
+    assert result["duplicates_skipped"] == 0
+    sent = _posted_bodies(facebook._session)[0]["data"]
+    assert [event["event_id"] for event in sent] == [event["event_id"] for event in events]
+
+
+def test_linkedin_batch_sends_contacts_converting_in_the_same_second(manager, linkedin):
+    conversions = [_payloads(manager, "101")["linkedin_ads"], _payloads(manager, "102")["linkedin_ads"]]
+
+    result = linkedin.send_conversions_batch(conversions)
+
+    assert result["duplicates_skipped"] == 0
+    sent = _posted_bodies(linkedin._session)[0]["elements"]
+    assert [element["eventId"] for element in sent] == [conv["event_id"] for conv in conversions]
+
+
+def test_facebook_batch_drops_replayed_event_ids(manager, facebook):
+    event = _payloads(manager, "101")["facebook_ads"]
+
+    facebook.send_conversions_batch([event, dict(event)])
+    replay = facebook.send_conversions_batch([dict(event)])
+
+    assert len(_posted_bodies(facebook._session)[0]["data"]) == 1
+    assert replay["duplicates_skipped"] == 1
+    assert facebook._session.post.call_count == 1
+
+
+def test_facebook_batch_never_dedupes_events_without_event_id(facebook):
+    event = {"event_name": "Lead", "event_time": CONVERSION_TIME, "user_data": {"em": "a@example.com"}}
+
+    facebook.send_conversions_batch([event, dict(event, user_data={"em": "b@example.com"})])
+    facebook.send_conversions_batch([dict(event)])
+
+    assert [len(body["data"]) for body in _posted_bodies(facebook._session)] == [2, 1]
+
+
+class _RpcError(Exception):
+    """Stand-in for a failed gRPC call (grpc.RpcError exposes code())"""
+
+    def __init__(self, status_name: str):
+        super().__init__(status_name)
+        self._status = SimpleNamespace(name=status_name)
+
+    def code(self):
+        return self._status
+
+
+@pytest.mark.parametrize("error, expected", [
+    (_RpcError("UNAVAILABLE"), APIConnectionError),
+    (_RpcError("DEADLINE_EXCEEDED"), APIConnectionError),
+    (_RpcError("RESOURCE_EXHAUSTED"), APIRateLimitError),
+    (SimpleNamespace(error=_RpcError("UNAVAILABLE")), APIConnectionError),  # GoogleAdsException wraps the call
+    (_RpcError("INVALID_ARGUMENT"), SyncError),
+    (ValueError("bad gclid"), SyncError),
+])
+def test_google_ads_errors_map_to_retryable_exceptions(error, expected):
+    assert type(ad_platform_signaling._google_ads_error(error)) is expected
+
+
+@pytest.fixture
+def no_backoff(mocker):
+    return mocker.patch.object(ad_platform_signaling.time, "sleep")
+
+
+def test_google_send_conversion_retries_transient_failures_taking_a_token_each_attempt(mocker, no_backoff):
+    acquire = mocker.patch.object(GoogleAdsConnector.RATE_LIMIT, "acquire")
+    connector = GoogleAdsConnector()
+    connector.enabled = True
+    connector._client = MagicMock()
+    connector._token_expires_at = datetime.now() + timedelta(hours=1)
+    upload = connector._client.get_service.return_value.upload_click_conversions
+    upload.side_effect = [_RpcError("UNAVAILABLE"), MagicMock(results=[object()], partial_failure_error=None)]
+
+    result = connector.send_conversion("gclid-1", "customers/1/conversionActions/2", CONVERSION_TIME)
+
+    assert result["success"] is True
+    assert upload.call_count == 2
+    assert acquire.call_count == 2
+
+
+def test_facebook_send_conversion_takes_a_token_on_every_attempt(mocker, facebook, no_backoff):
+    acquire = mocker.patch.object(FacebookAdsConnector.RATE_LIMIT, "acquire")
+    facebook._session.post.side_effect = requests.exceptions.ConnectionError("reset")
+
+    with pytest.raises(APIConnectionError):
+        facebook.send_conversion("Lead", CONVERSION_TIME, {"em": "a@example.com"})
+
+    assert facebook._session.post.call_count == ad_platform_signaling.MAX_SEND_ATTEMPTS
+    assert acquire.call_count == ad_platform_signaling.MAX_SEND_ATTEMPTS
@@ -0,0 +1,74 @@
+"""
+Tests for the attribution credit models
+
+The per-contact methods delegate to the bulk ones, so these check both the
+model shares and that scoring many contacts in one bulk call matches
+scoring them one at a time.
+"""
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from models.attribution import Touchpoint, TouchpointType, UTMParameters
+from modules.crm_attribution import AttributionCalculator
+
+MODELS = ("first_touch", "last_touch", "linear", "w_shaped", "full_path")
+
+
+def _touchpoints(count: int, prefix: str = "tp"):
+    return [
+        Touchpoint(
+            touchpoint_id=f"{prefix}_{i}",
+            contact_id="101",
+            timestamp=datetime(2024, 1, 1, 12, i),
+            touchpoint_type=TouchpointType.PAID_SEARCH,
+            utm_parameters=UTMParameters(utm_source="google")
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("count, model, expected", [
+    (3, "first_touch", {"tp_0": 100.0}),
+    (3, "last_touch", {"tp_2": 100.0}),
+    (4, "linear", {"tp_0": 25.0, "tp_1": 25.0, "tp_2": 25.0, "tp_3": 25.0}),
+    (1, "w_shaped", {"tp_0": 100.0}),
+    (2, "w_shaped", {"tp_0": 50.0, "tp_1": 50.0}),
+    (3, "w_shaped", {"tp_0": 100 / 3, "tp_1": 100 / 3, "tp_2": 100 / 3}),
+    (5, "w_shaped", {"tp_0": 30.0, "tp_1": 5.0, "tp_2": 30.0, "tp_3": 5.0, "tp_4": 30.0}),
+    (4, "full_path", {"tp_0": 25.0, "tp_1": 25.0, "tp_2": 25.0, "tp_3": 25.0}),
+    (6, "full_path", {"tp_0": 22.5, "tp_1": 22.5, "tp_2": 5.0, "tp_3": 22.5, "tp_4": 5.0, "tp_5": 22.5}),
+])
+def test_model_shares(count, model, expected):
+    credits = getattr(AttributionCalculator, model)(_touchpoints(count), 100.0)
+
+    assert credits == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_contacts_without_touchpoints_get_no_credit(model):
+    assert getattr(AttributionCalculator, model)([], 100.0) == {}
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_bulk_scoring_matches_per_contact_scoring(model):
+    counts = list(range(10)) + [3, 0, 17]
+    values = np.array([float(100 + 7 * i) for i in range(len(counts))])
+    contacts = [_touchpoints(count, prefix=f"c{i}") for i, count in enumerate(counts)]
+
+    offsets = AttributionCalculator.bulk_offsets(counts)
+    bulk_credits = getattr(AttributionCalculator, f"{model}_bulk")(offsets, values)
+
+    for i, touchpoints in enumerate(contacts):
+        scalar = getattr(AttributionCalculator, model)(touchpoints, values[i])
+        bulk = bulk_credits[offsets[i]:offsets[i + 1]]
+        assert {tp.touchpoint_id: credit for tp, credit in zip(touchpoints, bulk) if credit} == pytest.approx(scalar)
+        if touchpoints:
+            assert bulk.sum() == pytest.approx(values[i])
+
+
+def test_repeated_touchpoint_ids_add_up():
+    touchpoints = _touchpoints(2) + _touchpoints(1)
+
+    assert AttributionCalculator.linear(touchpoints, 90.0) == pytest.approx({"tp_0": 60.0, "tp_1": 30.0})
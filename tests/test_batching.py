@@ -0,0 +1,97 @@
+"""
+Tests for the async micro-batching queue
+"""
+import asyncio
+
+import pytest
+
+from modules.batching import AsyncMicroBatcher
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submissions_share_one_handler_call():
+    calls = []
+
+    async def handler(items):
+        calls.append(items)
+        return [item * 2 for item in items]
+
+    batcher = AsyncMicroBatcher(handler, max_batch_size=10, max_wait_seconds=0.05)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert results == [0, 2, 4, 6, 8]
+    assert calls == [[0, 1, 2, 3, 4]]
+    await batcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_exception_results_fail_only_their_item():
+    async def handler(items):
+        return [ValueError("bad item") if item == "bad" else item for item in items]
+
+    batcher = AsyncMicroBatcher(handler, max_wait_seconds=0.05)
+
+    good, bad = await asyncio.gather(batcher.submit("good"), batcher.submit("bad"), return_exceptions=True)
+
+    assert good == "good"
+    assert isinstance(bad, ValueError)
+    await batcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_handler_failure_fails_the_whole_batch():
+    async def handler(items):
+        raise ConnectionError("upstream down")
+
+    batcher = AsyncMicroBatcher(handler, max_wait_seconds=0.01)
+
+    with pytest.raises(ConnectionError):
+        await batcher.submit(1)
+    await batcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_batches_run_concurrently():
+    started = []
+    release = asyncio.Event()
+
+    async def handler(items):
+        started.extend(items)
+        await release.wait()
+        return items
+
+    batcher = AsyncMicroBatcher(handler, max_batch_size=1, max_wait_seconds=0, max_concurrent_batches=2)
+    submissions = [asyncio.create_task(batcher.submit(i)) for i in range(3)]
+    await asyncio.sleep(0.05)
+
+    # Two batches are in the handler at once; the third waits for a free slot
+    assert sorted(started) == [0, 1]
+
+    release.set()
+    assert await asyncio.gather(*submissions) == [0, 1, 2]
+    await batcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_finishes_in_flight_batches_and_fails_queued_items():
+    release = asyncio.Event()
+
+    async def handler(items):
+        await release.wait()
+        return items
+
+    batcher = AsyncMicroBatcher(handler, max_batch_size=1, max_wait_seconds=0, max_concurrent_batches=1)
+    in_flight = asyncio.create_task(batcher.submit("first"))
+    queued = [asyncio.create_task(batcher.submit(item)) for item in ("second", "third")]
+    await asyncio.sleep(0.05)
+
+    stopping = asyncio.create_task(batcher.stop())
+    await asyncio.sleep(0.05)
+    release.set()
+    await asyncio.wait_for(stopping, timeout=1)
+
+    assert await in_flight == "first"
+    for submission in queued:
+        with pytest.raises(RuntimeError, match="stopped"):
+            await asyncio.wait_for(submission, timeout=1)
@@ -0,0 +1,35 @@
+"""
+Tests for the bulk insert helpers
+"""
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from database.bulk import insert_touchpoints_returning_ids
+
+
+@pytest.mark.asyncio
+async def test_insert_returning_ids_assigns_ids_client_side_in_one_execute():
+    session = AsyncMock()
+    existing_id = uuid.uuid4()
+    rows = [{"contact_id": 1}, {"contact_id": 2, "id": existing_id}, {"contact_id": 3}]
+
+    ids = await insert_touchpoints_returning_ids(session, rows)
+
+    session.execute.assert_awaited_once()
+    inserted = session.execute.await_args.args[1]
+    assert [row["id"] for row in inserted] == ids
+    assert [row["contact_id"] for row in inserted] == [1, 2, 3]
+    assert ids[1] == existing_id
+    assert len(set(ids)) == 3 and all(isinstance(i, uuid.UUID) and i.version == 4 for i in ids)
+    # The statement is a plain executemany INSERT, with no RETURNING to re-sort
+    assert not session.execute.await_args.args[0]._returning
+
+
+@pytest.mark.asyncio
+async def test_insert_returning_ids_skips_empty_input():
+    session = AsyncMock()
+
+    assert await insert_touchpoints_returning_ids(session, []) == []
+    session.execute.assert_not_awaited()
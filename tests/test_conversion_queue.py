@@ -0,0 +1,133 @@
+"""
+Tests for the durable conversion upload queue and its upload worker
+"""
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from modules.conversion_queue import ConversionQueue, ConversionUploadWorker
+
+CONVERSION_TIME = datetime(2024, 3, 1, 9, 30, 15)
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    return str(tmp_path / "queue" / "conversions.db")
+
+
+@pytest.fixture
+def queue(queue_path):
+    queue = ConversionQueue(queue_path, max_attempts=2, claim_seconds=60)
+    yield queue
+    queue.close()
+
+
+def _enqueue(queue: ConversionQueue, platform: str, count: int) -> None:
+    queue.enqueue([(platform, {"conversion_id": f"c{i}", "conversion_time": CONVERSION_TIME}) for i in range(count)])
+
+
+def test_claim_returns_oldest_unclaimed_conversions_of_the_platform(queue):
+    _enqueue(queue, "linkedin_ads", 3)
+    _enqueue(queue, "google_ads", 1)
+
+    first = queue.claim("linkedin_ads", 2)
+    second = queue.claim("linkedin_ads", 2)
+
+    assert [payload["conversion_id"] for _, payload in first] == ["c0", "c1"]
+    assert first[0][1]["conversion_time"] == CONVERSION_TIME
+    assert [payload["conversion_id"] for _, payload in second] == ["c2"]
+    assert queue.claim("linkedin_ads", 2) == []
+    assert queue.pending_count() == 4
+
+
+def test_complete_removes_conversions(queue):
+    _enqueue(queue, "linkedin_ads", 2)
+    claimed = queue.claim("linkedin_ads", 10)
+
+    queue.complete([queue_id for queue_id, _ in claimed])
+
+    assert queue.pending_count() == 0
+
+
+def test_failed_conversions_are_reclaimed_until_max_attempts(queue):
+    _enqueue(queue, "linkedin_ads", 1)
+
+    for _ in range(queue.max_attempts):
+        claimed = queue.claim("linkedin_ads", 10)
+        assert len(claimed) == 1
+        queue.fail([queue_id for queue_id, _ in claimed])
+
+    assert queue.claim("linkedin_ads", 10) == []
+    assert queue.pending_count() == 0
+
+
+def test_expired_claims_are_reclaimed_by_another_process(queue_path):
+    first = ConversionQueue(queue_path, claim_seconds=0.1)
+    second = ConversionQueue(queue_path, claim_seconds=0.1)
+    _enqueue(first, "linkedin_ads", 1)
+
+    claimed = first.claim("linkedin_ads", 10)
+    assert second.claim("linkedin_ads", 10) == []
+    time.sleep(0.2)
+
+    assert second.claim("linkedin_ads", 10) == claimed
+    first.close()
+    second.close()
+
+
+def test_claims_are_renewed_while_a_send_outlasts_them(queue_path):
+    queue = ConversionQueue(queue_path, claim_seconds=0.3)
+    other_process = ConversionQueue(queue_path, claim_seconds=0.3)
+    _enqueue(queue, "linkedin_ads", 1)
+    reclaimed_during_send = []
+
+    def slow_send(payloads):
+        # Outlast several claim periods, as a rate-limit wait would
+        deadline = time.monotonic() + 1.0
+        while time.monotonic() < deadline:
+            reclaimed_during_send.extend(other_process.claim("linkedin_ads", 10))
+            time.sleep(0.05)
+
+    worker = ConversionUploadWorker(queue, {"linkedin_ads": slow_send})
+
+    assert worker.drain_once() == 1
+    assert reclaimed_during_send == []
+    assert queue.pending_count() == 0
+    queue.close()
+    other_process.close()
+
+
+def test_failed_send_releases_conversions_for_retry(queue):
+    _enqueue(queue, "google_ads", 2)
+
+    def failing_send(payloads):
+        raise RuntimeError("upload failed")
+
+    worker = ConversionUploadWorker(queue, {"google_ads": failing_send})
+
+    assert worker.drain_once() == 0
+    assert len(queue.claim("google_ads", 10)) == 2
+
+
+def test_a_blocked_platform_does_not_stall_the_others(queue):
+    _enqueue(queue, "linkedin_ads", 1)
+    _enqueue(queue, "google_ads", 1)
+    release_linkedin = threading.Event()
+    google_sent = threading.Event()
+
+    worker = ConversionUploadWorker(
+        queue,
+        {
+            "linkedin_ads": lambda payloads: release_linkedin.wait(5),
+            "google_ads": lambda payloads: google_sent.set()
+        },
+        poll_seconds=0.05
+    )
+    worker.start()
+    try:
+        assert google_sent.wait(2)
+    finally:
+        release_linkedin.set()
+        worker.stop()
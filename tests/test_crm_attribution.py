@@ -0,0 +1,82 @@
+"""
+Tests for touchpoint capture into HubSpot custom object records
+
+The HubSpot batch APIs are autospecced from the pinned SDK, so a model class
+or keyword argument that the SDK does not have fails here instead of in
+production.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+from hubspot.crm.associations.v4 import BatchApi as AssociationsBatchApi
+from hubspot.crm.contacts import BatchApi as ContactsBatchApi
+from hubspot.crm.objects import BatchApi as ObjectsBatchApi, BatchInputSimplePublicObjectBatchInputForCreate
+
+from models.attribution import Touchpoint, TouchpointType, UTMParameters
+from modules import crm_attribution
+from modules.crm_attribution import CRMAttributionManager
+
+TOUCHPOINT_OBJECT_TYPE = "2-1234567"
+
+
+@pytest.fixture
+def hubspot(mocker):
+    """HubSpot client whose batch APIs only accept the SDK's real signatures"""
+    client = MagicMock()
+    client.crm.contacts.batch_api = create_autospec(ContactsBatchApi, instance=True)
+    client.crm.objects.batch_api = create_autospec(ObjectsBatchApi, instance=True)
+    client.crm.associations.v4.batch_api = create_autospec(AssociationsBatchApi, instance=True)
+    mocker.patch.object(crm_attribution, "get_hubspot_client", return_value=client)
+    mocker.patch.object(crm_attribution.settings, "hubspot_touchpoint_object_type", TOUCHPOINT_OBJECT_TYPE)
+    return client
+
+
+def _touchpoint(contact_id: str, touchpoint_id: str) -> Touchpoint:
+    return Touchpoint(
+        touchpoint_id=touchpoint_id,
+        contact_id=contact_id,
+        timestamp=datetime(2024, 1, 1, 12, 0),
+        touchpoint_type=TouchpointType.PAID_SEARCH,
+        utm_parameters=UTMParameters(utm_source="google", utm_campaign="spring")
+    )
+
+
+def test_capture_touchpoints_creates_object_records(hubspot):
+    hubspot.crm.contacts.batch_api.read.return_value = SimpleNamespace(results=[
+        SimpleNamespace(id="101", properties={"touchpoint_count": "2", "first_touch_utm_source": "bing"})
+    ])
+    hubspot.crm.objects.batch_api.create.return_value = SimpleNamespace(results=[
+        SimpleNamespace(id="9001", properties={"contact_id": "101"})
+    ])
+
+    results = CRMAttributionManager().capture_touchpoints_batch([("101", _touchpoint("101", "tp_1"))])
+
+    assert results == [None]
+
+    create_kwargs = hubspot.crm.objects.batch_api.create.call_args.kwargs
+    assert create_kwargs["object_type"] == TOUCHPOINT_OBJECT_TYPE
+    batch_input = create_kwargs["batch_input_simple_public_object_batch_input_for_create"]
+    assert isinstance(batch_input, BatchInputSimplePublicObjectBatchInputForCreate)
+    assert [record["properties"]["touchpoint_id"] for record in batch_input.inputs] == ["tp_1"]
+    assert batch_input.inputs[0]["properties"]["contact_id"] == "101"
+
+    association_input = hubspot.crm.associations.v4.batch_api.create_default.call_args.kwargs[
+        "batch_input_public_default_association_multi_post"
+    ]
+    assert association_input.inputs == [{"from": {"id": "9001"}, "to": {"id": "101"}}]
+
+    update_input = hubspot.crm.contacts.batch_api.update.call_args.kwargs["batch_input_simple_public_object_batch_input"]
+    assert update_input.inputs[0]["id"] == "101"
+    assert update_input.inputs[0]["properties"]["touchpoint_count"] == "3"
+    assert "first_touch_utm_source" not in update_input.inputs[0]["properties"]
+
+
+def test_capture_touchpoints_reports_missing_contacts(hubspot):
+    hubspot.crm.contacts.batch_api.read.return_value = SimpleNamespace(results=[])
+
+    results = CRMAttributionManager().capture_touchpoints_batch([("404", _touchpoint("404", "tp_1"))])
+
+    assert isinstance(results[0], crm_attribution.SyncError)
+    hubspot.crm.objects.batch_api.create.assert_not_called()
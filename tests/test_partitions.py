@@ -0,0 +1,83 @@
+"""
+Tests for monthly partition maintenance
+
+The connection is mocked; the tests check which statements are issued and
+that each month runs inside its own savepoint.
+"""
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from database import partitions
+from database.partitions import create_monthly_partitions, maintain_partitions
+
+
+def _connection(existing=(), months_in_default=(), failing=()):
+    """Mocked connection answering the catalog and default-partition probes"""
+    connection = MagicMock()
+    connection.statements = []
+
+    def execute(statement, params=None):
+        sql = str(statement)
+        connection.statements.append(sql)
+        if any(name in sql for name in failing):
+            raise RuntimeError("partition overlaps")
+        result = MagicMock()
+        if "to_regclass" in sql:
+            result.scalar.return_value = params["name"] in existing
+        elif "SELECT EXISTS" in sql:
+            result.scalar.return_value = any(f"'{month}'" in sql for month in months_in_default)
+        elif "min(occurred_at)" in sql:
+            result.scalar.return_value = None
+        return result
+
+    connection.execute.side_effect = execute
+    return connection
+
+
+def test_months_with_default_rows_are_moved_out_before_attaching():
+    connection = _connection(months_in_default=["2024-01-01"])
+
+    created = create_monthly_partitions(connection, "touchpoints", datetime(2024, 1, 1), datetime(2024, 3, 1))
+
+    assert created == ["touchpoints_2024_01", "touchpoints_2024_02"]
+    statements = connection.statements
+    assert any(sql.startswith("CREATE TABLE touchpoints_2024_01 (LIKE touchpoints") for sql in statements)
+    assert any(sql.startswith("INSERT INTO touchpoints_2024_01 SELECT * FROM touchpoints_default") for sql in statements)
+    assert any(sql.startswith("DELETE FROM touchpoints_default WHERE occurred_at >= '2024-01-01'") for sql in statements)
+    assert any(sql.startswith("ALTER TABLE touchpoints ATTACH PARTITION touchpoints_2024_01") for sql in statements)
+    assert any(sql.startswith("CREATE TABLE touchpoints_2024_02 PARTITION OF touchpoints") for sql in statements)
+    assert connection.begin_nested.call_count == 2
+
+
+def test_a_failing_month_does_not_stop_the_others():
+    connection = _connection(failing=["touchpoints_2024_01 PARTITION OF"])
+
+    created = create_monthly_partitions(connection, "touchpoints", datetime(2024, 1, 1), datetime(2024, 3, 1))
+
+    assert created == ["touchpoints_2024_02"]
+
+
+def test_existing_partitions_are_left_alone():
+    connection = _connection(existing=["touchpoints_2024_01"])
+
+    create_monthly_partitions(connection, "touchpoints", datetime(2024, 1, 1), datetime(2024, 2, 1))
+
+    assert not any(sql.startswith(("CREATE", "ALTER")) for sql in connection.statements)
+
+
+def test_maintenance_backfills_from_the_oldest_default_row_and_applies_retention(mocker):
+    class _FixedDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return datetime(2024, 6, 15)
+
+    mocker.patch.object(partitions, "datetime", _FixedDatetime)
+    mocker.patch.object(partitions, "_earliest_default_row", return_value=datetime(2024, 4, 20))
+    create = mocker.patch.object(partitions, "create_monthly_partitions")
+    drop = mocker.patch.object(partitions, "drop_partitions_before")
+
+    maintain_partitions(MagicMock(), months_ahead=1, retention_months=12)
+
+    assert create.call_args_list[0].args[1:] == ("touchpoints", datetime(2024, 4, 1), datetime(2024, 8, 1))
+    assert drop.call_args_list[0].args[1:] == ("touchpoints", datetime(2023, 6, 1))
+    assert [call.args[1] for call in drop.call_args_list] == list(partitions.PARTITIONED_TABLES)